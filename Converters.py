@@ -2,7 +2,7 @@
 Unit Converters Module
 
 This module implements specific converter instances using the base Converter class.
-It provides converters for Temperature, Length, Weight, and Volume units.
+It provides converters for Temperature, Length, Weight, Volume, Area, Time and Speed units.
 
 Each converter is an instance of the Converter class, initialized with a dictionary
 of units and their conversion factors. The conversion factors are specified as
@@ -13,6 +13,10 @@ Available Converters:
     - Length: Convert between length units (meters, feet, inches, etc.)
     - Weight: Convert between weight/mass units (kilograms, pounds, etc.)
     - Volume: Convert between volume units (liters, gallons, etc.)
+    - Area: Convert between area units (square meters, acres, etc.)
+    - Time: Convert between time units (seconds, hours, days, etc.)
+    - Speed: Convert between speed units (m/s, km/h, knots, etc.), built from the
+      Length and Time tables through the compound unit resolver
 
 Example Usage:
     >>> from Converters import Temperature
@@ -21,10 +25,17 @@ Example Usage:
 """
 
 from base_class import Converter
+from compound import CompoundConverter, CompoundResolver
+from registry import UnitRegistry
+import snapshot
+
+# Precompiled unit tables (built with `python snapshot.py`). When the snapshot is
+# missing or stale it is empty, and every converter is built from the literal tables below.
+_snapshot = snapshot.load()
 
 # Temperature converter - Converts between different temperature scales
 # Base unit: Celsius (ºC) with scale factor 1 and offset 0
-Temperature = Converter({
+Temperature = _snapshot.converter("Temperature") or Converter({
     # --- 1. Base Unit & Synonyms ---
     "ºC": (1, 0),  # Base Unit
     "C": (1, 0),  # Synonym
@@ -91,7 +102,7 @@ Temperature = Converter({
 })
 # Length converter - Converts between different units of length/distance
 # Base unit: Meter (m) with scale factor 1 and offset 0
-Length = Converter({
+Length = _snapshot.converter("Length") or Converter({
     # 1. Metric (SI) Units
     "m": (1, 0),  # Base Unit
     "metre": (1, 0),  # Synonym for m
@@ -123,15 +134,15 @@ Length = Converter({
     "qm": (1e30, 0),  # Quecto
 
     # 2. Imperial & US Customary Units
-    "in": (39.3700787, 0),
-    "inch": (39.3700787, 0),  # Synonym for in
-    "ft": (3.2808399, 0),
-    "foot": (3.2808399, 0),  # Synonym for ft
-    "yd": (1.0936133, 0),
-    "yard": (1.0936133, 0),  # Synonym for yd
-    "mi": (0.000621371192, 0),
-    "mile": (0.000621371192, 0),  # Synonym for mi
-    "mil": (39370.0787, 0),
+    "in": (1 / 0.0254, 0),
+    "inch": (1 / 0.0254, 0),  # Synonym for in
+    "ft": (1 / 0.3048, 0),
+    "foot": (1 / 0.3048, 0),  # Synonym for ft
+    "yd": (1 / 0.9144, 0),
+    "yard": (1 / 0.9144, 0),  # Synonym for yd
+    "mi": (1 / 1609.344, 0),
+    "mile": (1 / 1609.344, 0),  # Synonym for mi
+    "mil": (1 / 0.0000254, 0),
     "barleycorn": (3 / 0.0254, 0),
     "line": (12 / 0.0254, 0),
     "fath": (1 / 1.8288, 0),  # Also Nautical
@@ -169,7 +180,7 @@ Length = Converter({
 
     # 4. Astronomical & Physics Units
     "au": (1 / 1.495978707e11, 0),  # Astronomical Unit
-    "ly": (1 / 9.4607e15, 0),  # Light-year
+    "ly": (1 / 9.4607304725808e15, 0),  # Light-year (Julian year)
     "light-ns": (1 / 0.299792458, 0),  # Light-nanosecond
     "pc": (1 / 3.085677581e16, 0),  # Parsec
     "kpc": (1 / 3.085677581e19, 0),  # Kiloparsec
@@ -344,7 +355,7 @@ Length = Converter({
 
 # Weight converter - Converts between different units of weight/mass
 # Base unit: Kilogram (kg) with scale factor 1 and offset 0
-Weight = Converter({
+Weight = _snapshot.converter("Weight") or Converter({
     # --- 1. Base Unit & Synonyms ---
     "kg": (1, 0),  # Kilogram (Base Unit)
     "kilogram": (1, 0),  # Synonym
@@ -471,7 +482,7 @@ Weight = Converter({
 
 # Volume converter - Converts between different units of volume
 # Base unit: Liter (L) with scale factor 1 and offset 0
-Volume = Converter({
+Volume = _snapshot.converter("Volume") or Converter({
     # --- 1. Base & Metric (SI) Units (Liters) ---
     "L": (1, 0),  # Liter (Base Unit)
     "liter": (1, 0),  # Synonym
@@ -692,7 +703,7 @@ Volume = Converter({
 
 # Area converter - Converts between different units of area
 # Base unit: Square Meter with scale factor 1 and offset 0
-Area = Converter({
+Area = _snapshot.converter("Area") or Converter({
     # --- 1. Base Unit & Metric (SI) Units ---
     "m²": (1, 0),  # Square Meter (Base Unit)
     "sq m": (1, 0),  # Synonym
@@ -734,13 +745,13 @@ Area = Converter({
     "yd²": (1 / 0.83612736, 0),  # Square Yard
     "rd²": (1 / 25.2929538, 0),  # Square Rod (Square Perch)
     "perch²": (1 / 25.2929538, 0),  # Square Perch (Synonym)
-    "rood": (1 / 1011.71415, 0),  # Rood (1/4 acre)
-    "acre": (1 / 4046.85642, 0),  # Acre (International)
-    "mi²": (1 / 2589988.11, 0),  # Square Mile
+    "rood": (1 / 1011.7141056, 0),  # Rood (1/4 acre)
+    "acre": (1 / 4046.8564224, 0),  # Acre (International)
+    "mi²": (1 / 2589988.110336, 0),  # Square Mile
     "sq in": (1 / 0.00064516, 0),  # Synonym
     "sq ft": (1 / 0.09290304, 0),  # Synonym
     "sq yd": (1 / 0.83612736, 0),  # Synonym
-    "sq mi": (1 / 2589988.11, 0),  # Synonym
+    "sq mi": (1 / 2589988.110336, 0),  # Synonym
 
     # --- 4. US Surveying ---
     "acre-us": (1 / 4046.87261, 0),  # US Survey Acre
@@ -820,166 +831,89 @@ Area = Converter({
     "circular-mil": (1 / 5.067e-10, 0),  # Circular Mil
 })
 
-# Speed converter - Converts between different units of speed
-# Base unit: Meter per Second with scale factor 1 and offset 0
-Speed = Converter({
-    # --- 1. Base Unit (SI) ---
-    "m/s": (1, 0),  # Meter per Second
-    "mps": (1, 0),  # Synonym
-
-    # --- 2. SI (Metric) System ---
-
-    # Terameter (Tm)
-    "Tm/s": (1e12, 0),
-    "Tm/min": (16666666666.666666, 0),
-    "Tm/h": (277777777.7777778, 0),
-    "Tm/d": (11574074.074074075, 0),
-
-    # Gigameter (Gm)
-    "Gm/s": (1e9, 0),
-    "Gm/min": (16666666.666666668, 0),
-    "Gm/h": (277777.7777777778, 0),
-    "Gm/d": (11574.074074074075, 0),
-
-    # Megameter (Mm)
-    "Mm/s": (1e6, 0),
-    "Mm/min": (16666.666666666668, 0),
-    "Mm/h": (277.7777777777778, 0),
-    "Mm/d": (11.574074074074074, 0),
-
-    # Kilometer (km)
-    "km/s": (1000, 0),
-    "km/min": (16.666666666666668, 0),
-    "km/h": (0.2777777777777778, 0),  # (1000 / 3600)
-    "kph": (0.2777777777777778, 0),  # Synonym
-    "km/d": (0.011574074074074073, 0),
-
-    # Hectometer (hm)
-    "hm/s": (100, 0),
-    "hm/min": (1.6666666666666667, 0),
-    "hm/h": (0.027777777777777776, 0),
-    "hm/d": (0.0011574074074074074, 0),
-
-    # Decameter (dam)
-    "dam/s": (10, 0),
-    "dam/min": (0.16666666666666666, 0),
-    "dam/h": (0.002777777777777778, 0),
-    "dam/d": (0.00011574074074074074, 0),
-
-    # Meter (m)
-    "m/min": (0.016666666666666666, 0),  # (1 / 60)
-    "m/h": (0.0002777777777777778, 0),  # (1 / 3600)
-    "m/d": (1.1574074074074073e-05, 0),  # (1 / 86400)
-
-    # Decimeter (dm)
-    "dm/s": (0.1, 0),
-    "dm/min": (0.0016666666666666668, 0),
-    "dm/h": (2.777777777777778e-05, 0),
-    "dm/d": (1.1574074074074074e-06, 0),
-
-    # Centimeter (cm)
-    "cm/s": (0.01, 0),
-    "cm/min": (0.00016666666666666666, 0),
-    "cm/h": (2.777777777777778e-06, 0),
-    "cm/d": (1.1574074074074074e-07, 0),
-
-    # Millimeter (mm)
-    "mm/s": (1e-3, 0),
-    "mm/min": (1.6666666666666667e-05, 0),
-    "mm/h": (2.777777777777778e-07, 0),
-    "mm/d": (1.1574074074074074e-08, 0),
-
-    # Micrometer (μm or um)
-    "um/s": (1e-6, 0),
-    "um/min": (1.6666666666666667e-08, 0),
-    "um/h": (2.777777777777778e-10, 0),
-    "um/d": (1.1574074074074074e-11, 0),
-    "μm/s": (1e-6, 0),
-    "μm/min": (1.6666666666666667e-08, 0),
-    "μm/h": (2.777777777777778e-10, 0),
-    "μm/d": (1.1574074074074074e-11, 0),
-
-    # Nanometer (nm)
-    "nm/s": (1e-9, 0),
-    "nm/min": (1.6666666666666667e-11, 0),
-    "nm/h": (2.777777777777778e-13, 0),
-    "nm/d": (1.1574074074074074e-14, 0),
-
-    # Picometer (pm)
-    "pm/s": (1e-12, 0),
-    "pm/min": (1.6666666666666667e-14, 0),
-    "pm/h": (2.777777777777778e-16, 0),
-    "pm/d": (1.1574074074074073e-17, 0),
-
-    # --- 3. Imperial & US Customary System ---
-
-    # Miles (mi)
-    "mi/s": (1609.344, 0),
-    "mi/min": (26.8224, 0),
-    "mi/h": (0.44704, 0),  # (1609.344 / 3600)
-    "mph": (0.44704, 0),  # Synonym
-    "mi/d": (0.018626666666666668, 0),
-
-    # Furlong (fur)
-    "fur/s": (201.168, 0),
-    "fur/min": (3.3528, 0),
-    "fur/h": (0.05588, 0),
-    "fur/d": (0.0023283333333333334, 0),
-
-    # Yard (yd)
-    "yd/s": (0.9144, 0),
-    "yd/min": (0.01524, 0),
-    "yd/h": (0.000254, 0),
-    "yd/d": (1.0583333333333334e-05, 0),
-
-    # Foot (ft)
-    "ft/s": (0.3048, 0),
-    "fps": (0.3048, 0),  # Synonym
-    "ft/min": (0.00508, 0),
-    "fpm": (0.00508, 0),  # Synonym
-    "ft/h": (8.466666666666667e-05, 0),
-    "ft/d": (3.527777777777778e-06, 0),
-
-    # Inch (in)
-    "in/s": (0.0254, 0),
-    "ips": (0.0254, 0),  # Synonym
-    "in/min": (0.0004233333333333333, 0),
-    "in/h": (7.055555555555556e-06, 0),
-    "in/d": (2.9398148148148148e-07, 0),
-
-    # --- 4. Nautical & Aviation ---
-    "nmi/s": (1852, 0),
-    "nmi/min": (30.866666666666667, 0),
-    "nmi/h": (0.5144444444444445, 0),  # (1852 / 3600)
-    "knots": (0.5144444444444445, 0),  # Synonym
-    "knot": (0.5144444444444445, 0),  # Synonym
-    "kn": (0.5144444444444445, 0),  # Synonym
-    "nmi/d": (0.021435185185185185, 0),
-
-    # --- 5. Scientific & Astronomical ---
-    "c": (299792458, 0),  # Speed of Light
-    "mach": (343, 0),  # Mach 1 (approx. at sea level)
-
-    # Astronomical Unit (AU)
-    "AU/s": (149597870700, 0),
-    "AU/min": (2493297845.0, 0),
-    "AU/h": (41554964.083333336, 0),
-    "AU/d": (1731456.8368055556, 0),
-    "AU/year": (4740.47036326615, 0),  # (per 365.25 days)
-
-    # Light-year (ly)
-    "ly/s": (9.4607304725808e15, 0),
-    "ly/min": (1.5767884120968e14, 0),
-    "ly/h": (2.627980686828e12, 0),
-    "ly/d": (1.094991952845e11, 0),
-    "ly/year": (299792458.00000006, 0),  # (Effectively 1 * c)
-
-    # Parsec (pc)
-    "pc/s": (3.08567758149137e16, 0),
-    "pc/min": (5.142795969152284e14, 0),
-    "pc/h": (8.571326615253806e12, 0),
-    "pc/d": (3.571386089689086e11, 0),
-    "pc/year": (977792.208107572, 0),  # (per 365.25 days)
+# Time converter - Converts between different units of time
+# Base unit: Second (s) with scale factor 1 and offset 0
+Time = _snapshot.converter("Time") or Converter({
+    "s": (1, 0),  # Second (Base Unit)
+    "sec": (1, 0),  # Synonym
+    "ms": (1e3, 0),  # Millisecond
+    "µs": (1e6, 0),  # Microsecond
+    "ns": (1e9, 0),  # Nanosecond
+    "min": (1 / 60, 0),  # Minute
+    "h": (1 / 3600, 0),  # Hour
+    "hr": (1 / 3600, 0),  # Synonym
+    "d": (1 / 86400, 0),  # Day
+    "day": (1 / 86400, 0),  # Synonym
+    "wk": (1 / 604800, 0),  # Week
+    "week": (1 / 604800, 0),  # Synonym
+    "year": (1 / 31557600, 0),  # Julian Year (365.25 days)
+    "yr": (1 / 31557600, 0),  # Synonym
 })
 
+# Resolver for compound units built from the Length, Weight and Time tables
+# Aliases are (expression, size): one alias unit equals `size` times the expression
+units_resolver = CompoundResolver({"L": Length, "M": Weight, "T": Time}, aliases={
+    # Alternative spellings
+    "AU": ("au", 1),
+    "um": ("µm", 1),
+    "μm": ("µm", 1),  # Greek mu
+    # Derived units
+    "N": ("kg·m/s^2", 1),  # Newton
+    "kgf": ("N", 9.80665),  # Kilogram-force
+    "lbf": ("N", 4.4482216152605),  # Pound-force
+    "J": ("N·m", 1),  # Joule
+    "W": ("J/s", 1),  # Watt
+    # Speed synonyms
+    "mps": ("m/s", 1),
+    "kph": ("km/h", 1),
+    "mph": ("mi/h", 1),
+    "fps": ("ft/s", 1),
+    "fpm": ("ft/min", 1),
+    "ips": ("in/s", 1),
+    "knots": ("nmi/h", 1),
+    "knot": ("nmi/h", 1),
+    "kn": ("nmi/h", 1),
+    "c": ("m/s", 299792458),  # Speed of Light
+    "mach": ("m/s", 343),  # Mach 1 (approx. at sea level)
+})
+_snapshot.warm(units_resolver)
 
+# Speed converter - Converts between different units of speed
+# Base unit: Meter per Second. Factors are resolved from the Length and Time tables,
+# and any other length/time expression (e.g. "ft/wk") is resolved on demand.
+Speed = _snapshot.converter("Speed", units_resolver) or CompoundConverter(units_resolver, [
+    # --- 1. Base Unit (SI) & Synonyms ---
+    "m/s", "mps", "kph", "mph", "fps", "fpm", "ips", "knots", "knot", "kn",
+    # --- 2. Scientific ---
+    "c", "mach",
+] + [
+    # --- 3. Length per second, minute, hour and day ---
+    length + "/" + time
+    for length in (
+        "Tm", "Gm", "Mm", "km", "hm", "dam", "m", "dm", "cm", "mm", "um", "μm", "nm", "pm",  # SI
+        "mi", "fur", "yd", "ft", "in",  # Imperial & US Customary
+        "nmi",  # Nautical & Aviation
+        "AU", "ly", "pc",  # Astronomical
+    )
+    for time in ("s", "min", "h", "d")
+] + [
+    # --- 4. Astronomical per year ---
+    "AU/year", "ly/year", "pc/year",
+])
+
+# Registry of all converters indexed by dimension, used for cross-converter conversions
+# such as registry.convert(1, "acre", "ft^2"). The base is the converter's base unit
+# expressed with the Length, Weight and Time tables.
+registry = _snapshot.registry(units_resolver, {
+    "Temperature": Temperature, "Length": Length, "Weight": Weight, "Volume": Volume, "Area": Area,
+    "Time": Time, "Speed": Speed,
+})
+if registry is None:
+    registry = UnitRegistry(units_resolver)
+    registry.register("Temperature", Temperature)
+    registry.register("Length", Length, base="m")
+    registry.register("Weight", Weight, base="kg")
+    registry.register("Volume", Volume, base="dm^3")
+    registry.register("Area", Area, base="m^2")
+    registry.register("Time", Time, base="s")
+    registry.register("Speed", Speed, base="m/s")
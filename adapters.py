@@ -0,0 +1,159 @@
+"""
+Columnar Adapters Module
+
+This module converts pandas and pyarrow columns with a converter, using one vectorized
+affine operation per column instead of converting values one by one. Indexes, names and
+missing values (NaN, None, pd.NA, Arrow nulls) are preserved.
+
+pandas and pyarrow are optional and only imported by the adapters using them: each
+adapter raises ImportError when the library it needs is not installed.
+
+Example Usage:
+    >>> import pandas as pd
+    >>> from Converters import Temperature
+    >>> from adapters import convert_series
+    >>> convert_series(Temperature, pd.Series([0, 100]), "ºC", "°F").tolist()
+    [32.0, 212.0]
+"""
+
+from importlib import import_module
+
+
+def convert_series(converter, series, origin_unit, final_unit, delta=False):
+    """
+    Convert a pandas Series, keeping its index, name and missing values.
+
+    Args:
+        converter (Converter): The converter defining both units
+        series (pd.Series): The values to convert
+        origin_unit (str): The source unit
+        final_unit (str): The target unit
+        delta (bool): Flag indicating whether this is a delta/interval conversion
+
+    Returns:
+        pd.Series: A new Series with the converted values
+    """
+    _require("pandas")
+    plan = converter.plan(origin_unit, final_unit, delta)
+    return series * plan.scale + plan.offset
+
+
+def convert_frame(converter, frame, columns, origin_unit=None, final_unit=None, delta=False, inplace=False):
+    """
+    Convert selected columns of a pandas DataFrame.
+
+    Args:
+        converter (Converter): The converter defining the units
+        frame (pd.DataFrame): The DataFrame holding the columns
+        columns: Either a list of column names converted from `origin_unit` to
+            `final_unit`, or a dictionary mapping each column name to its own
+            (origin_unit, final_unit) pair.
+        origin_unit (str): The source unit when `columns` is a list
+        final_unit (str): The target unit when `columns` is a list
+        delta (bool): Flag indicating whether this is a delta/interval conversion
+        inplace (bool): Whether to replace the columns of `frame` instead of returning a copy
+
+    Returns:
+        pd.DataFrame: The DataFrame with the converted columns
+    """
+    _require("pandas")
+    units = _column_units(columns, origin_unit, final_unit)
+    if not inplace:
+        frame = frame.copy()
+    for column, (origin, final) in units.items():
+        frame[column] = convert_series(converter, frame[column], origin, final, delta)
+    return frame
+
+
+def convert_unit_column(converter, frame, value_column, unit_column, final_unit, delta=False):
+    """
+    Convert a DataFrame column whose unit is given per row by another column.
+
+    One plan is built per distinct unit, then every row is converted with a single
+    vectorized operation using the per-row scale and offset.
+
+    Args:
+        converter (Converter): The converter defining the units
+        frame (pd.DataFrame): The DataFrame holding both columns
+        value_column (str): The column with the values to convert
+        unit_column (str): The column with the unit of each value
+        final_unit (str): The target unit for every row
+        delta (bool): Flag indicating whether this is a delta/interval conversion
+
+    Returns:
+        pd.Series: The converted values, with the index of `frame`
+
+    Raises:
+        ValueError: If a row has a unit unknown to the converter
+    """
+    _require("pandas")
+    units = frame[unit_column]
+    plans = {unit: converter.plan(unit, final_unit, delta) for unit in units.dropna().unique()}
+    scales = units.map({unit: plan.scale for unit, plan in plans.items()})
+    offsets = units.map({unit: plan.offset for unit, plan in plans.items()})
+    return (frame[value_column] * scales + offsets).rename(value_column)
+
+
+def convert_arrow(converter, values, origin_unit, final_unit, delta=False):
+    """
+    Convert a pyarrow Array or ChunkedArray with Arrow compute kernels, keeping nulls.
+
+    Args:
+        converter (Converter): The converter defining both units
+        values (pa.Array or pa.ChunkedArray): The values to convert
+        origin_unit (str): The source unit
+        final_unit (str): The target unit
+        delta (bool): Flag indicating whether this is a delta/interval conversion
+
+    Returns:
+        A pyarrow array of float64 values with the same chunking
+    """
+    pa, pc = _require("pyarrow"), _require("pyarrow.compute")
+    plan = converter.plan(origin_unit, final_unit, delta)
+    converted = pc.multiply(pc.cast(values, pa.float64()), plan.scale)
+    if plan.offset:
+        converted = pc.add(converted, plan.offset)
+    return converted
+
+
+def convert_table(converter, table, columns, origin_unit=None, final_unit=None, delta=False):
+    """
+    Convert selected columns of a pyarrow Table.
+
+    Accepts `columns` in the same forms as `convert_frame`.
+
+    Returns:
+        pa.Table: A new Table with the converted columns in place of the original ones
+    """
+    pa = _require("pyarrow")
+    for column, (origin, final) in _column_units(columns, origin_unit, final_unit).items():
+        index = table.schema.get_field_index(column)
+        if index < 0:
+            raise KeyError(column)
+        field = table.schema.field(index).with_type(pa.float64())
+        table = table.set_column(index, field, convert_arrow(converter, table.column(index), origin, final, delta))
+    return table
+
+
+def _column_units(columns, origin_unit, final_unit):
+    """
+    Normalize the `columns` argument to a {column: (origin_unit, final_unit)} dictionary.
+    """
+    if isinstance(columns, dict):
+        return columns
+    if origin_unit is None or final_unit is None:
+        raise ValueError("origin_unit and final_unit are required when columns is not a dictionary")
+    return {column: (origin_unit, final_unit) for column in columns}
+
+
+def _require(name):
+    """
+    Import an optional dependency on first use, so importing the adapters doesn't pay for it.
+
+    Raises:
+        ImportError: If the dependency is not installed
+    """
+    try:
+        return import_module(name)
+    except ImportError:
+        raise ImportError(f"{name.partition('.')[0]} is required for this adapter")
@@ -0,0 +1,232 @@
+"""
+Columnar Files Module
+
+This module converts columns of Parquet and Feather (Arrow IPC) files chunk by chunk:
+each Parquet row group or Feather record batch is read, converted with Arrow compute
+kernels (see `adapters.convert_arrow`) and written to the output file before the next
+one is read, so memory stays bounded by the size of a chunk whatever the size of the file.
+
+Converted columns become float64 and record their unit in the field metadata
+(b"unit"); every other column and the schema metadata are kept as they are. The output
+is written to a temporary file renamed over the destination once every chunk is written,
+so a failed conversion never leaves a partial destination behind.
+
+pyarrow is optional and imported on first use: the functions raise ImportError when it
+is not installed.
+
+Run the tool with:
+    python arrow_files.py data.parquet out.parquet --converter Length --columns depth --from ft --to m
+"""
+
+import argparse
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+from adapters import _column_units, _require, convert_arrow
+
+# File extensions of each format
+_FORMATS = {".parquet": "parquet", ".pq": "parquet", ".feather": "feather", ".arrow": "feather", ".ipc": "feather"}
+
+# Field metadata key recording the unit of a converted column
+UNIT_KEY = b"unit"
+
+
+def convert_file(converter, source, destination, columns, origin_unit=None, final_unit=None, delta=False,
+                 workers=None, file_format=None):
+    """
+    Convert columns of a Parquet or Feather file into a new file, one chunk at a time.
+
+    Args:
+        converter (Converter): The converter defining the units
+        source (str): The file to read
+        destination (str): The file to write, in the same format
+        columns: A list of column names converted from `origin_unit` to `final_unit`, or a
+            dictionary mapping each column name to its own (origin_unit, final_unit) pair
+        origin_unit (str): The source unit when `columns` is a list
+        final_unit (str): The target unit when `columns` is a list
+        delta (bool): Flag indicating whether this is a delta/interval conversion
+        workers (int): Number of chunks converted in parallel. Chunks are still written in
+            order, and at most `workers` chunks are held in memory at once.
+        file_format (str): "parquet" or "feather"; guessed from the extension by default
+
+    Returns:
+        int: The number of rows written
+
+    Raises:
+        ValueError: If the format is unknown or a unit is invalid
+        KeyError: If a column is not in the file. Like any other error, it leaves the
+            destination untouched.
+    """
+    pa = _require("pyarrow")
+    units = _column_units(columns, origin_unit, final_unit)
+    file_format = file_format or _FORMATS.get(os.path.splitext(source)[1].lower())
+    if file_format not in ("parquet", "feather"):
+        raise ValueError(f"Unknown file format for '{source}' (expected Parquet or Feather)")
+    for origin, final in set(units.values()):
+        converter.plan(origin, final, delta)  # Fail on invalid units before writing anything
+
+    rows = 0
+    temporary = destination + ".tmp"
+    with _ParquetChunks(source) if file_format == "parquet" else _FeatherChunks(source) as reader:
+        schema = output_schema(reader.schema, units)
+
+        def convert_chunk(index):
+            chunk = reader.read(index)
+            arrays = list(chunk.columns)
+            for column, (origin, final) in units.items():
+                position = chunk.schema.get_field_index(column)
+                arrays[position] = convert_arrow(converter, arrays[position], origin, final, delta)
+            return type(chunk).from_arrays(arrays, schema=schema)
+
+        if file_format == "parquet":
+            writer = _require("pyarrow.parquet").ParquetWriter(temporary, schema)
+        else:
+            writer = pa.ipc.new_file(temporary, schema)
+        chunks = _ordered_map(convert_chunk, range(reader.count), workers)
+        try:
+            try:
+                for chunk in chunks:
+                    if file_format == "parquet":
+                        writer.write_table(chunk)
+                    else:
+                        writer.write_batch(chunk)
+                    rows += chunk.num_rows
+            finally:
+                # Waits for the chunks still running before the reader is closed
+                chunks.close()
+                writer.close()
+        except BaseException:
+            os.remove(temporary)
+            raise
+    os.replace(temporary, destination)
+    return rows
+
+
+def output_schema(schema, units):
+    """
+    Return the schema of converted chunks: converted columns become float64 and record
+    their final unit in their metadata.
+
+    Raises:
+        KeyError: If a column is not in the schema
+    """
+    pa = _require("pyarrow")
+    for column, (_, final) in units.items():
+        index = schema.get_field_index(column)
+        if index < 0:
+            raise KeyError(column)
+        field = schema.field(index)
+        metadata = dict(field.metadata or {})
+        metadata[UNIT_KEY] = final.encode("utf-8")
+        schema = schema.set(index, field.with_type(pa.float64()).with_metadata(metadata))
+    return schema
+
+
+class _ParquetChunks:
+    """
+    Row groups of a Parquet file. Each thread reads through its own file handle, and
+    every handle is closed by `close` (or on leaving a `with` block).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._files = []
+        file = self._file()
+        self.schema = file.schema_arrow
+        self.count = file.num_row_groups
+
+    def _file(self):
+        file = getattr(self._local, "file", None)
+        if file is None:
+            file = self._local.file = _require("pyarrow.parquet").ParquetFile(self.path)
+            self._files.append(file)
+        return file
+
+    def read(self, index):
+        return self._file().read_row_group(index)
+
+    def close(self):
+        for file in self._files:
+            file.close()
+        self._files = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _FeatherChunks:
+    """
+    Record batches of a Feather (Arrow IPC) file, memory-mapped so a batch is only paged
+    in when it is read.
+    """
+
+    def __init__(self, path):
+        pa = _require("pyarrow")
+        self._source = pa.memory_map(path, "r")
+        try:
+            self._reader = pa.ipc.open_file(self._source)
+        except BaseException:
+            self._source.close()
+            raise
+        self.schema = self._reader.schema
+        self.count = self._reader.num_record_batches
+
+    def read(self, index):
+        return self._reader.get_batch(index)
+
+    def close(self):
+        self._source.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+def _ordered_map(function, items, workers):
+    """
+    Yield `function(item)` in order, running at most `workers` calls ahead on a thread pool.
+    """
+    if not workers or workers <= 1:
+        for item in items:
+            yield function(item)
+        return
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        pending = deque()
+        for item in items:
+            if len(pending) >= workers:
+                yield pending.popleft().result()
+            pending.append(executor.submit(function, item))
+        while pending:
+            yield pending.popleft().result()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert columns of a Parquet or Feather file chunk by chunk")
+    parser.add_argument("source", help="File to read")
+    parser.add_argument("destination", help="File to write")
+    parser.add_argument("--converter", required=True, help="Name of the converter (e.g. Length)")
+    parser.add_argument("--columns", required=True, help="Comma-separated names of the columns to convert")
+    parser.add_argument("--from", dest="origin_unit", required=True, help="Unit of the columns")
+    parser.add_argument("--to", dest="final_unit", required=True, help="Target unit")
+    parser.add_argument("--delta", action="store_true", help="Convert deltas/intervals")
+    parser.add_argument("--workers", type=int, default=None, help="Chunks converted in parallel")
+    arguments = parser.parse_args()
+
+    from Converters import registry
+
+    rows = convert_file(registry.converters[arguments.converter], arguments.source, arguments.destination,
+                        arguments.columns.split(","), arguments.origin_unit, arguments.final_unit,
+                        arguments.delta, arguments.workers)
+    print(f"{rows} rows written to {arguments.destination}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,51 @@
 from numbers import Number
 from typing import Union, Tuple, Dict, List
 from collections.abc import Iterable, MutableMapping,MutableSequence,MutableSet
+from types import MappingProxyType
+from array import array
+from itertools import islice
+import operator
+import sys
+
+import tables
+from memo import ResultCache
+from nested import TraversalPlan, compile_paths, convert_leaves
+
+# NumPy is optional, only needed for vectorized array conversions. Importing it takes
+# longer than importing all the converters, so it is only imported by the paths using it.
+np = None
+
+
+def _numpy():
+    """
+    Return the NumPy module, imported on first use, or None if it is not installed.
+    """
+    global np
+    if np is None:
+        try:
+            import numpy
+        except ImportError:
+            return None
+        np = numpy
+    return np
+
+
+def _is_array(value):
+    """
+    Return True if `value` is a NumPy array, without importing NumPy: no array can exist
+    before something else imported it.
+    """
+    numpy = sys.modules.get("numpy")
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+# Aggregates supported by `Converter.reduce`
+REDUCE_OPS = ("count", "sum", "mean", "min", "max", "var", "std")
+
+# Comparisons supported by `Converter.mask` and `Converter.filter`, and their mirror
+# images, used when a negative scale reverses the order of the values
+_COMPARISONS = {"<": operator.lt, "<=": operator.le, ">": operator.gt, ">=": operator.ge,
+                "==": operator.eq, "!=": operator.ne}
+_FLIPPED = {"<": ">", "<=": ">=", ">": "<", ">=": "<=", "==": "==", "!=": "!="}
 
 
 class Converter:
@@ -14,8 +59,12 @@ class Converter:
     Attributes:
         units (Dict[str, Tuple[Number, Number]]): Dictionary of unit symbols mapped to 
             their conversion factors as (scale_factor, offset) tuples.
+        memo (ResultCache): Cache of scalar results, None unless `enable_memo` was called.
     """
-    
+
+    # No instance dictionary: the cached plans and results live in slots as well
+    __slots__ = ("units", "_plans", "memo")
+
     def __init__(self, units: Dict[str, Union[Number, Tuple[Number, Number], List[Number]]]):
         """
         Initialize a Converter with a dictionary of units and their conversion factors.
@@ -38,18 +87,32 @@ class Converter:
             For units with different zero points (like temperature), offset is non-zero.
         """
         self.units = units
+        self._normalize(self.units)
+
+        # Cache of ConversionPlan objects indexed by (origin_unit, final_unit, delta)
+        self._plans = {}
+        self.memo = None
+
+    @staticmethod
+    def _normalize(units):
+        """
+        Normalize, in place, every value of a units dictionary to a (scale_factor, offset) tuple.
 
-        # Iterate over the keys and values in the `self.units` dictionary
-        for unit, value in self.units.items():
+        Raises:
+            ValueError: If a list or tuple value doesn't contain exactly two numbers
+            TypeError: If a value is not a number, list of two numbers, or tuple of two numbers
+        """
+        # Iterate over the keys and values in the `units` dictionary
+        for unit, value in units.items():
             # Check if the value is a single number
             if isinstance(value, Number):
                 # If it's a number, convert it to a tuple (value, 1)
-                self.units[unit] = (value, 1)
+                units[unit] = (value, 1)
             # Check if the value is a list with exactly two numbers
             elif isinstance(value, list):
                 if len(value) == 2 and all(isinstance(i, Number) for i in value):
                     # Convert the list to a tuple
-                    self.units[unit] = tuple(value)
+                    units[unit] = tuple(value)
                 else:
                     raise ValueError(f"The value for '{unit}' must be a list with exactly two numbers.")
             # Check if the value is already a tuple with exactly two numbers
@@ -61,10 +124,115 @@ class Converter:
             else:
                 raise TypeError(f"The value for '{unit}' must be a valid number, list of two numbers, or a tuple of two numbers.")
 
-    def convert(self, value, origin_unit, final_unit, delta=False, inplace=False):
+    @classmethod
+    def _from_normalized(cls, units):
+        """
+        Build a converter from a units dictionary that is already normalized to
+        (scale_factor, offset) tuples, skipping the validation done by `__init__`.
+        """
+        converter = cls.__new__(cls)
+        converter.units = units
+        converter._plans = {}
+        converter.memo = None
+        return converter
+
+    @classmethod
+    def from_file(cls, path):
+        """
+        Create a converter from a JSON or TOML unit table file (see `tables.py`).
+
+        Raises:
+            ValueError: If the file is malformed, has duplicated keys, invalid values
+                or conflicting aliases
+        """
+        units, aliases = tables.split_table(tables.read(path))
+        return cls._from_normalized(tables.normalize(units, aliases))
+
+    def merge(self, units, aliases=None, replace=False):
+        """
+        Add units to this converter without rebuilding it.
+
+        Args:
+            units: Dictionary of unit values (any format accepted by `__init__`), or the
+                path of a JSON or TOML table file
+            aliases: Dictionary mapping alias names to existing or merged units
+            replace: Whether units already defined with a different value are replaced.
+                When False, such conflicts raise ValueError and nothing is merged.
+
+        Returns:
+            The list of units added or replaced
+
+        Raises:
+            ValueError: If values are invalid, or aliases or units conflict
+        """
+        if not isinstance(units, MutableMapping):
+            units, file_aliases = tables.split_table(tables.read(units))
+            aliases = dict(file_aliases, **(aliases or {}))
+        current = self.units
+        normalized = tables.normalize(units, aliases, known=current)
+        changed = [unit for unit, value in normalized.items() if unit in current and current[unit] != value]
+        if changed and not replace:
+            raise ValueError(f"Units already defined with a different value: {', '.join(changed)}")
+        added = [unit for unit in normalized if unit not in current]
+        table = current.copy()
+        table.update(normalized)
+        self._swap_units(table, changed)
+        return added + changed
+
+    def reload(self, units, aliases=None):
+        """
+        Replace the whole unit table atomically, keeping the cached plans of unchanged units.
+
+        The new table is validated and built aside, then published with a single reference
+        swap, so conversions running meanwhile finish with the table they started with and
+        never see a half-updated one.
+
+        Args:
+            units: Dictionary of unit values (any format accepted by `__init__`), or the
+                path of a JSON or TOML table file
+            aliases: Dictionary mapping alias names to units of the new table
+
+        Returns:
+            The list of units whose value changed or that were removed
+
+        Raises:
+            ValueError: If values are invalid or aliases conflict. The current table is kept.
+        """
+        if not isinstance(units, MutableMapping):
+            units, file_aliases = tables.split_table(tables.read(units))
+            aliases = dict(file_aliases, **(aliases or {}))
+        table = tables.normalize(units, aliases)
+        changed = [unit for unit, value in self.units.items() if table.get(unit) != value]
+        self._swap_units(table, changed)
+        return changed
+
+    def _swap_units(self, table, changed):
+        """
+        Publish a new unit table, dropping the cached plans and results of changed units.
+
+        Readers take `_plans` before `units` (see `plan`), so a plan built from the old
+        table can only be stored in a dictionary that is discarded or filtered here.
+        """
+        plans = self._plans
+        self._plans = {}
+        self.units = table
+        changed = set(changed)
+        self._plans = {key: plan for key, plan in plans.copy().items()
+                       if key[0] not in changed and key[1] not in changed}
+        memo = self.memo
+        if changed and memo is not None:
+            # Results of running conversions land in the discarded cache
+            object.__setattr__(self, "memo", ResultCache(memo.maxsize, memo.ttl))
+
+    def convert(self, value, origin_unit, final_unit, delta=False, inplace=False, dtype=None):
         """
             Converts a value or collection (number, string, dict, list, iterable) from one unit to another, optionally as a delta or in place; raises TypeError for unsupported types or invalid strings.
+            `dtype="float32"` converts NumPy arrays in single precision (see `error_bound`).
             """
+        if dtype is not None and not _is_array(value):
+            raise TypeError("dtype is only supported for NumPy arrays")
+        if self.memo is not None and isinstance(value, (int, float, str)) and not isinstance(value, bool):
+            return self._memo_convertion(value, origin_unit, final_unit, delta)
         if isinstance(value,str):
             try:
                 value=float(value)
@@ -72,6 +240,8 @@ class Converter:
                 raise TypeError("type not supported")
         if isinstance(value, Number):
             return self._single_convertion(value, origin_unit, final_unit, delta)
+        elif _is_array(value):
+            return self._array_convertion(value, origin_unit, final_unit, delta, inplace, dtype)
         elif isinstance(value, MutableMapping):
             return self._dict_convertion(value, origin_unit, final_unit, delta,inplace)
         elif isinstance(value, MutableSequence):
@@ -81,12 +251,675 @@ class Converter:
         else:
             raise TypeError("type not supported")
 
+    def enable_memo(self, maxsize=1024, ttl=None):
+        """
+        Put a bounded cache of results in front of `convert` for scalar values.
+
+        Repeated conversions of the same (value, origin_unit, final_unit, delta) are
+        answered from the cache, without parsing or arithmetic. Numeric strings are
+        normalized first, so "25" and 25.0 share an entry.
+
+        Args:
+            maxsize: Maximum number of cached results (least recently used are evicted)
+            ttl: Lifetime of a cached result in seconds, or None for no expiration
+
+        Returns:
+            ResultCache: The cache, whose `stats()` reports hits, misses and evictions
+        """
+        # The cache doesn't change conversion results, so it is allowed on frozen converters too
+        object.__setattr__(self, "memo", ResultCache(maxsize, ttl))
+        return self.memo
+
+    def disable_memo(self):
+        """
+        Remove the cache of results enabled by `enable_memo`.
+        """
+        object.__setattr__(self, "memo", None)
+
+    def _memo_convertion(self, value, origin_unit, final_unit, delta):
+        """
+        Converts a scalar value through the results cache.
+        """
+        memo = self.memo
+        if isinstance(value, str):
+            try:
+                value = float(value)
+            except ValueError:
+                raise TypeError("type not supported")
+        if value != value or memo is None:  # NaN can't be used as a key
+            return self._single_convertion(value, origin_unit, final_unit, delta)
+        key = (float(value), origin_unit, final_unit, bool(delta))
+        result = memo.get(key)
+        if result is None:
+            result = self._single_convertion(value, origin_unit, final_unit, delta)
+            memo.put(key, result)
+        return result
+
+    def convert_batch(self, values, origin_unit, final_unit, delta=False, errors="raise"):
+        """
+        Convert a batch of values that may contain gaps, returning a validity mask.
+
+        Gaps (None and NaN) never stop the conversion: they are kept as they are in the
+        result and marked as invalid. Values that are not numbers (or numeric strings)
+        are handled according to `errors`.
+
+        Args:
+            values: A sequence, a NumPy array or a NumPy masked array
+            origin_unit: The source unit
+            final_unit: The target unit
+            delta: Flag indicating whether this is a delta/interval conversion
+            errors: "raise" to raise TypeError on the first invalid value, "coerce" to
+                replace invalid values with NaN, or "skip" to drop gaps and invalid
+                values from the result
+
+        Returns:
+            A tuple (converted, valid) where `valid` has one boolean per input value,
+            True when the value was converted to a number. NumPy input returns NumPy
+            arrays, and masked arrays keep their mask.
+
+        Raises:
+            ValueError: If a unit is invalid or `errors` is not a valid option
+            TypeError: If `errors` is "raise" and a value is not a number
+        """
+        if errors not in ("raise", "coerce", "skip"):
+            raise ValueError(f"Invalid errors option: {errors}")
+        plan = self.plan(origin_unit, final_unit, delta)
+        if _is_array(values) and values.dtype.kind in "biuf":
+            return self._array_batch_convertion(values, plan, errors)
+
+        scale, offset = plan.scale, plan.offset
+        converted, valid = [], []
+        for value in values:
+            if value is None:
+                result = None
+            else:
+                try:
+                    # Numbers whose arithmetic with floats fails (e.g. Decimal) are invalid too
+                    result = (value if isinstance(value, Number) else float(value)) * scale + offset
+                except (TypeError, ValueError):
+                    if errors == "raise":
+                        raise TypeError(f"type not supported: {value!r}")
+                    result = float("nan")
+            # NaN is the only value not equal to itself
+            is_valid = result is not None and result == result
+            if is_valid or errors != "skip":
+                converted.append(result)
+            valid.append(is_valid)
+        if _is_array(values):
+            np = _numpy()
+            return np.array(converted), np.array(valid, dtype=bool)
+        return converted, valid
+
+    @staticmethod
+    def _array_batch_convertion(values, plan, errors):
+        """
+        Converts a numeric NumPy array (masked or not) in a single vectorized operation.
+        Numeric arrays can only contain NaN gaps, so `errors` only matters for "skip".
+        """
+        np = _numpy()
+        converted = values * plan.scale + plan.offset
+        valid = ~np.isnan(np.ma.getdata(converted))
+        if np.ma.isMaskedArray(values):
+            valid &= ~np.ma.getmaskarray(values)
+        if errors == "skip":
+            converted = np.ma.getdata(converted)[valid]
+        return converted, valid
+
+    def convert_to_all(self, values, origin_unit, targets=None, delta=False, as_array=False):
+        """
+        Convert a value or a batch of values to many units in a single pass.
+
+        The values are brought to the base unit once, then every target scale and offset
+        is applied, as one vectorized outer operation when NumPy is available.
+
+        Args:
+            values: A number, a numeric string, or a sequence or NumPy array of numbers
+            origin_unit: The unit of the values
+            targets: The target units, in order. Defaults to every unit of the converter.
+            delta: Flag indicating whether this is a delta/interval conversion
+            as_array: Return a NumPy array whose last axis follows `targets` instead of a
+                dictionary (requires NumPy)
+
+        Returns:
+            A dictionary mapping each target unit to the converted value, or to the converted
+            batch (a list, or an array for NumPy input), or an array if `as_array` is True
+
+        Raises:
+            ValueError: If a unit is not in the units dictionary
+            TypeError: If the values are not numbers
+            ImportError: If `as_array` is True and NumPy is not installed
+        """
+        units = self.units
+        targets = list(units) if targets is None else list(targets)
+        invalid = [unit for unit in [origin_unit] + targets if unit not in units]
+        if invalid:
+            raise ValueError(f"Invalid units: {', '.join(map(str, invalid))}")
+        np = _numpy() if as_array or not isinstance(values, (Number, str)) else None
+        if as_array and np is None:
+            raise ImportError("NumPy is required for as_array=True")
+        origin_scale, origin_offset = units[origin_unit]
+        if delta:
+            origin_offset = 0
+        scales = [units[unit][0] for unit in targets]
+        offsets = [0 if delta else units[unit][1] for unit in targets]
+
+        if isinstance(values, str):
+            try:
+                values = float(values)
+            except ValueError:
+                raise TypeError("type not supported")
+        if isinstance(values, Number):
+            base_value = (values - origin_offset) / origin_scale
+            row = [base_value * scale + offset for scale, offset in zip(scales, offsets)]
+            return np.array(row) if as_array else dict(zip(targets, row))
+        if not isinstance(values, Iterable):
+            raise TypeError("type not supported")
+
+        if np is not None:
+            is_array = isinstance(values, np.ndarray)
+            base_values = (np.asarray(values, dtype=np.float64) - origin_offset) / origin_scale
+            result = np.multiply.outer(base_values, np.array(scales, dtype=np.float64))
+            result += np.array(offsets, dtype=np.float64)
+            if as_array:
+                return result
+            return {unit: result[..., index] if is_array else result[..., index].tolist()
+                    for index, unit in enumerate(targets)}
+        base_values = []
+        for value in values:
+            if not isinstance(value, Number):
+                raise TypeError("type not supported")
+            base_values.append((value - origin_offset) / origin_scale)
+        return {unit: [base_value * scale + offset for base_value in base_values]
+                for unit, scale, offset in zip(targets, scales, offsets)}
+
+    def reduce(self, values, origin_unit, final_unit, ops=("sum", "mean", "min", "max", "std"), delta=False,
+               ddof=0):
+        """
+        Aggregate values in another unit without converting them one by one.
+
+        Conversions are affine (`y = x * scale + offset`), so the aggregates of the
+        converted values follow from the aggregates in the source unit: the values are
+        scanned once in `origin_unit` (Welford's algorithm for the variance), and only the
+        results are converted. A negative scale (e.g. to ºD or ºLi) swaps min and max.
+
+        Args:
+            values: An iterable of numbers (a generator is consumed once) or a NumPy array
+            origin_unit: The unit of the values
+            final_unit: The unit of the results
+            ops: The aggregates to compute, among "count", "sum", "mean", "min", "max",
+                "var" and "std"
+            delta: Flag indicating whether the values are deltas/intervals
+            ddof: Delta degrees of freedom of "var" and "std" (1 for the sample variance)
+
+        Returns:
+            A dictionary mapping each op to its result. Without values, "count" and "sum"
+            are 0 and the other aggregates are NaN.
+
+        Raises:
+            ValueError: If a unit or an op is invalid
+            TypeError: If a value is not a number
+        """
+        invalid = [op for op in ops if op not in REDUCE_OPS]
+        if invalid:
+            raise ValueError(f"Invalid ops: {', '.join(map(str, invalid))}")
+        plan = self.plan(origin_unit, final_unit, delta)
+        if isinstance(values, Number):
+            values = (values,)
+        if _is_array(values) and values.dtype.kind in "biuf":
+            count, total, mean, m2, low, high = self._array_moments(values, ops)
+        elif isinstance(values, Iterable) and not isinstance(values, str):
+            count, total, mean, m2, low, high = self._moments(values)
+        else:
+            raise TypeError("type not supported")
+
+        scale, offset = plan.scale, plan.offset
+        nan = float("nan")
+        if scale < 0:
+            low, high = high, low
+        variance = m2 / (count - ddof) * scale * scale if count > ddof else nan
+        results = {
+            "count": count,
+            "sum": total * scale + count * offset,
+            "mean": mean * scale + offset if count else nan,
+            # NumPy input only computes the range when "min" or "max" is requested
+            "min": low * scale + offset if low is not None else nan,
+            "max": high * scale + offset if high is not None else nan,
+            "var": variance,
+            "std": variance ** 0.5,
+        }
+        return {op: results[op] for op in ops}
+
+    @staticmethod
+    def _moments(values):
+        """
+        Return (count, sum, mean, sum of squared deviations, min, max) of numbers in one pass.
+        """
+        count, total, mean, m2 = 0, 0, 0.0, 0.0
+        low = high = None
+        for value in values:
+            if not isinstance(value, Number) or isinstance(value, bool):
+                raise TypeError(f"type not supported: {value!r}")
+            count += 1
+            total += value
+            difference = value - mean
+            mean += difference / count
+            m2 += difference * (value - mean)
+            if low is None:
+                low = high = value
+            elif value < low:
+                low = value
+            elif value > high:
+                high = value
+        return count, total, mean, m2, low, high
+
+    @staticmethod
+    def _array_moments(values, ops):
+        """
+        Return the same moments as `_moments` for a numeric NumPy array, computing only
+        the reductions the ops need.
+        """
+        np = _numpy()
+        count = values.size
+        if not count:
+            return 0, 0, 0.0, 0.0, None, None
+        values = values.astype(np.float64, copy=False)
+        total = float(values.sum())
+        mean = total / count
+        m2 = float(values.var()) * count if "var" in ops or "std" in ops else 0.0
+        needs_range = "min" in ops or "max" in ops
+        low = float(values.min()) if needs_range else None
+        high = float(values.max()) if needs_range else None
+        return count, total, mean, m2, low, high
+
+    def mask(self, values, origin_unit, op, threshold, threshold_unit=None, delta=False):
+        """
+        Compare values with a threshold given in another unit, without converting the values.
+
+        The threshold is converted once to `origin_unit` and the values are compared in
+        their own unit. Since the conversion is affine, `convert(x) > t` is `x > t'` where
+        `t'` is the threshold in the unit of the values; a negative scale (e.g. between ºC
+        and ºD) reverses the order, so the comparison is flipped. Values within a rounding
+        error of the threshold may compare differently than after converting them.
+
+        Args:
+            values: An iterable of numbers or a NumPy array
+            origin_unit: The unit of the values
+            op: One of "<", "<=", ">", ">=", "==" and "!="
+            threshold: The number the values are compared with
+            threshold_unit: The unit of the threshold (defaults to `origin_unit`)
+            delta: Flag indicating whether the values and the threshold are deltas/intervals
+
+        Returns:
+            A list of booleans, or a boolean NumPy array for NumPy input
+
+        Raises:
+            ValueError: If a unit or the comparison is invalid
+            TypeError: If the threshold or a value is not a number
+        """
+        compare, threshold = self._pushdown(origin_unit, op, threshold, threshold_unit, delta)
+        if _is_array(values):
+            return compare(values, threshold)
+        if not isinstance(values, Iterable) or isinstance(values, str):
+            raise TypeError("type not supported")
+        result = []
+        for value in values:
+            if not isinstance(value, Number):
+                raise TypeError(f"type not supported: {value!r}")
+            result.append(compare(value, threshold))
+        return result
+
+    def filter(self, values, origin_unit, op, threshold, threshold_unit=None, delta=False):
+        """
+        Return the values whose comparison with a threshold in another unit is true.
+
+        The values are kept in `origin_unit` and in order; see `mask` for the comparison.
+
+        Returns:
+            A list, or a NumPy array for NumPy input
+
+        Raises:
+            ValueError: If a unit or the comparison is invalid
+            TypeError: If the threshold or a value is not a number
+        """
+        compare, threshold = self._pushdown(origin_unit, op, threshold, threshold_unit, delta)
+        if _is_array(values):
+            return values[compare(values, threshold)]
+        if not isinstance(values, Iterable) or isinstance(values, str):
+            raise TypeError("type not supported")
+        result = []
+        for value in values:
+            if not isinstance(value, Number):
+                raise TypeError(f"type not supported: {value!r}")
+            if compare(value, threshold):
+                result.append(value)
+        return result
+
+    def _pushdown(self, origin_unit, op, threshold, threshold_unit, delta):
+        """
+        Return the comparison function and the threshold converted to `origin_unit`.
+        """
+        try:
+            compare = _COMPARISONS[op]
+        except (KeyError, TypeError):
+            raise ValueError(f"Invalid comparison: {op}")
+        if not isinstance(threshold, Number):
+            raise TypeError(f"type not supported: {threshold!r}")
+        plan = self.plan(origin_unit if threshold_unit is None else threshold_unit, origin_unit, delta)
+        if plan.scale < 0:
+            compare = _COMPARISONS[_FLIPPED[op]]
+        return compare, plan(threshold)
+
+    def convert_frame(self, frame):
+        """
+        Convert the values of a decoded wire frame (see `wire.py`).
+
+        The payload is read in place from the frame buffer: with NumPy it is viewed as an
+        array and converted with one vectorized operation, keeping its float64 or float32
+        type; otherwise the result is an `array` of the same type.
+
+        Args:
+            frame (wire.Frame): The decoded request, whose unit ids refer to this converter
+
+        Returns:
+            The converted values, as a NumPy array or an `array.array`
+
+        Raises:
+            ValueError: If the unit ids are not valid for this converter
+        """
+        origin_unit, final_unit = frame.units(self)
+        np = _numpy()
+        if np is not None:
+            values = np.frombuffer(frame.values, dtype=frame.dtype)
+            dtype = frame.dtype if frame.dtype == "float32" else None
+            return self._array_convertion(values, origin_unit, final_unit, frame.delta, False, dtype)
+        plan = self.plan(origin_unit, final_unit, frame.delta)
+        return array(frame.values.format, map(plan, frame.values))
+
+    def convert_nested(self, value, origin_unit, final_unit, paths=None, delta=False, inplace=False):
+        """
+        Convert values inside nested dictionaries and lists (e.g. a parsed JSON payload).
+
+        Args:
+            value: The nested document
+            origin_unit: The source unit
+            final_unit: The target unit
+            paths: JSONPath-like selectors (e.g. "$.readings[*].value"), a single selector
+                or a TraversalPlan from `nested.compile_paths`. Selectors are compiled once
+                and cached. When None, every number of the document is converted.
+            delta: Flag indicating whether this is a delta/interval conversion
+            inplace: Whether to update the document instead of returning a converted copy
+
+        Returns:
+            The converted document. Selected values are converted with `convert`, so a
+            selector can also point to a list or a flat dictionary of values.
+        """
+        def convert_value(leaf, leaf_inplace):
+            return self.convert(leaf, origin_unit, final_unit, delta, leaf_inplace)
+
+        if paths is None:
+            return convert_leaves(value, convert_value, inplace)
+        plan = paths if isinstance(paths, TraversalPlan) else compile_paths(paths)
+        return plan.apply(value, convert_value, inplace)
+
+    async def aconvert(self, value, origin_unit, final_unit, delta=False, inplace=False, chunk_size=10000,
+                       executor=None):
+        """
+        Asynchronous version of `convert` that doesn't block the event loop on large collections.
+
+        Collections are converted in chunks of `chunk_size` values, yielding to the event
+        loop between chunks. NumPy arrays, and every collection when an `executor` is given,
+        are converted on an executor thread instead. Accepts the same values and options as
+        `convert` (including `delta` and `inplace`) and returns the same results.
+        """
+        import asyncio  # Only imported by the asynchronous API, asyncio is slow to import
+
+        if executor is not None or _is_array(value):
+            # get_running_loop is new in Python 3.7; get_event_loop returns the running loop too
+            loop = getattr(asyncio, "get_running_loop", asyncio.get_event_loop)()
+            return await loop.run_in_executor(
+                executor, lambda: self.convert(value, origin_unit, final_unit, delta, inplace))
+        if isinstance(value, (str, Number)):
+            return self.convert(value, origin_unit, final_unit, delta, inplace)
+        elif isinstance(value, MutableMapping):
+            items = list(value.items())
+            converted = await self._aconvert_chunks([val for _, val in items], origin_unit, final_unit, delta,
+                                                    chunk_size)
+            converted_dict = {key: val for (key, _), val in zip(items, converted)}
+            if inplace:
+                value.update(converted_dict)
+                return value
+            return converted_dict
+        elif isinstance(value, MutableSequence):
+            converted = await self._aconvert_chunks(value, origin_unit, final_unit, delta, chunk_size)
+            if inplace:
+                value[:] = converted
+                return value
+            return converted
+        elif isinstance(value, Iterable):
+            converted = await self._aconvert_chunks(list(value), origin_unit, final_unit, delta, chunk_size)
+            return type(value)(converted)
+        else:
+            raise TypeError("type not supported")
+
+    async def aiconvert(self, values, origin_unit, final_unit, delta=False):
+        """
+        Lazily convert every item of an async iterable, yielding the converted items.
+
+        Each item is converted with `convert`, so it can be a single value or a collection.
+        """
+        async for value in values:
+            yield self.convert(value, origin_unit, final_unit, delta)
+
+    async def _aconvert_chunks(self, values, origin_unit, final_unit, delta, chunk_size):
+        """
+        Converts an iterable chunk by chunk, yielding to the event loop after each chunk.
+        """
+        import asyncio
+
+        converted_values = []
+        units = self.units
+        # Chunks are taken from an iterator, since sequences such as deque can't be sliced
+        values = iter(values)
+        while True:
+            chunk = [self._single_convertion(val, origin_unit, final_unit, delta, units)
+                     for val in islice(values, chunk_size)]
+            if not chunk:
+                return converted_values
+            converted_values.extend(chunk)
+            await asyncio.sleep(0)
+
+    def convert_threaded(self, value, origin_unit, final_unit, delta=False, workers=None, chunk_size=65536):
+        """
+        Convert a large batch by splitting it in chunks converted on a thread pool.
+
+        NumPy arrays are converted chunk by chunk with vectorized kernels, which release
+        the GIL and run in parallel. Other sequences (lists, `array.array`...) are converted
+        in pure Python, which only scales across threads on free-threaded CPython builds.
+
+        Args:
+            value: A NumPy array or a sequence of numbers
+            origin_unit: The source unit
+            final_unit: The target unit
+            delta: Flag indicating whether this is a delta/interval conversion
+            workers: Maximum number of threads (ThreadPoolExecutor default when None)
+            chunk_size: Number of values converted by each task
+
+        Returns:
+            A new NumPy array for NumPy input, an `array.array` for `array.array` input,
+            and a list otherwise.
+        """
+        plan = self.plan(origin_unit, final_unit, delta)
+        scale, offset = plan.scale, plan.offset
+        is_array = _is_array(value)
+        if is_array:
+            np = _numpy()
+            result = np.empty(value.shape, dtype=np.result_type(value.dtype, np.float64))
+            source, target = value.reshape(-1), result.reshape(-1)
+
+            def convert_chunk(start):
+                chunk = target[start:start + chunk_size]
+                np.multiply(source[start:start + chunk_size], scale, out=chunk)
+                if offset:
+                    np.add(chunk, offset, out=chunk)
+        else:
+            source = value if isinstance(value, (list, tuple, array)) else list(value)
+            chunks = {}
+
+            def convert_chunk(start):
+                # Each task owns its own output list; nothing is shared between threads
+                chunks[start] = [item * scale + offset for item in source[start:start + chunk_size]]
+
+        starts = range(0, len(source), chunk_size)
+        if len(starts) > 1:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for _ in executor.map(convert_chunk, starts):
+                    pass
+        else:
+            for start in starts:
+                convert_chunk(start)
+
+        if is_array:
+            return result
+        converted = [item for start in starts for item in chunks[start]]
+        if isinstance(value, array):
+            return array(value.typecode if value.typecode in "fd" else "d", converted)
+        return converted
+
+    def freeze(self):
+        """
+        Return an immutable FrozenConverter with a copy of the current units.
+        """
+        return FrozenConverter(self.units)
+
+    def plan(self, origin_unit, final_unit, delta=False):
+        """
+        Return the cached ConversionPlan from one unit to another.
+
+        The plan folds both units into a single affine map, so converting many values
+        with it skips the unit lookups done by `_single_convertion`. The plan of the
+        reverse direction is built and cached at the same time, and is available as
+        `plan.inverse` without any further lookup.
+
+        Raises:
+            ValueError: If either unit is not in the units dictionary
+        """
+        delta = bool(delta)
+        key = (origin_unit, final_unit, delta)
+        plans = self._plans
+        try:
+            return plans[key]
+        except KeyError:
+            pass
+        # Read after the plans, so a plan built from a table replaced meanwhile is not kept
+        units = self.units
+        if origin_unit not in units or final_unit not in units:
+            raise ValueError(f"Invalid units: {origin_unit}, {final_unit}")
+        plan = self._build_plan(units, origin_unit, final_unit, delta)
+        inverse = plans.get((final_unit, origin_unit, delta))
+        if inverse is None:
+            inverse = self._build_plan(units, final_unit, origin_unit, delta)
+        plan._inverse, inverse._inverse = inverse, plan
+        plans.setdefault((final_unit, origin_unit, delta), inverse)
+        return plans.setdefault(key, plan)
+
+    @staticmethod
+    def _build_plan(units, origin_unit, final_unit, delta):
+        """
+        Build the ConversionPlan between two units of a units dictionary.
+        """
+        origin_scale, origin_offset = units[origin_unit]
+        final_scale, final_offset = units[final_unit]
+        scale = final_scale / origin_scale
+        offset = 0 if delta else final_offset - origin_offset * scale
+        return ConversionPlan(origin_unit, final_unit, scale, offset, delta)
+
+    def compile(self, origin_unit, final_unit, delta=False, kind="scalar"):
+        """
+        Return a generated Python function converting from one unit to another.
+
+        The function is specialized for the pair: its coefficients are constants of the
+        generated code and there is no lookup, dispatch or branch left, which makes it the
+        fastest way to convert many values one by one. Functions are cached with the plan
+        of the pair, so they are dropped when `merge` or `reload` change either unit.
+
+        Args:
+            origin_unit: The source unit
+            final_unit: The target unit
+            delta: Flag indicating whether this is a delta/interval conversion
+            kind: "scalar", "list" or "map" (see `ConversionPlan.compile`)
+
+        Raises:
+            ValueError: If either unit is not in the units dictionary, or the kind is unknown
+        """
+        return self.plan(origin_unit, final_unit, delta).compile(kind)
+
+    def error_bound(self, origin_unit, final_unit, delta=False, dtype="float32"):
+        """
+        Return the worst-case relative error of a reduced-precision conversion.
+
+        The bound covers the rounding of the input, of both coefficients and of the two
+        arithmetic operations, relative to `|scale * value| + |offset|`. For pure scale
+        conversions (no offset) this is the relative error of the result itself. Pairs
+        whose coefficients don't fit in the reduced precision (overflow or subnormal
+        numbers) return infinity.
+
+        Raises:
+            ValueError: If a unit is invalid or the dtype is not supported
+        """
+        if str(dtype) == "float64":
+            unit_roundoff, smallest, largest = _FLOAT64
+        elif str(dtype) == "float32":
+            unit_roundoff, smallest, largest = _FLOAT32
+        else:
+            raise ValueError(f"Unsupported dtype: {dtype}")
+        plan = self.plan(origin_unit, final_unit, delta)
+        for coefficient in (plan.scale, plan.offset):
+            if coefficient and not smallest <= abs(coefficient) <= largest:
+                return float("inf")
+        # Standard bound gamma(n) = n*u / (1 - n*u) for n rounding errors
+        operations = 4 if plan.offset else 3
+        return operations * unit_roundoff / (1 - operations * unit_roundoff)
+
+    def _array_convertion(self, value, origin_unit, final_unit, delta, inplace, dtype=None):
+        """
+        Converts a NumPy array with a single vectorized affine operation.
+        In place conversion is only possible for floating point arrays (TypeError otherwise).
+        With `dtype="float32"`, values and pre-rounded coefficients are float32.
+        """
+        np = _numpy()
+        plan = self.plan(origin_unit, final_unit, delta)
+        if inplace and value.dtype.kind != "f":
+            raise TypeError(f"In place conversion requires a floating point array, not {value.dtype}")
+        if dtype is not None and np.dtype(dtype) == np.float32:
+            scale, offset = np.float32(plan.scale), np.float32(plan.offset)
+            if inplace and value.dtype == np.float32:
+                value *= scale
+                value += offset
+                return value
+            result = value.astype(np.float32)
+            result *= scale
+            result += offset
+            if inplace:
+                value[...] = result
+                return value
+            return result
+        elif dtype is not None and np.dtype(dtype) != np.float64:
+            raise ValueError(f"Unsupported dtype: {dtype}")
+        if inplace:
+            value *= plan.scale
+            value += plan.offset
+            return value
+        return value * plan.scale + plan.offset
+
     def _mut_sequence_convertion(self, value: Iterable, origin_unit: str, final_unit: str, delta,inplace):
         """
         Converts each element in an mutable iterable from the origin unit to the final unit.
         Returns the iterable of the same type as the input.
         """
-        converted_values = [self._single_convertion(val, origin_unit, final_unit, delta) for val in value]
+        units = self.units  # Read once, so a table swapped in meanwhile never applies to part of it
+        converted_values = [self._single_convertion(val, origin_unit, final_unit, delta, units) for val in value]
         if inplace:
             value[:] = converted_values
             return value
@@ -97,7 +930,9 @@ class Converter:
         """
                 Converts all values in the dictionary from the origin unit to the final unit.
                 """
-        converted_dict = {key: self._single_convertion(val, origin_unit, final_unit, delta) for key, val in value.items()}
+        units = self.units
+        converted_dict = {key: self._single_convertion(val, origin_unit, final_unit, delta, units)
+                          for key, val in value.items()}
         if inplace:
             value.update(converted_dict)
             return value
@@ -108,28 +943,237 @@ class Converter:
         Converts each element in an immutable iterable from the origin unit to the final unit.
         Returns the iterable of the same type as the input.
         """
-        converted_values = [self._single_convertion(val, origin_unit, final_unit, delta) for val in value]
+        units = self.units
+        converted_values = [self._single_convertion(val, origin_unit, final_unit, delta, units) for val in value]
         return type(value)(converted_values)  # Return the iterable of the same type
 
-    def _single_convertion(self, value, origin_unit, final_unit, delta=False):
+    def _single_convertion(self, value, origin_unit, final_unit, delta=False, units=None):
         """
         Convert a single value from one unit to another.
+
+        `units` is the table to use, read once by callers converting a whole collection.
         """
+        # Read the table once, so a concurrent table swap never mixes two tables
+        if units is None:
+            units = self.units
+
         # Check if both units are valid
-        if origin_unit not in self.units.keys() or final_unit not in self.units.keys():
+        if origin_unit not in units or final_unit not in units:
             raise ValueError(f"Invalid units: {origin_unit}, {final_unit}")
 
         if delta:
             # For delta conversions, only apply scale factors (ignore offsets)
-            base_value = value / self.units[origin_unit][0]
+            base_value = value / units[origin_unit][0]
 
             # Now, convert to the final unit
-            final_value = base_value * self.units[final_unit][0]
+            final_value = base_value * units[final_unit][0]
         else:
             # For absolute conversions, apply both scale factors and offsets
             # First, adjust the value for the origin unit offset (if any)
-            base_value = (value - self.units[origin_unit][1]) / self.units[origin_unit][0]
+            base_value = (value - units[origin_unit][1]) / units[origin_unit][0]
             # Now, convert to the final unit
-            final_value = base_value * self.units[final_unit][0] + self.units[final_unit][1]
+            final_value = base_value * units[final_unit][0] + units[final_unit][1]
 
         return final_value
+
+
+
+# (unit roundoff, smallest normal, largest finite) of the floating point formats
+_FLOAT32 = (2.0 ** -24, 2.0 ** -126, 3.4028234663852886e38)
+_FLOAT64 = (2.0 ** -53, 2.2250738585072014e-308, 1.7976931348623157e308)
+
+
+class FrozenConverter(Converter):
+    """
+    An immutable, hashable variant of Converter.
+
+    The units are copied at construction (the caller's dictionary is left untouched) and
+    exposed through a read-only mapping. Attributes cannot be reassigned, so a
+    FrozenConverter and everything derived from it can be cached and shared between
+    threads safely. Instances pickle as their units dictionary only.
+
+    Attributes:
+        units (Mapping[str, Tuple[Number, Number]]): Read-only view of the normalized units.
+    """
+
+    __slots__ = ("_units", "_reciprocals", "_hash")
+
+    def __init__(self, units: Dict[str, Union[Number, Tuple[Number, Number], List[Number]]]):
+        """
+        Initialize a FrozenConverter with a copy of a dictionary of units.
+
+        Accepts the same values as `Converter.__init__`, and raises the same errors.
+        """
+        units = dict(units)
+        self._normalize(units)
+        object.__setattr__(self, "_units", units)
+        # Reciprocal of every scale factor, so conversions multiply instead of divide
+        object.__setattr__(self, "_reciprocals", {unit: 1 / scale for unit, (scale, _) in units.items()})
+        object.__setattr__(self, "_plans", {})
+        object.__setattr__(self, "memo", None)
+        object.__setattr__(self, "_hash", None)
+
+    @classmethod
+    def _from_normalized(cls, units):
+        return cls(units)
+
+    @property
+    def units(self):
+        return MappingProxyType(self._units)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"'{type(self).__name__}' object is immutable")
+
+    def __eq__(self, other):
+        if not isinstance(other, FrozenConverter):
+            return NotImplemented
+        return self._units == other._units
+
+    def __hash__(self):
+        if self._hash is None:
+            # Computed once; the units can never change afterwards
+            object.__setattr__(self, "_hash", hash(frozenset(self._units.items())))
+        return self._hash
+
+    def __reduce__(self):
+        return type(self), (self._units,)
+
+    def freeze(self):
+        return self
+
+    def merge(self, units, aliases=None, replace=False):
+        raise TypeError(f"'{type(self).__name__}' object is immutable")
+
+    def reload(self, units, aliases=None):
+        raise TypeError(f"'{type(self).__name__}' object is immutable")
+
+    def _single_convertion(self, value, origin_unit, final_unit, delta=False, units=None):
+        """
+        Convert a single value from one unit to another, using the precomputed reciprocals.
+        The units of a FrozenConverter never change, so `units` is not needed.
+        """
+        units = self._units
+        if origin_unit not in units or final_unit not in units:
+            raise ValueError(f"Invalid units: {origin_unit}, {final_unit}")
+        final_scale, final_offset = units[final_unit]
+        if delta:
+            return value * self._reciprocals[origin_unit] * final_scale
+        return (value - units[origin_unit][1]) * self._reciprocals[origin_unit] * final_scale + final_offset
+
+
+class ConversionPlan:
+    """
+    A precomputed conversion between two units, expressed as an affine map.
+
+    Converting a value with a plan computes `value * scale + offset`, which is
+    equivalent to `Converter._single_convertion` for the same pair of units.
+
+    Attributes:
+        origin_unit (str): The source unit
+        final_unit (str): The target unit
+        scale (Number): Multiplicative factor of the map
+        offset (Number): Additive term of the map (0 for delta conversions)
+        delta (bool): Whether the plan converts deltas/intervals
+        inverse (ConversionPlan): The plan converting back from final_unit to origin_unit
+    """
+
+    __slots__ = ("origin_unit", "final_unit", "scale", "offset", "delta", "_inverse", "_compiled")
+
+    def __init__(self, origin_unit, final_unit, scale, offset, delta=False):
+        self.origin_unit = origin_unit
+        self.final_unit = final_unit
+        self.scale = scale
+        self.offset = offset
+        self.delta = delta
+        self._inverse = None
+        self._compiled = {}
+
+    @property
+    def inverse(self):
+        if self._inverse is None:
+            # Analytical inverse of y = scale * x + offset
+            inverse = ConversionPlan(self.final_unit, self.origin_unit, 1 / self.scale,
+                                     -self.offset / self.scale, self.delta)
+            inverse._inverse = self
+            self._inverse = inverse
+        return self._inverse
+
+    def compose(self, other):
+        """
+        Fuse this plan with a plan starting at its final unit into a single affine map.
+
+        For example, composing the plans °F -> K and K -> mK gives a plan °F -> mK that
+        converts each value with one multiplication and one addition.
+
+        Raises:
+            ValueError: If `other` doesn't start at this plan's final unit, or the plans
+                don't agree on `delta`
+        """
+        if other.origin_unit != self.final_unit:
+            raise ValueError(f"Cannot compose plans: {self.final_unit} != {other.origin_unit}")
+        if other.delta != self.delta:
+            raise ValueError("Cannot compose a delta plan with an absolute plan")
+        return ConversionPlan(self.origin_unit, other.final_unit, self.scale * other.scale,
+                              self.offset * other.scale + other.offset, self.delta)
+
+    def __call__(self, value):
+        """
+        Convert a single numeric value.
+        """
+        return value * self.scale + self.offset
+
+    def compile(self, kind="scalar"):
+        """
+        Return a generated function applying this plan, with its coefficients folded in.
+
+        The source is specialized for the plan: a pure scale compiles to `x * 0.001`, and
+        the offset term only appears when it is not zero. Functions are cached per kind.
+
+        Args:
+            kind: "scalar" for a function of one number, "list" for a function of an
+                iterable returning a list, or "map" for a function of a mapping returning
+                a dictionary with the same keys
+
+        Raises:
+            ValueError: If the kind is unknown
+        """
+        try:
+            return self._compiled[kind]
+        except KeyError:
+            pass
+        if kind not in _TEMPLATES:
+            raise ValueError(f"Unknown kind: {kind} (expected one of {', '.join(_TEMPLATES)})")
+        namespace = {}
+        expression = f"x * {_literal(self.scale, '_scale', namespace)}"
+        if self.offset:
+            expression += f" + {_literal(self.offset, '_offset', namespace)}"
+        source = _TEMPLATES[kind].format(expression=expression)
+        exec(compile(source, f"<plan {self.origin_unit} -> {self.final_unit}>", "exec"), namespace)
+        function = namespace["convert"]
+        function.__doc__ = f"Convert from {self.origin_unit} to {self.final_unit}: {expression}"
+        return self._compiled.setdefault(kind, function)
+
+    def __repr__(self):
+        return (f"ConversionPlan({self.origin_unit!r} -> {self.final_unit!r}, "
+                f"scale={self.scale!r}, offset={self.offset!r}, delta={self.delta!r})")
+
+
+# Sources of the functions generated by `ConversionPlan.compile`
+_TEMPLATES = {
+    "scalar": "def convert(x):\n    return {expression}\n",
+    "list": "def convert(values):\n    return [{expression} for x in values]\n",
+    "map": "def convert(values):\n    return {{key: {expression} for key, x in values.items()}}\n",
+}
+
+
+def _literal(value, name, namespace):
+    """
+    Return the source of a constant, or bind it in `namespace` when it has no exact literal.
+    """
+    if type(value) in (int, float) and value - value == 0:  # finite int or float
+        return repr(value)
+    namespace[name] = value
+    return name
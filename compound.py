@@ -0,0 +1,354 @@
+"""
+Compound Unit Module
+
+This module builds conversion factors for compound unit expressions such as
+"km/h", "m^2" or "ft·lbf/s" from the base tables of existing converters
+(Length, Weight, Time...), instead of listing every combination by hand.
+
+An expression is a sequence of unit names joined by "*", "·" or "/", where each
+name may carry an integer exponent ("m^2", "s^-1") or a superscript ("m²", "m³").
+Every resolved expression is memoized, so repeated lookups cost a single dict access.
+
+Example Usage:
+    >>> from Converters import Speed
+    >>> Speed.convert(36, "km/h", "m/s")
+    10.0
+"""
+
+import re
+from typing import Dict, Tuple, Union
+
+from base_class import ConversionPlan, Converter
+
+# Superscript exponents accepted at the end of a unit name
+_SUPERSCRIPTS = {"²": 2, "³": 3}
+
+# Splits an expression into (operator, term) pairs, e.g. "km/h" -> ("", "km"), ("/", "h")
+_TOKEN_RE = re.compile(r"([*·/]?)\s*([^*·/]+)")
+
+# Exact values of the table factors and alias sizes already read (see `_exact`)
+_EXACT = {}
+
+
+class CompoundResolver:
+    """
+    Resolves compound unit expressions into conversion factors.
+
+    The resolver is built from a set of base converters, each one tagged with the
+    dimension symbol it represents (for example "L" for Length). A resolved
+    expression is a pair (scale_factor, dimension) where the scale factor follows the
+    same convention as `Converter.units` (units per base unit) and the dimension is a
+    sorted tuple of (symbol, exponent) pairs.
+
+    Factors are combined exactly: every table value and alias size is read back as the
+    decimal it was written as (see `_exact`), the size of the expression in base units is
+    computed as a Fraction, and it is inverted and rounded to a float once at the end.
+
+    Attributes:
+        tables (Dict[str, Converter]): Base converters indexed by dimension symbol.
+        aliases (Dict[str, Tuple[str, Number]]): Named units defined as
+            (expression, size), meaning one named unit equals `size` times the expression.
+    """
+
+    def __init__(self, tables: Dict[str, Converter], aliases: Dict[str, Tuple[str, Union[int, float]]] = None):
+        """
+        Initialize a CompoundResolver.
+
+        Args:
+            tables: A dictionary mapping a dimension symbol to the converter holding its
+                units. Units are looked up in the order the tables are given.
+            aliases: An optional dictionary of derived or alternative unit names, mapped
+                to a tuple (expression, size). For example {"lbf": ("N", 4.4482216152605)}.
+        """
+        self.tables = tables
+        self.aliases = aliases or {}
+        self._cache = {}
+        self._sizes = {}
+
+    def clear(self):
+        """
+        Forget every resolved expression, after a table or an alias changed.
+        """
+        self._cache = {}
+        self._sizes = {}
+
+    def resolve(self, expression: str) -> Tuple[float, Tuple[Tuple[str, int], ...]]:
+        """
+        Resolve a unit expression into its (scale_factor, dimension) pair.
+
+        Raises:
+            ValueError: If the expression contains an unknown unit, a unit with an
+                offset (such as a temperature scale) or is malformed.
+        """
+        try:
+            return self._cache[expression]
+        except KeyError:
+            pass
+        size, dimension = self._exact_size(expression)
+        resolved = (float(1 / size), dimension)
+        # setdefault keeps the first published value if two threads race here
+        return self._cache.setdefault(expression, resolved)
+
+    def scale(self, expression: str) -> float:
+        """
+        Return the scale factor (units per base unit) of a unit expression.
+        """
+        return self.resolve(expression)[0]
+
+    def dimension(self, expression: str) -> Tuple[Tuple[str, int], ...]:
+        """
+        Return the dimension of a unit expression as a sorted tuple of (symbol, exponent).
+        """
+        return self.resolve(expression)[1]
+
+    def size(self, expression: str):
+        """
+        Return the exact size of one unit of the expression in base units, as a Fraction.
+        """
+        try:
+            return self._sizes[expression]
+        except KeyError:
+            pass
+        size, _ = self._exact_size(expression)
+        return self._sizes.setdefault(expression, size)
+
+    def _exact_size(self, expression):
+        """
+        Return the (size, dimension) pair of an expression, with the size as a Fraction.
+        """
+        from fractions import Fraction  # Not imported with the module: it imports decimal
+
+        factors, dimension = self._expand(expression, 1, {}, {})
+        size = Fraction(1)
+        for value, exponent in factors.items():
+            if exponent:
+                size *= value ** exponent
+        return size, _freeze_dimension(dimension)
+
+    def _expand(self, expression, power, factors, dimension, depth=0):
+        """
+        Accumulate the exact sizes and dimension exponents of an expression raised to `power`.
+        """
+        if depth > 8:
+            raise ValueError(f"Unit alias '{expression}' is defined recursively")
+        expression = expression.strip()
+        position = 0
+        for match in _TOKEN_RE.finditer(expression):
+            if match.start() != position:
+                break
+            position = match.end()
+            operator, term = match.groups()
+            name, exponent = _split_exponent(term.strip())
+            exponent *= -power if operator == "/" else power
+            self._expand_name(name, exponent, factors, dimension, depth)
+        if position != len(expression) or not expression:
+            raise ValueError(f"Invalid unit expression: '{expression}'")
+        return factors, dimension
+
+    def _expand_name(self, name, exponent, factors, dimension, depth):
+        """
+        Accumulate a single unit name raised to `exponent`.
+        """
+        if name in self.aliases:
+            alias_expression, size = self.aliases[name]
+            self._expand(alias_expression, exponent, factors, dimension, depth + 1)
+            size = _exact(size)
+            factors[size] = factors.get(size, 0) + exponent
+            return
+        for symbol, table in self.tables.items():
+            if name in table.units:
+                scale, offset = table.units[name]
+                if offset:
+                    raise ValueError(f"Unit '{name}' has an offset and cannot be used in a compound unit")
+                size = 1 / _exact(scale)
+                factors[size] = factors.get(size, 0) + exponent
+                dimension[symbol] = dimension.get(symbol, 0) + exponent
+                return
+        raise ValueError(f"Invalid unit: {name}")
+
+
+class _CompoundUnits(dict):
+    """
+    Unit dictionary that resolves missing compound expressions on demand.
+
+    Resolved expressions are stored in the dictionary itself, so they are only
+    computed once and behave like any other unit afterwards. Their exact sizes are only
+    computed to convert between two units with a single rounding (see `ratio`).
+    """
+
+    def __init__(self, resolver, dimension):
+        super().__init__()
+        self.resolver = resolver
+        self.dimension = dimension
+        self._ratios = {}
+
+    def __contains__(self, unit):
+        if dict.__contains__(self, unit):
+            return True
+        return self._resolve(unit) is not None
+
+    def __missing__(self, unit):
+        value = self._resolve(unit)
+        if value is None:
+            raise KeyError(unit)
+        return value
+
+    def copy(self):
+        table = _CompoundUnits(self.resolver, self.dimension)
+        dict.update(table, self)
+        return table
+
+    def ratio(self, origin_unit, final_unit):
+        """
+        Return the factor converting origin_unit to final_unit, rounded once from exact sizes.
+
+        Raises:
+            ValueError: If either unit is not in the table
+        """
+        key = (origin_unit, final_unit)
+        try:
+            return self._ratios[key]
+        except KeyError:
+            pass
+        if origin_unit not in self or final_unit not in self:
+            raise ValueError(f"Invalid units: {origin_unit}, {final_unit}")
+        ratio = float(self._size(origin_unit) / self._size(final_unit))
+        return self._ratios.setdefault(key, ratio)
+
+    def _size(self, unit):
+        scale = self[unit][0]
+        try:
+            size = self.resolver.size(unit)
+        except ValueError:
+            size = None
+        if size is None or float(1 / size) != scale:
+            # Merged with an explicit value, or resolved from a table reloaded since
+            size = 1 / _exact(scale)
+        return size
+
+    def _resolve(self, unit):
+        if not isinstance(unit, str):
+            return None
+        try:
+            scale, dimension = self.resolver.resolve(unit)
+        except ValueError:
+            return None
+        if dimension != self.dimension:
+            return None
+        return self.setdefault(unit, (scale, 0))
+
+
+class CompoundConverter(Converter):
+    """
+    A converter whose units are compound expressions resolved from base tables.
+
+    The listed units are the ones exposed when iterating over `units` (for example in
+    the GUI), but any other expression with the same dimension can be used as well and
+    is resolved and memoized the first time it is needed.
+
+    Attributes:
+        resolver (CompoundResolver): The resolver used to build the unit factors.
+        units (Dict[str, Tuple[Number, Number]]): Resolved units as (scale_factor, 0) tuples.
+    """
+
+    def __init__(self, resolver: CompoundResolver, units):
+        """
+        Initialize a CompoundConverter.
+
+        Args:
+            resolver: The CompoundResolver used to resolve unit expressions.
+            units: An iterable of unit expressions. The first one defines the dimension
+                of the converter and should be its base unit.
+
+        Raises:
+            ValueError: If an expression cannot be resolved or has a different dimension
+        """
+        units = list(units)
+        self.resolver = resolver
+        super().__init__(_CompoundUnits(resolver, resolver.dimension(units[0])))
+        for unit in units:
+            if unit not in self.units:
+                raise ValueError(f"Invalid unit for this converter: {unit}")
+
+    def _single_convertion(self, value, origin_unit, final_unit, delta=False, units=None):
+        """
+        Convert a single value with the ratio of the exact sizes of both units.
+
+        Dividing by one rounded factor and multiplying by another would round twice (1 mph
+        would be 0.44703999999999994 m/s). Compound units have no offsets, so `delta` does
+        not change the result.
+        """
+        if units is None:
+            units = self.units
+        if not isinstance(units, _CompoundUnits):  # Replaced by a plain table with `reload`
+            return super()._single_convertion(value, origin_unit, final_unit, delta, units)
+        return value * units.ratio(origin_unit, final_unit)
+
+    def _build_plan(self, units, origin_unit, final_unit, delta):
+        if not isinstance(units, _CompoundUnits):
+            return super()._build_plan(units, origin_unit, final_unit, delta)
+        return ConversionPlan(origin_unit, final_unit, units.ratio(origin_unit, final_unit), 0, delta)
+
+    def refresh(self):
+        """
+        Resolve every memoized expression again, after a base table of the resolver changed.
+
+        The new table is swapped in like a `reload`, so conversions in flight finish with the
+        old factors. Expressions that can no longer be resolved are dropped.
+
+        Returns:
+            The list of units whose value changed or that were dropped
+        """
+        current = self.units
+        table = _CompoundUnits(self.resolver, current.dimension)
+        for unit in dict.keys(current):
+            table._resolve(unit)
+        changed = [unit for unit, value in dict.items(current) if dict.get(table, unit) != value]
+        self._swap_units(table, changed)
+        return changed
+
+
+def _split_exponent(term):
+    """
+    Split a term such as "m^2" or "m²" into its name and integer exponent.
+    """
+    if "^" in term:
+        name, _, exponent = term.rpartition("^")
+        try:
+            return name.strip(), int(exponent)
+        except ValueError:
+            raise ValueError(f"Invalid exponent in unit: '{term}'")
+    if term and term[-1] in _SUPERSCRIPTS:
+        return term[:-1], _SUPERSCRIPTS[term[-1]]
+    return term, 1
+
+
+def _exact(value):
+    """
+    Return a table value or an alias size as the exact number it was written as.
+
+    Tables list a unit either as a decimal (100 for cm) or as the reciprocal of its decimal
+    definition (1 / 0.3048 for ft), which is already rounded. The shorter of the two
+    decimals is taken as the definition: 0.3048 rather than 3.280839895013123.
+    """
+    try:
+        return _EXACT[value]
+    except KeyError:
+        pass
+    from fractions import Fraction
+
+    if not isinstance(value, float):
+        return _EXACT.setdefault(value, Fraction(value))
+    direct = repr(value)
+    # Reciprocals are computed in floating point, so a definition d matches if 1 / d == value
+    for inverse in ("%.15g" % (1 / value), repr(1 / value)):
+        if len(inverse) < len(direct) and 1 / float(inverse) == value:
+            return _EXACT.setdefault(value, 1 / Fraction(inverse))
+    return _EXACT.setdefault(value, Fraction(direct))
+
+
+def _freeze_dimension(dimension):
+    """
+    Convert a {symbol: exponent} dictionary into a hashable, sorted tuple.
+    """
+    return tuple(sorted((symbol, exponent) for symbol, exponent in dimension.items() if exponent))
@@ -0,0 +1,335 @@
+"""
+Equivalence Harness Module
+
+This module checks the accelerated conversion paths of `Converter` against the reference
+scalar path (`_single_convertion`), and times them. For every unit pair, the same random
+and edge-case inputs go through each path, and the report gives the largest distance to
+the reference in ULPs (units in the last place) and as a relative error, with the speedup
+over the reference.
+
+Relative errors are measured against the size of the terms of the conversion (the value
+and origin offset times the ratio of the scale factors, plus the final offset), so a
+result close to zero after cancelling an offset (-273.15 ºC in K) doesn't hide every
+other result. ULP distances are raw, and do show such cancellations. Inputs whose exact or
+reference result overflows or is subnormal (including a zero left by an underflow) are
+counted as out of range and left out of both measures: a 1-ULP difference between two
+subnormals would otherwise be a relative error of 1.
+
+Paths:
+    - "plan": `ConversionPlan.__call__`, value by value
+    - "batch": `convert_batch`
+    - "array": `convert` with a NumPy array (skipped without NumPy)
+    - "compiled": the "list" function from `compile`
+    - "parallel": `convert_threaded` with several chunks
+    - "exact": exact rational arithmetic rounded once, i.e. the correctly rounded result,
+      which measures the error of the reference path itself
+
+Run the full report with:
+    python equivalence.py [--converter Length] [--count 64] [--seed 0]
+"""
+
+import argparse
+import random
+import struct
+import time
+from collections import namedtuple
+from fractions import Fraction
+
+from base_class import _numpy
+
+# One line of the report
+Result = namedtuple("Result", "converter origin_unit final_unit delta path max_ulp max_relative_error "
+                               "out_of_range seconds speedup")
+
+# Smallest normal and largest finite float64
+_FLOAT64_NORMAL = 2.2250738585072014e-308
+_FLOAT64_MAX = 1.7976931348623157e308
+
+# Inputs every run includes, chosen to stress signs, zero, rounding and the exponent range
+EDGE_CASES = (0.0, -0.0, 1.0, -1.0, 0.1, -0.1, 1 / 3, 100.0, -273.15, 2.0 ** 53, 1e-300, -1e-300,
+              5e-324, 1e300, -1e300)
+
+
+def _reference_path(converter, values, origin_unit, final_unit, delta):
+    return [converter._single_convertion(value, origin_unit, final_unit, delta) for value in values]
+
+
+def _plan_path(converter, values, origin_unit, final_unit, delta):
+    plan = converter.plan(origin_unit, final_unit, delta)
+    return [plan(value) for value in values]
+
+
+def _batch_path(converter, values, origin_unit, final_unit, delta):
+    return list(converter.convert_batch(values, origin_unit, final_unit, delta)[0])
+
+
+def _array_path(converter, values, origin_unit, final_unit, delta):
+    np = _numpy()
+    with np.errstate(over="ignore"):
+        return converter.convert(np.array(values, dtype=np.float64), origin_unit, final_unit, delta).tolist()
+
+
+def _compiled_path(converter, values, origin_unit, final_unit, delta):
+    return converter.compile(origin_unit, final_unit, delta, kind="list")(values)
+
+
+def _parallel_path(converter, values, origin_unit, final_unit, delta):
+    chunk_size = max(len(values) // 4, 1)
+    np = _numpy()
+    if np is not None:
+        with np.errstate(over="ignore"):
+            values = np.array(values, dtype=np.float64)
+            return converter.convert_threaded(values, origin_unit, final_unit, delta, 4, chunk_size).tolist()
+    return list(converter.convert_threaded(values, origin_unit, final_unit, delta, 4, chunk_size))
+
+
+def _exact_path(converter, values, origin_unit, final_unit, delta):
+    origin_scale, origin_offset = (Fraction(value) for value in converter.units[origin_unit])
+    final_scale, final_offset = (Fraction(value) for value in converter.units[final_unit])
+    if delta:
+        origin_offset = final_offset = 0
+    return [_to_float((Fraction(value) - origin_offset) / origin_scale * final_scale + final_offset)
+            for value in values]
+
+
+# Accelerated paths by name, in report order
+PATHS = {
+    "plan": _plan_path,
+    "batch": _batch_path,
+    "array": _array_path,
+    "compiled": _compiled_path,
+    "parallel": _parallel_path,
+    "exact": _exact_path,
+}
+
+
+def inputs(count=64, seed=0):
+    """
+    Return the edge cases followed by `count` random values of every magnitude.
+    """
+    generator = random.Random(seed)
+    values = list(EDGE_CASES)
+    for index in range(count):
+        if index % 2:
+            values.append(generator.uniform(-1000, 1000))
+        else:
+            values.append(generator.choice((-1, 1)) * 10 ** generator.uniform(-30, 30))
+    return values
+
+
+def ulp_distance(first, second):
+    """
+    Return the number of float64 values between two floats (0 if they are equal).
+    """
+    if first == second:
+        return 0
+    if first != first or second != second:
+        return float("inf")
+    return abs(_ordered(first) - _ordered(second))
+
+
+def relative_error(value, reference, magnitude=0.0):
+    """
+    Return the error of `value` relative to the largest of `reference` and `magnitude`.
+    """
+    if value == reference:
+        return 0.0
+    scale = max(abs(reference), magnitude)
+    return abs(value - reference) / scale if scale else abs(value - reference)
+
+
+def compare(converter, origin_unit, final_unit, delta=False, values=None, paths=None, name="", repeat=3):
+    """
+    Run one unit pair through the reference path and every accelerated path.
+
+    Every path runs once untimed (to build its plans or generated code), then the best
+    of `repeat` runs is timed.
+
+    Args:
+        converter: The converter holding both units
+        origin_unit: The source unit
+        final_unit: The target unit
+        delta: Flag indicating whether this is a delta/interval conversion
+        values: The inputs (defaults to `inputs()`)
+        paths: The names of the paths to run (defaults to every available path)
+        name: The converter name written in the results
+        repeat: Number of timed runs per path
+
+    Returns:
+        A list of Result, one per path
+    """
+    values = inputs() if values is None else list(values)
+    paths = _available(paths)
+    reference, reference_seconds = _timed(_reference_path, converter, values, origin_unit, final_unit, delta, repeat)
+    exact = _exact_path(converter, values, origin_unit, final_unit, delta)
+    origin_scale, origin_offset = converter.units[origin_unit]
+    final_scale, final_offset = converter.units[final_unit]
+    if delta:
+        origin_offset = final_offset = 0
+    ratio = abs(final_scale / origin_scale)
+    # (index, size of the largest terms of the conversion) of the inputs whose result is representable
+    checked = []
+    for index, value in enumerate(values):
+        magnitude = (abs(value) + abs(origin_offset)) * ratio + abs(final_offset)
+        zero = not (value or origin_offset or final_offset)
+        if zero or _in_range(exact[index], magnitude) and _in_range(reference[index], magnitude):
+            checked.append((index, magnitude))
+
+    results = []
+    for path in paths:
+        converted, seconds = _timed(PATHS[path], converter, values, origin_unit, final_unit, delta, repeat)
+        max_ulp = max([ulp_distance(converted[index], reference[index]) for index, _ in checked], default=0)
+        max_error = max([relative_error(converted[index], reference[index], magnitude)
+                         for index, magnitude in checked], default=0.0)
+        results.append(Result(name, origin_unit, final_unit, delta, path, max_ulp, max_error,
+                              len(values) - len(checked), seconds,
+                              reference_seconds / seconds if seconds else float("inf")))
+    return results
+
+
+def run(converters, delta=False, values=None, paths=None, distinct=True):
+    """
+    Compare every unit pair of several converters.
+
+    Args:
+        converters: A mapping of converter names to converters (e.g. `registry.converters`)
+        delta: Flag indicating whether to compare delta/interval conversions
+        values: The inputs (defaults to `inputs()`)
+        paths: The names of the paths to run (defaults to every available path)
+        distinct: Skip units whose (scale_factor, offset) repeats an earlier unit of the
+            same converter (synonyms), since they convert exactly like it
+
+    Returns:
+        A list of Result, per pair and path
+    """
+    values = inputs() if values is None else list(values)
+    results = []
+    for name, converter in converters.items():
+        units = _distinct_units(converter) if distinct else list(converter.units)
+        for origin_unit in units:
+            for final_unit in units:
+                if origin_unit != final_unit:
+                    results.extend(compare(converter, origin_unit, final_unit, delta, values, paths, name))
+    return results
+
+
+def summarize(results):
+    """
+    Aggregate results per converter and path: worst ULP distance and relative error, total
+    of the inputs out of range, and the speedup over the whole run.
+
+    Returns:
+        A list of Result whose unit fields are None
+    """
+    summary = {}
+    for result in results:
+        key = (result.converter, result.path)
+        current = summary.get(key)
+        if current is None:
+            summary[key] = [result.delta, result.max_ulp, result.max_relative_error, result.out_of_range,
+                            result.seconds, result.seconds * result.speedup]
+        else:
+            current[1] = max(current[1], result.max_ulp)
+            current[2] = max(current[2], result.max_relative_error)
+            current[3] += result.out_of_range
+            current[4] += result.seconds
+            current[5] += result.seconds * result.speedup
+    return [Result(converter, None, None, delta, path, max_ulp, max_error, out_of_range, seconds,
+                   reference / seconds if seconds else float("inf"))
+            for (converter, path), (delta, max_ulp, max_error, out_of_range, seconds, reference)
+            in summary.items()]
+
+
+def format_report(results):
+    """
+    Format results as a text table.
+    """
+    lines = [f"{'converter':<12} {'origin':<10} {'final':<10} {'path':<9} {'max ulp':>10} "
+             f"{'max rel err':>12} {'skipped':>8} {'speedup':>8}"]
+    for result in results:
+        lines.append(f"{result.converter:<12} {result.origin_unit or '*':<10} {result.final_unit or '*':<10} "
+                     f"{result.path:<9} {result.max_ulp:>10} {result.max_relative_error:>12.3g} "
+                     f"{result.out_of_range:>8} {result.speedup:>7.1f}x")
+    return "\n".join(lines)
+
+
+def _available(paths):
+    """
+    Return the requested paths, leaving out the ones needing a missing dependency.
+    """
+    paths = list(PATHS) if paths is None else list(paths)
+    unknown = [path for path in paths if path not in PATHS]
+    if unknown:
+        raise ValueError(f"Unknown paths: {', '.join(unknown)}")
+    return [path for path in paths if path != "array" or _numpy() is not None]
+
+
+def _distinct_units(converter):
+    """
+    Return the first unit of every distinct (scale_factor, offset) value of a converter.
+    """
+    seen = {}
+    for unit, value in converter.units.items():
+        seen.setdefault(value, unit)
+    return list(seen.values())
+
+
+def _timed(path, converter, values, origin_unit, final_unit, delta, repeat):
+    """
+    Run a path once untimed, then return its result and the best time of `repeat` runs.
+    """
+    converted = path(converter, values, origin_unit, final_unit, delta)
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        path(converter, values, origin_unit, final_unit, delta)
+        best = min(best, time.perf_counter() - start)
+    return converted, best
+
+
+def _in_range(result, magnitude):
+    """
+    Return whether a result is a normal float, or a zero cancelling terms of normal size.
+    """
+    if result == 0:
+        return _FLOAT64_NORMAL <= magnitude <= _FLOAT64_MAX
+    return _FLOAT64_NORMAL <= abs(result) <= _FLOAT64_MAX
+
+
+def _ordered(value):
+    """
+    Map a float to an integer, so adjacent floats map to adjacent integers.
+    """
+    bits = struct.unpack("<q", struct.pack("<d", value))[0]
+    return bits if bits >= 0 else -(bits & 0x7FFFFFFFFFFFFFFF)
+
+
+def _to_float(value):
+    """
+    Round a Fraction to the nearest float, overflowing to infinity like float arithmetic.
+    """
+    try:
+        return float(value)
+    except OverflowError:
+        return float("inf") if value > 0 else float("-inf")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare the accelerated conversion paths with the reference path")
+    parser.add_argument("--converter", action="append", help="Converter to check (default: all)")
+    parser.add_argument("--count", type=int, default=64, help="Number of random inputs per pair")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the random inputs")
+    parser.add_argument("--delta", action="store_true", help="Compare delta/interval conversions")
+    parser.add_argument("--pairs", action="store_true", help="Report every pair instead of a summary")
+    arguments = parser.parse_args()
+
+    from Converters import registry
+
+    converters = {name: converter for name, converter in registry.converters.items()
+                  if not arguments.converter or name in arguments.converter}
+    results = run(converters, arguments.delta, inputs(arguments.count, arguments.seed))
+    print(format_report(results if arguments.pairs else summarize(results)))
+
+
+if __name__ == "__main__":
+    main()
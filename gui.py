@@ -9,6 +9,150 @@ with support for temperature, length, weight, and volume conversions.
 import tkinter as tk
 from tkinter import ttk, messagebox
 import Converters
+
+
+def format_value(value):
+    """
+    Format a converted value for the result label and the all-units panel.
+
+    Values from 0.001 to 1000 in magnitude, and 0, use fixed notation with 6 decimals;
+    smaller and larger values use scientific notation.
+    """
+    if value == 0 or 0.001 <= abs(value) <= 1000:
+        return f"{value:.6f}"
+    return f"{value:.6e}"
+
+
+class AllUnitsPanel:
+    """
+    A filterable list showing the input converted into every unit of a converter.
+
+    The rows are Treeview items created once per unit and reused: filtering detaches and
+    re-attaches them, and a new input only formats the rows currently in view, so large
+    tables (Length, Speed) stay responsive. Updates are debounced with `after`, so typing
+    runs a single `convert_to_all` once the input settles.
+
+    Attributes:
+        frame (ttk.LabelFrame): The frame holding the filter entry and the list
+        tree (ttk.Treeview): The list of units and converted values
+    """
+
+    DEBOUNCE_MS = 150
+
+    def __init__(self, parent, converter):
+        """
+        Create the panel (not packed) for a converter.
+
+        Args:
+            parent (tk.Widget): The parent widget
+            converter (Converter): The converter whose units are listed
+        """
+        self.converter = converter
+        self.units = list(converter.units.keys())
+        self.frame = ttk.LabelFrame(parent, text="All Units", padding=10)
+
+        filter_frame = ttk.Frame(self.frame)
+        filter_frame.pack(fill=tk.X, pady=(0, 5))
+        ttk.Label(filter_frame, text="Filter:").pack(side=tk.LEFT)
+        self.filter_var = tk.StringVar()
+        ttk.Entry(filter_frame, textvariable=self.filter_var, width=20).pack(side=tk.LEFT, padx=5)
+        self.filter_var.trace_add("write", lambda *args: self._debounce("filter", self._apply_filter))
+
+        list_frame = ttk.Frame(self.frame)
+        list_frame.pack(fill=tk.BOTH, expand=True)
+        self.tree = ttk.Treeview(list_frame, columns=("value",), show="tree headings", height=8)
+        self.tree.heading("#0", text="Unit")
+        self.tree.heading("value", text="Value")
+        self.tree.column("#0", width=140, stretch=False)
+        self.tree.column("value", width=200, anchor=tk.E)
+        scrollbar = ttk.Scrollbar(list_frame, orient=tk.VERTICAL, command=self.tree.yview)
+        self.scrollbar = scrollbar
+        self.tree.configure(yscrollcommand=self._on_scroll)
+        self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+
+        # One item per unit, identified by its index in `units`
+        self.items = [self.tree.insert("", tk.END, iid=str(index), text=unit)
+                      for index, unit in enumerate(self.units)]
+        self.shown = list(self.items)
+        self.values = {}  # unit -> converted value of the last input
+        self.rendered = set()  # items whose text matches `values`
+        self._pending = {}  # kind of update ("filter" or "convert") -> scheduled after id
+
+    def update(self, value_str, from_unit, delta):
+        """
+        Schedule an update of the converted values once the input stops changing.
+        """
+        self._debounce("convert", lambda: self._convert(value_str, from_unit, delta))
+
+    def _debounce(self, kind, callback):
+        """
+        Run `callback` after DEBOUNCE_MS, cancelling the previously scheduled update of the
+        same kind, so typing in the filter never drops a pending conversion.
+        """
+        pending = self._pending.pop(kind, None)
+        if pending is not None:
+            self.frame.after_cancel(pending)
+        self._pending[kind] = self.frame.after(self.DEBOUNCE_MS, self._run, kind, callback)
+
+    def _run(self, kind, callback):
+        self._pending.pop(kind, None)
+        callback()
+
+    def _convert(self, value_str, from_unit, delta):
+        """
+        Convert the input into every unit at once and redraw the visible rows.
+        """
+        try:
+            value = float(value_str)
+            self.values = self.converter.convert_to_all(value, from_unit, self.units, delta)
+        except (TypeError, ValueError):
+            self.values = {}
+        self.rendered.clear()
+        self._render_visible()
+
+    def _apply_filter(self):
+        """
+        Attach only the rows whose unit contains the filter text, keeping the table order.
+        """
+        text = self.filter_var.get().strip().lower()
+        shown = [item for item, unit in zip(self.items, self.units) if text in unit.lower()]
+        if shown == self.shown:
+            return
+        if self.shown:
+            self.tree.detach(*self.shown)
+        for index, item in enumerate(shown):
+            self.tree.move(item, "", index)
+        self.shown = shown
+        self.tree.yview_moveto(0)
+        self._render_visible()
+
+    def _on_scroll(self, first, last):
+        """
+        Treeview `yscrollcommand`: update the scrollbar and format the rows brought into view.
+        """
+        self.scrollbar.set(first, last)
+        self._render_visible(float(first), float(last))
+
+    def _render_visible(self, first=None, last=None):
+        """
+        Format the values of the rows in view that are not up to date yet.
+        """
+        if not self.shown:
+            return
+        if first is None:
+            first, last = self.tree.yview()
+        count = len(self.shown)
+        start = max(int(first * count) - 1, 0)
+        stop = min(int(last * count) + 2, count)
+        for item in self.shown[start:stop]:
+            if item in self.rendered:
+                continue
+            value = self.values.get(self.units[int(item)])
+            self.tree.set(item, "value", "" if value is None else format_value(value))
+            self.rendered.add(item)
+
+
 class ConverterGUI:
     """
     A graphical user interface for the unit converter library.
@@ -114,6 +258,22 @@ class ConverterGUI:
         to_dropdown = ttk.Combobox(input_frame, textvariable=to_unit, values=units, state="readonly", width=12)
         to_dropdown.grid(row=2, column=1, sticky=tk.W, pady=5)
         
+        # Panel listing the value converted into every unit, shown on demand
+        all_units_var = tk.BooleanVar()
+        all_units_var.set(False)
+        all_units = AllUnitsPanel(frame, converter)
+
+        def update_all_units(*args):
+            if all_units_var.get():
+                all_units.update(value_var.get(), from_unit.get(), delta_var.get())
+
+        def toggle_all_units():
+            if all_units_var.get():
+                all_units.frame.pack(fill=tk.BOTH, expand=True, pady=5)
+                update_all_units()
+            else:
+                all_units.frame.pack_forget()
+
         # Bind events to update conversion when units are changed
         def on_unit_change(event):
             self.convert(
@@ -154,15 +314,23 @@ class ConverterGUI:
                 # If not a valid number, don't update the conversion
                 pass
                 
-        # Register the trace callback
+        # Register the trace callbacks
         value_var.trace_add("write", on_value_change)
+        value_var.trace_add("write", update_all_units)
+        from_unit.trace_add("write", update_all_units)
         
         # Add a checkbox for delta conversion (for temperature)
         delta_var = tk.BooleanVar()
         delta_var.set(False)
-        delta_check = ttk.Checkbutton(input_frame, text="Delta/Interval Conversion", variable=delta_var)
+        delta_check = ttk.Checkbutton(input_frame, text="Delta/Interval Conversion", variable=delta_var,
+                                      command=update_all_units)
         delta_check.grid(row=3, column=0, columnspan=2, sticky=tk.W, pady=5)
         
+        # Add a checkbox showing the value in every unit
+        all_units_check = ttk.Checkbutton(input_frame, text="Show All Units", variable=all_units_var,
+                                          command=toggle_all_units)
+        all_units_check.grid(row=4, column=0, columnspan=2, sticky=tk.W, pady=5)
+        
         # Create the output section
         output_frame = ttk.LabelFrame(frame, text="Result", padding=10)
         output_frame.pack(fill=tk.BOTH, expand=True, pady=5)
@@ -244,25 +412,15 @@ class ConverterGUI:
             # Validate units are not the same
             if from_unit == to_unit:
                 # If units are the same, just format the result
-                if abs(value) < 0.001 or abs(value) > 1000:
-                    result_str = f"{value:.6e}"
-                else:
-                    result_str = f"{value:.6f}"
-                result_var.set(f"{value_str} {from_unit} = {result_str} {to_unit}")
+                result_var.set(f"{value_str} {from_unit} = {format_value(value)} {to_unit}")
                 return
             
             # Perform the conversion
             try:
                 result = converter.convert(value, from_unit, to_unit, delta)
                 
-                # Format the result
-                if abs(result) < 0.001 or abs(result) > 1000:
-                    result_str = f"{result:.6e}"
-                else:
-                    result_str = f"{result:.6f}"
-                
                 # Update the result label
-                result_var.set(f"{value_str} {from_unit} = {result_str} {to_unit}")
+                result_var.set(f"{value_str} {from_unit} = {format_value(result)} {to_unit}")
                 
             except ValueError as ve:
                 messagebox.showerror("Conversion Error", f"Invalid units: {from_unit}, {to_unit}")
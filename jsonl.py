@@ -0,0 +1,228 @@
+"""
+JSON Lines Streaming Module
+
+This module converts JSON Lines feeds where every record carries a value and its unit,
+for example {"sensor": "a1", "value": 25.0, "unit": "ºC"}. The input is read line by
+line and written back through a buffered file in chunks, so a feed of any size is
+converted in bounded memory. Each record's unit is resolved through a UnitRegistry
+(`Converters.registry` by default) and its conversion plan is cached for the run.
+
+Lines that are not valid JSON objects, lack the value or unit, or hold a non-numeric value
+are skipped and counted. Valid records whose unit can't be converted to the target (an
+unknown unit, another dimension, or a unit missing from the target mapping) are written
+unchanged and counted apart, so no event is lost.
+
+Run the tool with:
+    python jsonl.py events.jsonl events_si.jsonl --to K [--workers 4]
+"""
+
+import argparse
+import json
+from collections import deque
+from itertools import islice
+from numbers import Number
+
+
+class StreamStats:
+    """
+    Counters of a conversion run.
+
+    Attributes:
+        lines (int): Non-blank lines read
+        converted (int): Records converted and written
+        unconverted (int): Valid records written unchanged because their unit can't be
+            converted to the target
+        skipped (int): Malformed lines, not written
+    """
+
+    __slots__ = ("lines", "converted", "unconverted", "skipped")
+
+    def __init__(self, lines=0, converted=0, unconverted=0, skipped=0):
+        self.lines = lines
+        self.converted = converted
+        self.unconverted = unconverted
+        self.skipped = skipped
+
+    def __repr__(self):
+        return (f"StreamStats(lines={self.lines}, converted={self.converted}, "
+                f"unconverted={self.unconverted}, skipped={self.skipped})")
+
+
+def convert_records(lines, target, registry=None, value_key="value", unit_key="unit", delta=False, stats=None):
+    """
+    Convert JSON Lines records one by one.
+
+    Args:
+        lines: An iterable of JSON lines (e.g. an open text file)
+        target: The target unit of every record, or a dictionary mapping each source unit to
+            its target unit (records whose unit is not in the dictionary are kept unchanged)
+        registry: The UnitRegistry resolving units (defaults to `Converters.registry`)
+        value_key: The field holding the value
+        unit_key: The field holding the unit, set to the target unit in converted records
+        delta: Flag indicating whether the values are deltas/intervals
+        stats: An optional StreamStats updated while converting
+
+    Yields:
+        str: The records as JSON lines, newline included: converted, or unchanged when
+            their unit can't be converted to the target. Malformed lines are left out.
+    """
+    if registry is None:
+        from Converters import registry
+    stats = StreamStats() if stats is None else stats
+    plans = {}  # source unit -> plan to its target unit, or None if it can't be converted
+    encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    for line in lines:
+        if not line.strip():
+            continue
+        stats.lines += 1
+        try:
+            record = json.loads(line)
+            unit = record[unit_key]
+            value = record[value_key]
+        except (ValueError, TypeError, KeyError):  # Invalid JSON, not an object or missing field
+            stats.skipped += 1
+            continue
+        try:
+            plan = plans[unit]
+        except KeyError:
+            plan = plans[unit] = _plan(registry, unit, target, delta)
+        except TypeError:  # Unhashable unit
+            stats.skipped += 1
+            continue
+        if not isinstance(value, Number) or isinstance(value, bool):
+            stats.skipped += 1
+            continue
+        if plan is None:
+            stats.unconverted += 1
+            yield line.rstrip("\r\n") + "\n"
+            continue
+        record[value_key] = value * plan.scale + plan.offset
+        record[unit_key] = plan.final_unit
+        stats.converted += 1
+        yield encode(record) + "\n"
+
+
+def convert_stream(source, destination, target, registry=None, value_key="value", unit_key="unit", delta=False,
+                   workers=None, chunk_size=10000, buffer_size=1 << 20):
+    """
+    Convert a JSON Lines file into another, chunk by chunk.
+
+    Args:
+        source: The path or open text file to read
+        destination: The path or open text file to write
+        target: The target unit, or a dictionary of source unit -> target unit
+        registry: The UnitRegistry resolving units (defaults to `Converters.registry`)
+        value_key: The field holding the value
+        unit_key: The field holding the unit
+        delta: Flag indicating whether the values are deltas/intervals
+        workers: Number of processes converting chunks in parallel (None converts in this
+            process). Chunks are written in input order.
+        chunk_size: Number of lines per chunk
+        buffer_size: Size in bytes of the write buffer of `destination` when it is a path
+
+    Returns:
+        StreamStats: The counters of the run
+    """
+    options = (target, value_key, unit_key, delta)
+    stats = StreamStats()
+    with _open(source, "r", -1) as reader, _open(destination, "w", buffer_size) as writer:
+        chunks = iter(lambda: list(islice(reader, chunk_size)), [])
+        if workers and workers > 1:
+            import multiprocessing
+
+            with multiprocessing.Pool(workers, _init_worker, (registry, options)) as pool:
+                # At most two chunks per worker are read ahead of the writer
+                pending = deque()
+                for chunk in chunks:
+                    if len(pending) >= 2 * workers:
+                        _write_result(writer, pending.popleft().get(), stats)
+                    pending.append(pool.apply_async(_convert_chunk, (chunk,)))
+                while pending:
+                    _write_result(writer, pending.popleft().get(), stats)
+        else:
+            for chunk in chunks:
+                writer.write("".join(convert_records(chunk, target, registry, value_key, unit_key, delta, stats)))
+    return stats
+
+
+def _write_result(writer, result, stats):
+    """
+    Write the output of a worker chunk and add its counters to `stats`.
+    """
+    output, lines, converted, unconverted, skipped = result
+    writer.write(output)
+    stats.lines += lines
+    stats.converted += converted
+    stats.unconverted += unconverted
+    stats.skipped += skipped
+
+
+def _plan(registry, unit, target, delta):
+    """
+    Return the plan converting a unit to its target, or None if it can't be converted.
+    """
+    final_unit = target.get(unit) if isinstance(target, dict) else target
+    if final_unit is None:
+        return None
+    try:
+        return registry.plan(unit, final_unit, delta)
+    except (ValueError, TypeError):
+        return None
+
+
+class _open:
+    """
+    Context manager opening a path, or passing an already open file through unclosed.
+    """
+
+    def __init__(self, file, mode, buffering):
+        self.file = file
+        self.opened = None
+        if isinstance(file, str):
+            self.opened = open(file, mode, buffering=buffering, encoding="utf-8")
+
+    def __enter__(self):
+        return self.opened or self.file
+
+    def __exit__(self, *exc_info):
+        if self.opened is not None:
+            self.opened.close()
+
+
+# Registry and options of a worker process, set by `_init_worker`
+_WORKER = {}
+
+
+def _init_worker(registry, options):
+    _WORKER["registry"] = registry
+    _WORKER["options"] = options
+
+
+def _convert_chunk(lines):
+    """
+    Convert a chunk of lines in a worker process, returning the output and the counters.
+    """
+    target, value_key, unit_key, delta = _WORKER["options"]
+    stats = StreamStats()
+    output = "".join(convert_records(lines, target, _WORKER["registry"], value_key, unit_key, delta, stats))
+    return output, stats.lines, stats.converted, stats.unconverted, stats.skipped
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Convert the values of a JSON Lines feed to a target unit")
+    parser.add_argument("source", help="File to read")
+    parser.add_argument("destination", help="File to write")
+    parser.add_argument("--to", dest="target", required=True, help="Target unit of every record")
+    parser.add_argument("--value-key", default="value", help="Field holding the value")
+    parser.add_argument("--unit-key", default="unit", help="Field holding the unit")
+    parser.add_argument("--delta", action="store_true", help="Convert deltas/intervals")
+    parser.add_argument("--workers", type=int, default=None, help="Processes converting chunks in parallel")
+    arguments = parser.parse_args()
+    stats = convert_stream(arguments.source, arguments.destination, arguments.target,
+                           value_key=arguments.value_key, unit_key=arguments.unit_key,
+                           delta=arguments.delta, workers=arguments.workers)
+    print(f"{stats.converted} records converted, {stats.unconverted} kept unchanged, {stats.skipped} lines skipped")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Result Memoization Module
+
+This module implements the bounded, thread-safe cache used by `Converter.enable_memo`
+to skip repeated scalar conversions (same value, units and delta flag) entirely.
+"""
+
+import threading
+import time
+from collections import OrderedDict
+
+
+class ResultCache:
+    """
+    A bounded least-recently-used cache with optional time-to-live and statistics.
+
+    Attributes:
+        maxsize (int): Maximum number of entries; the least recently used entry is
+            evicted when the cache is full.
+        ttl (float): Lifetime of an entry in seconds, or None for no expiration.
+        hits (int): Number of lookups answered from the cache
+        misses (int): Number of lookups not found (or expired) in the cache
+        evictions (int): Number of entries removed because the cache was full or expired
+    """
+
+    def __init__(self, maxsize=1024, ttl=None):
+        """
+        Initialize an empty ResultCache.
+
+        Raises:
+            ValueError: If maxsize is not positive or ttl is negative
+        """
+        if maxsize <= 0:
+            raise ValueError("maxsize must be a positive integer")
+        if ttl is not None and ttl < 0:
+            raise ValueError("ttl must be positive or None")
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        """
+        Return the value stored for `key`, or `default` if it is missing or expired.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, expires = entry
+                if expires is None or expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return value
+                del self._entries[key]
+                self.evictions += 1
+            self.misses += 1
+            return default
+
+    def put(self, key, value):
+        """
+        Store `value` for `key`, evicting the least recently used entry if the cache is full.
+        """
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            self._entries[key] = (value, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self):
+        """
+        Remove every entry. Statistics are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        """
+        Return a dictionary with the hits, misses, evictions and current size of the cache.
+        """
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "evictions": self.evictions,
+                    "size": len(self._entries), "maxsize": self.maxsize}
+
+    def __len__(self):
+        return len(self._entries)
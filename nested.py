@@ -0,0 +1,240 @@
+"""
+Nested Traversal Module
+
+This module compiles JSONPath-like selectors into reusable traversal plans used by
+`Converter.convert_nested` to convert values inside nested dictionaries and lists.
+
+Supported selectors:
+    - "$" the root of the document (optional)
+    - ".key" or "['key']" a dictionary key
+    - "[0]" a list index (negative indexes count from the end)
+    - ".*" or "[*]" every key of a dictionary or every item of a list
+
+Several selectors are merged into a single tree of steps, so a document is walked
+only once whatever the number of selectors.
+"""
+
+import copy
+import re
+from collections.abc import Mapping, MutableMapping, MutableSequence, Sequence
+from numbers import Number
+from typing import Callable, Iterable
+
+# Wildcard step, matching every key or item of a container
+WILDCARD = "*"
+
+_STEP_RE = re.compile(r"""\.(\*|[^.\[\]]+)|\[(\*|-?\d+|'[^']*'|"[^"]*")\]""")
+
+# Compiled plans indexed by their tuple of selectors
+_PLANS = {}
+
+
+class TraversalPlan:
+    """
+    A compiled set of selectors, stored as a tree of steps.
+
+    Attributes:
+        paths (tuple): The selectors the plan was compiled from
+        tree (dict): Nested dictionaries mapping a step (key, index or WILDCARD) to the
+            subtree of the following steps. A `None` subtree marks a selected value.
+    """
+
+    def __init__(self, paths, tree):
+        self.paths = paths
+        self.tree = tree
+
+    def apply(self, document, function: Callable, inplace=False):
+        """
+        Apply `function` to every value selected by the plan.
+
+        Args:
+            document: Nested dictionaries and lists
+            function: Called with each selected value and the `inplace` flag, returns
+                the value to store in its place
+            inplace: Whether to update the containers of `document` instead of copying them
+
+        Returns:
+            The updated document. Without `inplace`, only the containers along the
+            selected paths are copied; the rest of the document is shared.
+        """
+        return _apply_tree(document, self.tree, function, inplace)
+
+
+def compile_paths(paths: Iterable[str]) -> TraversalPlan:
+    """
+    Compile JSONPath-like selectors into a cached TraversalPlan.
+
+    Raises:
+        ValueError: If a selector is malformed
+    """
+    paths = (paths,) if isinstance(paths, str) else tuple(paths)
+    try:
+        return _PLANS[paths]
+    except KeyError:
+        pass
+    tree = {}
+    for path in paths:
+        steps = _parse(path)
+        if not steps:
+            raise ValueError(f"Selector '{path}' doesn't select any value below the root")
+        node = tree
+        for step in steps[:-1]:
+            child = node.get(step)
+            if child is None:
+                child = node[step] = {}
+            node = child
+        # A selected value is a leaf, even if a longer selector goes through it
+        node[steps[-1]] = None
+    _merge_wildcards(tree)
+    return _PLANS.setdefault(paths, TraversalPlan(paths, tree))
+
+
+def convert_leaves(document, function: Callable, inplace=False):
+    """
+    Apply `function` to every number (except booleans) found in a nested document.
+    """
+    if isinstance(document, Mapping):
+        items = document.items()
+    elif isinstance(document, Sequence) and not isinstance(document, (str, bytes)):
+        items = enumerate(document)
+    elif isinstance(document, Number) and not isinstance(document, bool):
+        return function(document, False)
+    else:
+        return document
+    container = document if inplace and _is_mutable(document) else _copy(document)
+    for key, value in list(items):
+        container[key] = convert_leaves(value, function, inplace)
+    return _freeze(container, document)
+
+
+def _parse(path):
+    """
+    Parse a selector into a tuple of steps.
+    """
+    text = path.strip()
+    if text.startswith("$"):
+        text = text[1:]
+    elif text and text[0] not in ".[":
+        text = "." + text
+    steps = []
+    position = 0
+    for match in _STEP_RE.finditer(text):
+        if match.start() != position:
+            break
+        position = match.end()
+        name, bracket = match.groups()
+        if name is not None:
+            steps.append(name)
+        elif bracket == WILDCARD:
+            steps.append(WILDCARD)
+        elif bracket[0] in "'\"":
+            steps.append(bracket[1:-1])
+        else:
+            steps.append(int(bracket))
+    if position != len(text):
+        raise ValueError(f"Invalid selector: '{path}'")
+    return tuple(steps)
+
+
+def _merge_wildcards(tree):
+    """
+    Merge the wildcard subtree of every node into its explicit siblings, so a value
+    matched both by a key and by a wildcard is visited (and converted) only once.
+    """
+    wildcard = tree.get(WILDCARD, False)
+    for step, subtree in list(tree.items()):
+        if step != WILDCARD and wildcard is not False:
+            subtree = tree[step] = _merge(subtree, wildcard)
+        if subtree is not None:
+            _merge_wildcards(subtree)
+
+
+def _merge(first, second):
+    """
+    Merge two subtrees. A selected value (None) stays selected.
+    """
+    if first is None or second is None:
+        return None
+    merged = dict(first)
+    for step, subtree in second.items():
+        merged[step] = _merge(merged[step], subtree) if step in merged else subtree
+    return merged
+
+
+def _apply_tree(document, tree, function, inplace):
+    """
+    Walk `document` following `tree`, applying `function` to the selected values.
+    """
+    if isinstance(document, Mapping):
+        is_sequence = False
+    elif isinstance(document, Sequence) and not isinstance(document, (str, bytes)):
+        is_sequence = True
+    else:
+        return document
+    container = None
+    for key, subtree in _matches(document, tree, is_sequence):
+        value = document[key]
+        if subtree is None:
+            converted = function(value, inplace)
+        else:
+            converted = _apply_tree(value, subtree, function, inplace)
+        if converted is value and not inplace:
+            continue
+        if container is None:
+            container = document if inplace and _is_mutable(document) else _copy(document)
+        container[key] = converted
+    if container is None:
+        return document
+    return _freeze(container, document)
+
+
+def _matches(document, tree, is_sequence):
+    """
+    Yield the (key, subtree) pairs of `tree` matching the keys or indexes of `document`.
+    """
+    selected = set()
+    for step, subtree in tree.items():
+        if step == WILDCARD:
+            continue
+        if is_sequence:
+            if isinstance(step, str) and step.lstrip("-").isdigit():
+                step = int(step)
+            if isinstance(step, int) and -len(document) <= step < len(document):
+                selected.add(step % len(document))
+                yield step % len(document), subtree
+        elif step in document:
+            selected.add(step)
+            yield step, subtree
+    # Keys selected explicitly already include the wildcard subtree (see `_merge_wildcards`)
+    if WILDCARD in tree:
+        keys = range(len(document)) if is_sequence else list(document)
+        for key in keys:
+            if key not in selected:
+                yield key, tree[WILDCARD]
+
+
+def _is_mutable(container):
+    """
+    Return True if a container can be updated in place.
+    """
+    return isinstance(container, (MutableMapping, MutableSequence))
+
+
+def _copy(container):
+    """
+    Return a mutable shallow copy of a container.
+    """
+    if _is_mutable(container):
+        return copy.copy(container)
+    if isinstance(container, Mapping):
+        return dict(container)
+    return list(container)
+
+
+def _freeze(container, original):
+    """
+    Give a copied container back the type of the original for immutable sequences.
+    """
+    if isinstance(original, MutableSequence) or isinstance(original, Mapping) or container is original:
+        return container
+    return type(original)(container)
@@ -0,0 +1,374 @@
+"""
+Quantity Module
+
+This module defines values carrying their unit:
+
+    - `Quantity`: a single number, its unit and the converter defining the unit
+    - `QuantityArray`: many numbers in one unit, stored in an `array('d')` or a NumPy array
+
+Both types use `__slots__`, so a quantity costs three references instead of an instance
+dictionary. A QuantityArray converts lazily: `to()` only records the affine map from the
+stored values to the new unit, chained calls fuse their maps (see `ConversionPlan.compose`),
+and the values are converted in a single pass when they are read.
+
+Example Usage:
+    >>> from Converters import Temperature
+    >>> from quantity import Quantity, QuantityArray
+    >>> Quantity(25, "ºC", Temperature).to("K")
+    Quantity(298.15, 'K')
+    >>> readings = QuantityArray([20.0, 25.0], "ºC", Temperature)
+    >>> readings.to("K").to("°F").tolist()   # One multiplication and one addition per value
+    [68.0, 77.0]
+"""
+
+from array import array
+from numbers import Number
+
+from base_class import _FLIPPED, ConversionPlan, _is_array, _numpy
+
+
+class Quantity:
+    """
+    A number in a unit.
+
+    Arithmetic and comparisons with another quantity convert only the other operand, to
+    this quantity's unit (as an absolute value, not as a delta/interval). Quantities are
+    mutable and therefore not hashable.
+
+    Attributes:
+        value (Number): The number
+        unit (str): The unit of the number
+        converter (Converter): The converter defining the unit
+    """
+
+    __slots__ = ("value", "unit", "converter")
+
+    def __init__(self, value, unit, converter):
+        """
+        Raises:
+            ValueError: If the unit is not in the converter's units
+            TypeError: If the value is not a number
+        """
+        if not isinstance(value, Number):
+            raise TypeError("type not supported")
+        if unit not in converter.units:
+            raise ValueError(f"Invalid unit: {unit}")
+        self.value = value
+        self.unit = unit
+        self.converter = converter
+
+    def to(self, unit, delta=False):
+        """
+        Return this quantity converted to another unit.
+
+        Raises:
+            ValueError: If the unit is not in the converter's units
+        """
+        if unit == self.unit and not delta:
+            return self
+        return Quantity(self.converter.plan(self.unit, unit, delta)(self.value), unit, self.converter)
+
+    def _magnitude(self, other):
+        """
+        Return the value of another quantity in this quantity's unit, or the number itself.
+        """
+        if isinstance(other, Quantity):
+            if other.converter is not self.converter:
+                raise ValueError("Cannot combine quantities of different converters")
+            if other.unit == self.unit:
+                return other.value
+            return self.converter.plan(other.unit, self.unit)(other.value)
+        if isinstance(other, Number):
+            return other
+        return NotImplemented
+
+    def __eq__(self, other):
+        if not isinstance(other, Quantity) or other.converter is not self.converter:
+            return NotImplemented
+        return self.value == self._magnitude(other)
+
+    def __lt__(self, other):
+        other = self._magnitude(other)
+        return NotImplemented if other is NotImplemented else self.value < other
+
+    def __le__(self, other):
+        other = self._magnitude(other)
+        return NotImplemented if other is NotImplemented else self.value <= other
+
+    def __gt__(self, other):
+        other = self._magnitude(other)
+        return NotImplemented if other is NotImplemented else self.value > other
+
+    def __ge__(self, other):
+        other = self._magnitude(other)
+        return NotImplemented if other is NotImplemented else self.value >= other
+
+    __hash__ = None
+
+    def __add__(self, other):
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        return Quantity(self.value + self._magnitude(other), self.unit, self.converter)
+
+    def __sub__(self, other):
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        return Quantity(self.value - self._magnitude(other), self.unit, self.converter)
+
+    def __mul__(self, other):
+        if not isinstance(other, Number):
+            return NotImplemented
+        return Quantity(self.value * other, self.unit, self.converter)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if isinstance(other, Quantity):
+            # Ratio of two quantities: a plain number
+            return self.value / self._magnitude(other)
+        if not isinstance(other, Number):
+            return NotImplemented
+        return Quantity(self.value / other, self.unit, self.converter)
+
+    def __neg__(self):
+        return Quantity(-self.value, self.unit, self.converter)
+
+    def __abs__(self):
+        return Quantity(abs(self.value), self.unit, self.converter)
+
+    def __float__(self):
+        return float(self.value)
+
+    def __repr__(self):
+        return f"Quantity({self.value!r}, {self.unit!r})"
+
+
+class QuantityArray:
+    """
+    Numbers in a unit, converted lazily.
+
+    The stored values stay in the unit they were created in. Conversions and arithmetic
+    with numbers or quantities are folded into one pending affine map, applied when the
+    values are read (`values`, `tolist`, iteration), after which the converted values
+    replace the stored ones. Comparisons never convert the values: the other operand is
+    converted to the unit of the stored values instead (see `Converter.mask`).
+
+    Attributes:
+        unit (str): The unit of the array
+        converter (Converter): The converter defining the unit
+    """
+
+    __slots__ = ("_values", "_pending", "unit", "converter")
+
+    def __init__(self, values, unit, converter):
+        """
+        Args:
+            values: A NumPy array (kept as a float64 array) or an iterable of numbers
+                (stored in an `array('d')`)
+            unit: The unit of the values
+            converter: The converter defining the unit
+
+        Raises:
+            ValueError: If the unit is not in the converter's units
+            TypeError: If a value is not a number
+        """
+        if unit not in converter.units:
+            raise ValueError(f"Invalid unit: {unit}")
+        if _is_array(values):
+            values = values.astype(_numpy().float64, copy=False)
+        elif not isinstance(values, array) or values.typecode != "d":
+            try:
+                values = array("d", values)
+            except TypeError:
+                raise TypeError("type not supported")
+        self._values = values
+        # ConversionPlan from the stored values to `unit`, or None if they are in `unit`
+        self._pending = None
+        self.unit = unit
+        self.converter = converter
+
+    @classmethod
+    def _lazy(cls, values, pending, unit, converter):
+        """
+        Build an array sharing stored values, with a pending map to `unit`.
+        """
+        result = cls.__new__(cls)
+        result._values = values
+        result._pending = pending
+        result.unit = unit
+        result.converter = converter
+        return result
+
+    def _map(self):
+        """
+        Return the pending map, or an identity map from the unit to itself.
+        """
+        if self._pending is not None:
+            return self._pending
+        return ConversionPlan(self.unit, self.unit, 1, 0)
+
+    def _with_map(self, scale, offset):
+        """
+        Return an array in the same unit whose pending map is followed by `x * scale + offset`.
+        """
+        plan = self._map()
+        pending = ConversionPlan(plan.origin_unit, self.unit, plan.scale * scale, plan.offset * scale + offset)
+        return QuantityArray._lazy(self._values, pending, self.unit, self.converter)
+
+    def to(self, unit):
+        """
+        Return this array in another unit, without converting anything yet.
+
+        Raises:
+            ValueError: If the unit is not in the converter's units
+        """
+        plan = self.converter.plan(self.unit, unit)
+        pending = plan if self._pending is None else self._pending.compose(plan)
+        return QuantityArray._lazy(self._values, pending, unit, self.converter)
+
+    @property
+    def values(self):
+        """
+        The values in `unit`, as an `array('d')` or a NumPy array.
+
+        Applies the pending map in one pass the first time the values are read.
+        """
+        plan = self._pending
+        if plan is not None:
+            if _is_array(self._values):
+                values = self._values * plan.scale
+                if plan.offset:
+                    values += plan.offset
+            else:
+                # Pending plans are built by every `to()`, so generating code for them
+                # (`ConversionPlan.compile`) would cost more than the pass it speeds up
+                scale, offset = plan.scale, plan.offset
+                values = array("d", [x * scale + offset for x in self._values])
+            self._values = values
+            self._pending = None
+        return self._values
+
+    def tolist(self):
+        """
+        Return the values in `unit` as a list of floats.
+        """
+        return self.values.tolist()
+
+    def __len__(self):
+        return len(self._values)
+
+    def __getitem__(self, index):
+        """
+        Return one value as a Quantity, converting only that value.
+        """
+        if isinstance(index, slice):
+            return QuantityArray._lazy(self._values[index], self._pending, self.unit, self.converter)
+        value = float(self._values[index])
+        if self._pending is not None:
+            value = self._pending(value)
+        return Quantity(value, self.unit, self.converter)
+
+    def __iter__(self):
+        unit, converter = self.unit, self.converter
+        for value in self.values:
+            yield Quantity(float(value), unit, converter)
+
+    def _threshold(self, other):
+        """
+        Return (number, unit) of a scalar operand, or None if it is not a scalar.
+        """
+        if isinstance(other, Quantity):
+            if other.converter is not self.converter:
+                raise ValueError("Cannot combine quantities of different converters")
+            return other.value, other.unit
+        if isinstance(other, Number):
+            return other, self.unit
+        return None
+
+    def _compare(self, op, other):
+        threshold = self._threshold(other)
+        if threshold is None:
+            return NotImplemented
+        value, unit = threshold
+        pending = self._pending
+        if pending is None:
+            return self.converter.mask(self._values, self.unit, op, value, unit)
+        if not pending.scale:
+            return self.converter.mask(self.values, self.unit, op, value, unit)
+        # y = x * scale + offset compares with t as x compares with (t - offset) / scale,
+        # in reverse order when the scale is negative
+        value = (self.converter.plan(unit, self.unit)(value) - pending.offset) / pending.scale
+        if pending.scale < 0:
+            op = _FLIPPED[op]
+        return self.converter.mask(self._values, pending.origin_unit, op, value)
+
+    def __lt__(self, other):
+        return self._compare("<", other)
+
+    def __le__(self, other):
+        return self._compare("<=", other)
+
+    def __gt__(self, other):
+        return self._compare(">", other)
+
+    def __ge__(self, other):
+        return self._compare(">=", other)
+
+    def __eq__(self, other):
+        return self._compare("==", other)
+
+    def __ne__(self, other):
+        return self._compare("!=", other)
+
+    __hash__ = None
+
+    def __add__(self, other):
+        if isinstance(other, QuantityArray):
+            return self._combine(other, 1)
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        value, unit = self._threshold(other)
+        return self._with_map(1, self.converter.plan(unit, self.unit)(value))
+
+    def __sub__(self, other):
+        if isinstance(other, QuantityArray):
+            return self._combine(other, -1)
+        if not isinstance(other, Quantity):
+            return NotImplemented
+        value, unit = self._threshold(other)
+        return self._with_map(1, -self.converter.plan(unit, self.unit)(value))
+
+    def __mul__(self, other):
+        if not isinstance(other, Number):
+            return NotImplemented
+        return self._with_map(other, 0)
+
+    __rmul__ = __mul__
+
+    def __truediv__(self, other):
+        if not isinstance(other, Number):
+            return NotImplemented
+        return self._with_map(1 / other, 0)
+
+    def __neg__(self):
+        return self._with_map(-1, 0)
+
+    def _combine(self, other, sign):
+        """
+        Add or subtract another array element-wise, converting it to this array's unit.
+        """
+        if other.converter is not self.converter:
+            raise ValueError("Cannot combine quantities of different converters")
+        if len(other) != len(self):
+            raise ValueError(f"Length mismatch: {len(self)} != {len(other)}")
+        first, second = self.values, other.to(self.unit).values
+        if _is_array(first):
+            values = first + sign * _numpy().asarray(second)
+        else:
+            values = array("d", [x + sign * y for x, y in zip(first, second)])
+        return QuantityArray(values, self.unit, self.converter)
+
+    def __repr__(self):
+        pending = "" if self._pending is None else ", pending"
+        return f"QuantityArray(<{len(self)} values>, {self.unit!r}{pending})"
+
@@ -0,0 +1,324 @@
+"""
+Unit Registry Module
+
+This module implements a registry that indexes converters by physical dimension,
+so a unit can be resolved to its converter with a single dictionary lookup, and
+values can be converted between units of different converters that share a
+dimension (for example "acre" from Area and the compound expression "ft^2").
+
+Example Usage:
+    >>> from Converters import registry
+    >>> registry.convert(1, "acre", "ft^2")
+    43560.0
+"""
+
+import tables
+from base_class import Converter
+from compound import CompoundConverter, CompoundResolver, _CompoundUnits
+
+
+class UnitRegistry:
+    """
+    Index of converters by dimension with cached cross-converter resolution.
+
+    Every registered converter is tagged with a dimension. All the converters sharing a
+    dimension are merged into a single dimension converter whose base unit is the SI
+    base of that dimension, so any pair of units of the same dimension converts with one
+    affine plan, cached by the dimension converter.
+
+    Attributes:
+        resolver (CompoundResolver): Resolver used for dimensions and compound expressions.
+        converters (Dict[str, Converter]): Registered converters indexed by name.
+        dimensions (Dict[str, tuple]): Dimension of each registered converter.
+    """
+
+    def __init__(self, resolver: CompoundResolver = None):
+        """
+        Initialize an empty UnitRegistry.
+
+        Args:
+            resolver: An optional CompoundResolver. Without it, each converter is its own
+                dimension and compound expressions are not resolved.
+        """
+        self.resolver = resolver
+        self.converters = {}
+        self.dimensions = {}
+        self._bases = {}  # name -> base unit expression given to register
+        self._base_scales = {}  # name -> number of converter base units per SI base unit
+        self._owners = {}  # dimension -> first converter registered with it
+        self._merged = {}  # dimension -> Converter merging every converter of that dimension
+        self._index = {}  # unit -> tuple of dimensions defining it
+        self._routes = {}  # (origin_unit, final_unit) -> dimension converter
+
+    def register(self, name: str, converter: Converter, base: str = None):
+        """
+        Register a converter.
+
+        Args:
+            name: The name of the converter (e.g. "Length")
+            converter: The converter to register
+            base: Expression of the converter's base unit in terms of the resolver
+                (e.g. "dm^3" for a converter based on liters). When omitted, the
+                converter defines its own dimension, named after it.
+
+        Raises:
+            ValueError: If the name is already registered or the base cannot be resolved
+        """
+        if name in self.converters:
+            raise ValueError(f"Converter '{name}' is already registered")
+        if base is None:
+            dimension, base_scale = ((name, 1),), 1
+        else:
+            if self.resolver is None:
+                raise ValueError("A resolver is required to register a converter with a base unit")
+            base_scale, dimension = self.resolver.resolve(base)
+
+        if dimension not in self._merged:
+            units = _CompoundUnits(self.resolver, dimension) if base is not None else {}
+            self._merged[dimension] = Converter(units)
+            self._owners[dimension] = converter
+        self.converters[name] = converter
+        self.dimensions[name] = dimension
+        self._bases[name] = base
+        self._base_scales[name] = base_scale
+        self._index_units(name, converter.units)
+        self._routes.clear()
+
+    def _state(self):
+        """
+        Return the registered bases and the indexes of the registry as plain data (see `snapshot.py`).
+        """
+        owners = {}
+        for name, converter in self.converters.items():
+            if self._owners[self.dimensions[name]] is converter:
+                owners.setdefault(self.dimensions[name], name)
+        return {
+            "names": list(self.converters),
+            "dimensions": dict(self.dimensions),
+            "bases": dict(self._bases),
+            "base_scales": dict(self._base_scales),
+            "owners": owners,
+            "merged": {dimension: (isinstance(merged.units, _CompoundUnits), dict(merged.units))
+                       for dimension, merged in self._merged.items()},
+            "index": dict(self._index),
+        }
+
+    @classmethod
+    def _from_state(cls, resolver, converters, state):
+        """
+        Rebuild a registry from `_state` and the converters it was built with, without
+        indexing their units again.
+        """
+        registry = cls(resolver)
+        registry.converters = {name: converters[name] for name in state["names"]}
+        registry.dimensions = state["dimensions"]
+        registry._bases = state["bases"]
+        registry._base_scales = state["base_scales"]
+        registry._owners = {dimension: converters[name] for dimension, name in state["owners"].items()}
+        for dimension, (compound, units) in state["merged"].items():
+            table = _CompoundUnits(resolver, dimension) if compound else {}
+            dict.update(table, units)
+            registry._merged[dimension] = Converter._from_normalized(table)
+        registry._index = state["index"]
+        return registry
+
+    def load(self, path, replace=False):
+        """
+        Load a JSON or TOML registry file mapping converter names to unit tables.
+
+        Tables of registered converters are merged into them (see `Converter.merge`), and
+        what depends on a merged table is rebuilt as after a `reload`.
+        Tables of new converters create and register a Converter, using the optional
+        "base" entry of the table as its base unit expression.
+
+        Args:
+            path: The path of the registry file (see `tables.py` for the layout)
+            replace: Whether merged units may replace units defined with another value
+
+        Returns:
+            A dictionary mapping each converter name to the list of units added or replaced
+
+        Raises:
+            ValueError: If a table is invalid or conflicts with existing units
+        """
+        loaded = {}
+        for name, data in tables.read(path).items():
+            units, aliases = tables.split_table(data)
+            if name in self.converters:
+                loaded[name] = self.converters[name].merge(units, aliases, replace)
+                if loaded[name]:
+                    self._invalidate(name)
+            else:
+                converter = Converter._from_normalized(tables.normalize(units, aliases))
+                self.register(name, converter, base=data.get("base") if "units" in data else None)
+                loaded[name] = list(converter.units)
+        return loaded
+
+    def reload(self, name, units, aliases=None):
+        """
+        Atomically replace the unit table of a registered converter (see `Converter.reload`).
+
+        The dimension converters are rebuilt aside and swapped in as well, keeping the cached
+        plans of unchanged units. Reloading a table used by the resolver (such as Length)
+        drops the memoized compound expressions, and the expressions of the registered
+        CompoundConverters (such as Speed) are resolved again from the new table.
+
+        Args:
+            name: The name of the registered converter
+            units: Dictionary of unit values, or the path of a JSON or TOML table file
+            aliases: Dictionary mapping alias names to units of the new table
+
+        Returns:
+            The list of units of the converter whose value changed or that were removed
+
+        Raises:
+            ValueError: If the converter is not registered or the new table is invalid
+        """
+        if name not in self.converters:
+            raise ValueError(f"Converter '{name}' is not registered")
+        changed = self.converters[name].reload(units, aliases)
+        self._invalidate(name)
+        return changed
+
+    def _invalidate(self, name):
+        """
+        Rebuild everything derived from the table of a registered converter after it changed.
+
+        The dimension converter of the converter is rebuilt. When the table is used by the
+        resolver, the memoized compound expressions, the tables of the CompoundConverters
+        sharing the resolver and the base scales are resolved again, and every dimension
+        converter is rebuilt.
+        """
+        converter = self.converters[name]
+        dimensions = [self.dimensions[name]]
+        if self.resolver is not None and any(table is converter for table in self.resolver.tables.values()):
+            self.resolver.clear()
+            # Compound converters memoize their resolved expressions in their own tables
+            for other in self.converters.values():
+                if isinstance(other, CompoundConverter) and other.resolver is self.resolver:
+                    other.refresh()
+            for other, base in self._bases.items():
+                if base is not None:
+                    self._base_scales[other] = self.resolver.scale(base)
+            dimensions = list(self._merged)
+        for dimension in dimensions:
+            self._rebuild(dimension)
+        self._routes = {}
+
+    def _index_units(self, name, units):
+        """
+        Add the units of a registered converter to the index and to its dimension converter.
+        """
+        dimension, base_scale = self.dimensions[name], self._base_scales[name]
+        merged = self._merged[dimension]
+        table = merged.units.copy()
+        changed = []
+        for unit, (scale, offset) in units.items():
+            value = (scale * base_scale, offset)
+            # The first converter defining a unit keeps it within a dimension
+            if self._owners[dimension] is self.converters[name] or not dict.__contains__(table, unit):
+                if dict.get(table, unit, value) != value:
+                    changed.append(unit)
+                dict.__setitem__(table, unit, value)
+            dimensions = self._index.get(unit, ())
+            if dimension not in dimensions:
+                self._index[unit] = dimensions + (dimension,)
+        merged._swap_units(table, changed)
+
+    def _rebuild(self, dimension):
+        """
+        Rebuild the table of a dimension converter from its registered converters and swap it in.
+        """
+        merged = self._merged[dimension]
+        current = merged.units
+        table = _CompoundUnits(self.resolver, dimension) if isinstance(current, _CompoundUnits) else {}
+        # Converters are visited in registration order, so the first one defining a unit keeps it
+        for name, converter in self.converters.items():
+            if self.dimensions[name] == dimension:
+                base_scale = self._base_scales[name]
+                for unit, (scale, offset) in converter.units.items():
+                    dict.setdefault(table, unit, (scale * base_scale, offset))
+        for unit in set(dict.keys(current)) - set(dict.keys(table)):
+            dimensions = tuple(other for other in self._index.get(unit, ()) if other != dimension)
+            if dimensions:
+                self._index[unit] = dimensions
+            else:
+                self._index.pop(unit, None)
+        for unit in dict.keys(table):
+            dimensions = self._index.get(unit, ())
+            if dimension not in dimensions:
+                self._index[unit] = dimensions + (dimension,)
+        merged._swap_units(table, [unit for unit, value in dict.items(current) if dict.get(table, unit) != value])
+
+    def converter_for(self, unit: str) -> Converter:
+        """
+        Return the registered converter defining a unit.
+
+        Compound expressions resolve to the first converter registered with their dimension.
+
+        Raises:
+            ValueError: If the unit is unknown or defined by converters of different dimensions
+        """
+        return self._owners[self.dimension_of(unit)]
+
+    def dimension_of(self, unit: str) -> tuple:
+        """
+        Return the dimension of a unit or compound expression.
+
+        Raises:
+            ValueError: If the unit is unknown or defined by converters of different dimensions
+        """
+        dimensions = self._dimensions(unit)
+        if len(dimensions) > 1:
+            raise ValueError(f"Ambiguous unit: {unit}")
+        return dimensions[0]
+
+    def convert(self, value, origin_unit, final_unit, delta=False, inplace=False):
+        """
+        Convert a value or collection between any two units of the same dimension.
+
+        Accepts the same values and options as `Converter.convert`.
+
+        Raises:
+            ValueError: If a unit is unknown or the units have different dimensions
+        """
+        return self._route(origin_unit, final_unit).convert(value, origin_unit, final_unit, delta, inplace)
+
+    def plan(self, origin_unit, final_unit, delta=False):
+        """
+        Return the cached ConversionPlan between any two units of the same dimension.
+        """
+        return self._route(origin_unit, final_unit).plan(origin_unit, final_unit, delta)
+
+    def _route(self, origin_unit, final_unit):
+        """
+        Return the dimension converter handling a pair of units, caching the result.
+        """
+        try:
+            return self._routes[origin_unit, final_unit]
+        except KeyError:
+            pass
+        shared = [dimension for dimension in self._dimensions(origin_unit)
+                  if dimension in self._dimensions(final_unit)]
+        if not shared:
+            raise ValueError(f"Incompatible units: {origin_unit}, {final_unit}")
+        if len(shared) > 1:
+            raise ValueError(f"Ambiguous units: {origin_unit}, {final_unit}")
+        return self._routes.setdefault((origin_unit, final_unit), self._merged[shared[0]])
+
+    def _dimensions(self, unit):
+        """
+        Return the dimensions a unit belongs to, resolving compound expressions if needed.
+        """
+        dimensions = self._index.get(unit)
+        if dimensions:
+            return dimensions
+        if self.resolver is not None:
+            try:
+                dimension = self.resolver.dimension(unit)
+            except ValueError:
+                pass
+            else:
+                if dimension in self._merged:
+                    return (dimension,)
+        raise ValueError(f"Invalid unit: {unit}")
@@ -0,0 +1,254 @@
+"""
+Shared Unit Tables Module
+
+This module publishes normalized unit tables into a single block of shared memory, so
+the worker processes of a pool attach to them instead of each one building and holding
+its own copy of every table.
+
+The block holds a marshal index ({table: {unit: row}}) followed by one row of
+three float64 values per unit: scale factor, offset and reciprocal of the scale factor.
+Workers get FrozenConverters whose units are read in place from the block.
+
+Requires Python 3.8+ (`multiprocessing.shared_memory`).
+
+Example Usage:
+    >>> import shared
+    >>> from Converters import registry
+    >>> tables = shared.publish(registry.converters)   # in the parent process
+    >>> attached = shared.attach(tables.name)           # in each worker
+    >>> attached["Length"].convert(1500, "m", "km")
+    1.5
+"""
+
+import marshal
+import struct
+from array import array
+from collections.abc import Mapping
+
+try:
+    from multiprocessing import resource_tracker, shared_memory
+except ImportError:  # Python < 3.8
+    resource_tracker = None
+    shared_memory = None
+
+from base_class import FrozenConverter
+
+MAGIC = b"UCST"
+VERSION = 1
+
+# magic, version, length of the marshal index
+_HEADER = struct.Struct("<4sII")
+
+# float64 values stored per unit: scale factor, offset, reciprocal of the scale factor
+_ROW = 3
+
+
+class SharedUnits(Mapping):
+    """
+    Read-only mapping of units to (scale_factor, offset) tuples stored in shared memory.
+    """
+
+    __slots__ = ("_index", "_values", "_column", "_block")
+
+    def __init__(self, index, block, column=0):
+        self._index = index
+        self._values = block.values
+        self._column = column
+        # Keeps the block attached while a converter uses it
+        self._block = block
+
+    def __getitem__(self, unit):
+        position = self._index[unit] * _ROW
+        if self._column:
+            return self._values[position + self._column]
+        return self._values[position], self._values[position + 1]
+
+    def __contains__(self, unit):
+        return unit in self._index
+
+    def __iter__(self):
+        return iter(self._index)
+
+    def __len__(self):
+        return len(self._index)
+
+    def __reduce__(self):
+        # Pickled (e.g. with a FrozenConverter) as a plain copy of the table
+        return dict, (dict(self.items()),)
+
+
+class _Block:
+    """
+    An attached shared memory block and the float64 view of its rows.
+    """
+
+    __slots__ = ("memory", "values")
+
+    def __init__(self, memory, values):
+        self.memory = memory
+        self.values = values
+
+    def close(self):
+        if self.values is not None:
+            # The view must be released before the memory map can be closed
+            self.values.release()
+            self.values = None
+            self.memory.close()
+
+    __del__ = close
+
+
+class SharedTables(Mapping):
+    """
+    The converters of a shared memory block, indexed by table name.
+
+    Attributes:
+        name (str): Name of the shared memory block, passed to `attach` in workers
+    """
+
+    def __init__(self, memory, owner):
+        self._memory = memory
+        self._owner = owner
+        self.name = memory.name
+        buffer = memory.buf
+        magic, version, index_length = _HEADER.unpack_from(buffer)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"Shared memory block '{memory.name}' doesn't hold unit tables")
+        index = marshal.loads(buffer[_HEADER.size:_HEADER.size + index_length])
+        self._block = _Block(memory, buffer[_data_offset(index_length):].cast("d"))
+        self._converters = {
+            table: _frozen(SharedUnits(units, self._block), SharedUnits(units, self._block, 2))
+            for table, units in index.items()
+        }
+
+    def __getitem__(self, table):
+        return self._converters[table]
+
+    def __iter__(self):
+        return iter(self._converters)
+
+    def __len__(self):
+        return len(self._converters)
+
+    def close(self):
+        """
+        Detach from the block. The converters can't be used afterwards.
+
+        Without an explicit call, the block is detached once the tables and all their
+        converters are garbage collected.
+        """
+        self._converters = {}
+        self._block.close()
+
+    def unlink(self):
+        """
+        Close and destroy the block. Only the publishing process should call it.
+        """
+        self.close()
+        self._memory.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        if self._owner:
+            self.unlink()
+        else:
+            self.close()
+
+
+def publish(converters, name=None):
+    """
+    Publish the tables of several converters into a new shared memory block.
+
+    Only the units present in each table are published: compound expressions of a
+    CompoundConverter that were never resolved are not available to the workers.
+
+    Args:
+        converters: A mapping of table names to converters (e.g. `registry.converters`)
+        name: Optional name of the block (a random name is chosen by default)
+
+    Returns:
+        SharedTables: The published tables. The publishing process owns the block and
+            must call `unlink` once the workers are done.
+
+    Raises:
+        ImportError: If shared memory is not available (Python < 3.8)
+        ValueError: If a scale factor is zero
+    """
+    _require()
+    index = {}
+    rows = array("d")
+    for table, converter in converters.items():
+        units = {}
+        for unit, (scale, offset) in converter.units.items():
+            if not scale:
+                raise ValueError(f"Unit '{unit}' of '{table}' has a null scale factor")
+            units[unit] = len(rows) // _ROW
+            rows.extend((scale, offset, 1 / scale))
+        index[table] = units
+    index_blob = marshal.dumps(index)
+    offset = _data_offset(len(index_blob))
+    data = memoryview(rows).cast("B")
+    memory = shared_memory.SharedMemory(name=name, create=True, size=offset + len(data))
+    try:
+        buffer = memory.buf
+        _HEADER.pack_into(buffer, 0, MAGIC, VERSION, len(index_blob))
+        buffer[_HEADER.size:_HEADER.size + len(index_blob)] = index_blob
+        buffer[offset:offset + len(data)] = data
+        return SharedTables(memory, owner=True)
+    except BaseException:
+        memory.close()
+        memory.unlink()
+        raise
+
+
+def attach(name):
+    """
+    Attach to unit tables published by `publish` in another process.
+
+    Returns:
+        SharedTables: The tables, with a read-only FrozenConverter per table
+
+    Raises:
+        ImportError: If shared memory is not available (Python < 3.8)
+        FileNotFoundError: If no block has this name
+        ValueError: If the block doesn't hold unit tables
+    """
+    _require()
+    try:
+        memory = shared_memory.SharedMemory(name=name, track=False)
+    except TypeError:  # Python < 3.13 always tracks the block
+        memory = shared_memory.SharedMemory(name=name)
+        # Otherwise the worker's resource tracker destroys the block when the worker exits
+        resource_tracker.unregister(memory._name, "shared_memory")
+    return SharedTables(memory, owner=False)
+
+
+def _frozen(units, reciprocals):
+    """
+    Build a FrozenConverter reading its units and reciprocals from shared memory.
+    """
+    converter = FrozenConverter.__new__(FrozenConverter)
+    object.__setattr__(converter, "_units", units)
+    object.__setattr__(converter, "_reciprocals", reciprocals)
+    object.__setattr__(converter, "_plans", {})
+    object.__setattr__(converter, "memo", None)
+    object.__setattr__(converter, "_hash", None)
+    return converter
+
+
+def _data_offset(index_length):
+    """
+    Return the offset of the float64 rows, aligned on 8 bytes after the index.
+    """
+    end = _HEADER.size + index_length
+    return end + (-end % 8)
+
+
+def _require():
+    """
+    Raise ImportError if shared memory is not available.
+    """
+    if shared_memory is None:
+        raise ImportError("Shared unit tables require Python 3.8+ (multiprocessing.shared_memory)")
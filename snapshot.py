@@ -0,0 +1,178 @@
+"""
+Unit Table Snapshot Module
+
+This module builds and loads a precompiled snapshot of the normalized unit tables
+defined in `Converters.py`, the memoized compound expressions and the indexes of the
+unit registry, so short-lived processes can skip building, validating and indexing
+every table at import time.
+
+The snapshot is a marshal blob read straight from a memory map. It is only used while
+the content of the sources it was built from is unchanged; otherwise `Converters.py` silently falls
+back to its literal tables.
+
+Build the snapshot with:
+    python snapshot.py
+"""
+
+import marshal
+import mmap
+import os
+import zlib
+
+from base_class import Converter
+from compound import CompoundConverter, _CompoundUnits
+from registry import UnitRegistry
+
+# Bump when the layout of the snapshot changes
+SNAPSHOT_VERSION = 2
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Default location of the snapshot, next to the module it is built from
+DEFAULT_PATH = os.path.join(_HERE, "Converters.snapshot")
+
+# Files whose content determines the snapshot; any change invalidates it. Besides the
+# tables themselves, base_class.py and tables.py define how units are normalized and
+# which attributes a restored converter must have, and registry.py how units are indexed.
+_SOURCES = ("Converters.py", "compound.py", "base_class.py", "tables.py", "registry.py")
+
+
+class Snapshot:
+    """
+    A loaded unit table snapshot.
+
+    An empty snapshot (missing or stale file) returns None for every converter, so
+    callers can write `snapshot.converter(name) or Converter({...})`.
+
+    Attributes:
+        converters (dict): Snapshot data indexed by converter name
+        resolved (dict): Memoized compound expressions of the units resolver
+        indexes (dict): Bases and indexes of the unit registry (see `UnitRegistry._state`)
+    """
+
+    def __init__(self, converters=None, resolved=None, indexes=None):
+        self.converters = converters or {}
+        self.resolved = resolved or {}
+        self.indexes = indexes
+
+    def converter(self, name, resolver=None):
+        """
+        Rebuild a converter from the snapshot, without validating its units again.
+
+        Args:
+            name: The name of the converter in `Converters.py`
+            resolver: The CompoundResolver to attach to compound converters
+
+        Returns:
+            The restored converter, or None if it is not in the snapshot
+        """
+        data = self.converters.get(name)
+        if data is None:
+            return None
+        kind, units, dimension = data
+        if kind != "compound":
+            return Converter._from_normalized(units)
+        if resolver is None:
+            return None
+        table = _CompoundUnits(resolver, dimension)
+        dict.update(table, units)
+        converter = CompoundConverter._from_normalized(table)
+        converter.resolver = resolver
+        return converter
+
+    def warm(self, resolver):
+        """
+        Preload the memoized expressions of a CompoundResolver.
+        """
+        resolver._cache.update(self.resolved)
+
+    def registry(self, resolver, converters):
+        """
+        Rebuild the unit registry from the snapshot, without indexing the converters again.
+
+        Args:
+            resolver: The CompoundResolver of the registry
+            converters: The converters to register, indexed by name. They must be the ones
+                the snapshot was built with.
+
+        Returns:
+            The restored UnitRegistry, or None if it is not in the snapshot or was built
+            with other converters
+        """
+        if self.indexes is None or self.indexes["names"] != list(converters):
+            return None
+        return UnitRegistry._from_state(resolver, converters, self.indexes)
+
+
+def load(path=DEFAULT_PATH):
+    """
+    Load the snapshot at `path` through a memory map.
+
+    Returns:
+        A Snapshot, empty if the file is missing, unreadable or stale
+    """
+    try:
+        with open(path, "rb") as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            data = marshal.loads(view)
+    except (OSError, ValueError, EOFError, TypeError):
+        return Snapshot()
+    if not isinstance(data, dict) or data.get("version") != SNAPSHOT_VERSION \
+            or data.get("sources") != _source_stamps():
+        return Snapshot()
+    return Snapshot(data["converters"], data["resolved"], data["registry"])
+
+
+def build(path=DEFAULT_PATH):
+    """
+    Build the snapshot of every converter defined in `Converters.py` and write it to `path`.
+
+    Returns:
+        The number of converters written
+    """
+    import Converters
+
+    converters = {}
+    for name, converter in vars(Converters).items():
+        if not isinstance(converter, Converter):
+            continue
+        if isinstance(converter, CompoundConverter):
+            converters[name] = ("compound", dict(converter.units), converter.units.dimension)
+        else:
+            converters[name] = ("table", dict(converter.units), None)
+    data = {
+        "version": SNAPSHOT_VERSION,
+        "sources": _source_stamps(),
+        "converters": converters,
+        "resolved": dict(Converters.units_resolver._cache),
+        "registry": Converters.registry._state(),
+    }
+    # Write to a temporary file first so readers never see a partial snapshot
+    temporary = path + ".tmp"
+    with open(temporary, "wb") as file:
+        marshal.dump(data, file)
+    os.replace(temporary, path)
+    return len(converters)
+
+
+def _source_stamps():
+    """
+    Return the (name, size, CRC-32) stamps of the content of the files the snapshot depends on.
+
+    The stamps don't depend on modification times, so a checkout or a copy of unchanged
+    sources keeps the snapshot valid, and an edit that keeps the size and time doesn't.
+    CRC-32 is enough to detect edits, and zlib is much faster to import than hashlib.
+    """
+    stamps = []
+    for name in _SOURCES:
+        try:
+            with open(os.path.join(_HERE, name), "rb") as file:
+                content = file.read()
+        except OSError:
+            return None
+        stamps.append((name, len(content), zlib.crc32(content)))
+    return tuple(stamps)
+
+
+if __name__ == "__main__":
+    count = build()
+    print(f"Snapshot with {count} converters written to {DEFAULT_PATH}")
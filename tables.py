@@ -0,0 +1,137 @@
+"""
+Unit Table Files Module
+
+This module reads unit tables from JSON or TOML files and validates them, for
+`Converter.from_file`, `Converter.merge` and `UnitRegistry.load`.
+
+A table file holds the units of one converter:
+
+    {
+        "units": {"m": [1, 0], "km": [0.001, 0], "league-site": [0.0002, 0]},
+        "aliases": {"meter": "m"}
+    }
+
+Unit values follow the formats accepted by `Converter`. A plain {unit: value} mapping
+is accepted as well. Registry files map converter names to tables, and the table of a
+new converter may give its "base" unit expression:
+
+    {"Length": {"units": {...}}, "Density": {"base": "kg/m^3", "units": {...}}}
+
+TOML files use the same layout. Reading them requires Python 3.11+ (tomllib) or the
+optional `tomli` package.
+"""
+
+import os
+from numbers import Number
+
+# Accepted types of a unit value, and how each one is normalized to (scale_factor, offset)
+_NORMALIZERS = {
+    int: lambda value: (value, 1),
+    float: lambda value: (value, 1),
+    list: tuple,
+    tuple: tuple,
+}
+
+
+def read(path):
+    """
+    Read a JSON or TOML file (chosen by extension) into a dictionary.
+
+    Raises:
+        ValueError: If the file is malformed or repeats a key in the same object
+        ImportError: If the file is TOML and no TOML parser is available
+    """
+    if os.path.splitext(path)[1].lower() == ".toml":
+        tomllib = _toml_parser()
+        with open(path, "rb") as file:
+            # TOML parsers already reject duplicated keys
+            return tomllib.load(file)
+    import json  # Only needed to read table files, not to import the converters
+
+    with open(path, encoding="utf-8") as file:
+        return json.load(file, object_pairs_hook=_reject_duplicates)
+
+
+def _toml_parser():
+    """
+    Import the TOML parser on first use, so importing the converters doesn't pay for it.
+
+    Raises:
+        ImportError: If no TOML parser is available
+    """
+    try:
+        import tomllib
+    except ImportError:  # Python < 3.11
+        try:
+            import tomli as tomllib
+        except ImportError:  # TOML support is optional
+            raise ImportError("Reading TOML files requires Python 3.11+ or the 'tomli' package")
+    return tomllib
+
+
+def split_table(data):
+    """
+    Split a table into its (units, aliases) dictionaries.
+    """
+    if "units" in data and isinstance(data["units"], dict):
+        return data["units"], data.get("aliases") or {}
+    return data, {}
+
+
+def normalize(units, aliases=None, known=None):
+    """
+    Validate and normalize a table in one pass, returning a new dictionary.
+
+    Unlike `Converter.__init__`, every invalid entry is reported at once and the
+    given dictionaries are never modified.
+
+    Args:
+        units: Dictionary of unit values, in any format accepted by `Converter`
+        aliases: Dictionary mapping alias names to a unit of `units` or of `known`
+        known: Units already defined elsewhere (e.g. in the converter being merged into)
+
+    Returns:
+        A dictionary of (scale_factor, offset) tuples, aliases included
+
+    Raises:
+        ValueError: If entries are invalid, or an alias is unknown or conflicts with a unit
+    """
+    normalizers = _NORMALIZERS
+    normalized = {unit: normalizers.get(type(value), _normalize_other)(value) for unit, value in units.items()}
+    invalid = [unit for unit, value in normalized.items()
+               if value is None or len(value) != 2 or not all(isinstance(i, Number) and not isinstance(i, bool)
+                                                              for i in value)]
+    if invalid:
+        raise ValueError(f"Invalid unit values (expected a number or two numbers): {', '.join(map(str, invalid))}")
+
+    known = known or {}
+    conflicts = [alias for alias in (aliases or {}) if alias in normalized]
+    if conflicts:
+        raise ValueError(f"Aliases conflict with units of the same table: {', '.join(conflicts)}")
+    for alias, target in (aliases or {}).items():
+        value = normalized.get(target, known.get(target))
+        if value is None:
+            raise ValueError(f"Alias '{alias}' refers to an unknown unit: {target}")
+        normalized[alias] = value
+    return normalized
+
+
+def _normalize_other(value):
+    """
+    Normalize values of less common types (e.g. Fraction or Decimal numbers).
+    """
+    if isinstance(value, Number) and not isinstance(value, bool):
+        return (value, 1)
+    return None
+
+
+def _reject_duplicates(pairs):
+    """
+    json `object_pairs_hook` raising ValueError on duplicated keys.
+    """
+    result = {}
+    for key, value in pairs:
+        if key in result:
+            raise ValueError(f"Duplicated key in unit table: {key}")
+        result[key] = value
+    return result
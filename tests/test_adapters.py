@@ -0,0 +1,30 @@
+import math
+import pytest
+import adapters
+from Converters import Temperature
+
+
+def test_convert_series_keeps_index_and_nulls():
+    pd = pytest.importorskip("pandas")
+    series = pd.Series([0, None, 100], index=["a", "b", "c"], name="t")
+    result = adapters.convert_series(Temperature, series, "ºC", "°F")
+    assert list(result.index) == ["a", "b", "c"] and result.name == "t"
+    assert result["a"] == pytest.approx(32) and math.isnan(result["b"])
+
+
+def test_convert_frame_and_unit_column():
+    pd = pytest.importorskip("pandas")
+    frame = pd.DataFrame({"value": [0, 273.15, 32], "unit": ["ºC", "K", "°F"], "other": [1, 2, 3]})
+    converted = adapters.convert_frame(Temperature, frame, ["value"], "ºC", "K")
+    assert converted["value"].tolist() == pytest.approx([273.15, 546.3, 305.15])
+    assert frame["value"].tolist() == [0, 273.15, 32]
+    result = adapters.convert_unit_column(Temperature, frame, "value", "unit", "ºC")
+    assert result.tolist() == pytest.approx([0, 0, 0], abs=1e-9)
+
+
+def test_convert_arrow_table_keeps_nulls():
+    pa = pytest.importorskip("pyarrow")
+    table = pa.table({"t": [0, None, 100], "id": [1, 2, 3]})
+    result = adapters.convert_table(Temperature, table, {"t": ("ºC", "K")})
+    assert result.column("t").to_pylist() == pytest.approx([273.15, None, 373.15])
+    assert result.column("id").to_pylist() == [1, 2, 3]
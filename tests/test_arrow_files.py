@@ -0,0 +1,71 @@
+import pytest
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from arrow_files import convert_file
+from Converters import Length, Temperature
+
+
+def _table():
+    return pa.table({"id": pa.array(range(10)), "depth": pa.array([float(i) for i in range(9)] + [None]),
+                     "temp": pa.array([0, 100] * 5, pa.int32())})
+
+
+def test_parquet_row_groups_keep_schema_and_record_units(tmp_path):
+    source, destination = str(tmp_path / "in.parquet"), str(tmp_path / "out.parquet")
+    pq.write_table(_table(), source, row_group_size=3)
+    assert convert_file(Length, source, destination, ["depth"], "km", "m", workers=2) == 10
+    result = pq.ParquetFile(destination)
+    assert result.num_row_groups == 4
+    table = result.read()
+    assert table.column("depth").to_pylist() == [i * 1000.0 for i in range(9)] + [None]
+    assert table.column("id").to_pylist() == list(range(10))
+    assert table.schema.field("depth").metadata == {b"unit": b"m"}
+
+
+def test_feather_record_batches(tmp_path):
+    source, destination = str(tmp_path / "in.feather"), str(tmp_path / "out.feather")
+    with pa.ipc.new_file(source, _table().schema) as writer:
+        for batch in _table().to_batches(max_chunksize=4):
+            writer.write_batch(batch)
+    convert_file(Temperature, source, destination, {"temp": ("ºC", "K")})
+    reader = pa.ipc.open_file(destination)
+    assert reader.num_record_batches == 3
+    table = reader.read_all()
+    assert table.column("temp").to_pylist() == pytest.approx([273.15, 373.15] * 5)
+    assert table.schema.field("temp").type == pa.float64()
+
+
+def test_invalid_units_or_columns_raise(tmp_path):
+    source = str(tmp_path / "in.parquet")
+    pq.write_table(_table(), source)
+    with pytest.raises(ValueError):
+        convert_file(Length, source, str(tmp_path / "out.parquet"), ["depth"], "km", "kg")
+    with pytest.raises(KeyError):
+        convert_file(Length, source, str(tmp_path / "out.parquet"), ["height"], "km", "m")
+
+
+def test_failed_conversion_keeps_destination_and_closes_readers(tmp_path, monkeypatch):
+    import arrow_files
+
+    source, destination = str(tmp_path / "in.parquet"), str(tmp_path / "out.parquet")
+    pq.write_table(_table(), source, row_group_size=3)
+    with open(destination, "wb") as file:
+        file.write(b"previous")
+    readers = []
+    original = arrow_files._ParquetChunks.read
+
+    def failing_read(self, index):
+        readers.append(self)
+        if index == 2:
+            raise OSError("disk error")
+        return original(self, index)
+
+    monkeypatch.setattr(arrow_files._ParquetChunks, "read", failing_read)
+    with pytest.raises(OSError):
+        convert_file(Length, source, destination, ["depth"], "km", "m", workers=2)
+    with open(destination, "rb") as file:
+        assert file.read() == b"previous"
+    assert not (tmp_path / "out.parquet.tmp").exists()
+    assert readers and readers[0]._files == []
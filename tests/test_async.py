@@ -0,0 +1,66 @@
+import asyncio
+import pytest
+
+
+def run(coroutine):
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coroutine)
+    finally:
+        loop.close()
+
+
+def test_aconvert_matches_convert(converter):
+    values = list(range(25))
+    assert run(converter.aconvert(values, "m", "cm", chunk_size=4)) == converter.convert(values, "m", "cm")
+    assert run(converter.aconvert({"a": 10}, "°C", "°F", delta=True)) == {"a": pytest.approx(18.0)}
+    assert run(converter.aconvert((1, 2), "m", "cm", chunk_size=1)) == (100, 200)
+    assert run(converter.aconvert("25", "°C", "°F")) == pytest.approx(77.0)
+
+
+def test_aconvert_inplace_yields_between_chunks(converter):
+    values = [1, 2, 3]
+    ticks = []
+
+    async def ticker():
+        for _ in range(3):
+            ticks.append(len(ticks))
+            await asyncio.sleep(0)
+
+    async def main():
+        task = asyncio.ensure_future(ticker())
+        result = await converter.aconvert(values, "m", "cm", inplace=True, chunk_size=1)
+        ticks_during_conversion = len(ticks)
+        await task
+        return result, ticks_during_conversion
+
+    result, ticks_during_conversion = run(main())
+    assert result is values
+    assert values == [100, 200, 300]
+    assert ticks_during_conversion >= 2
+
+
+def test_aiconvert_converts_async_streams_lazily(converter):
+    async def stream():
+        for value in (0, 100):
+            yield value
+
+    async def main():
+        return [value async for value in converter.aiconvert(stream(), "°C", "K")]
+
+    assert run(main()) == pytest.approx([273.15, 373.15])
+
+
+def test_aconvert_chunks_sequences_that_cannot_be_sliced(converter):
+    from collections import deque
+
+    assert run(converter.aconvert(deque([1, 2, 3]), "m", "cm", chunk_size=2)) == [100, 200, 300]
+
+
+def test_aconvert_executor_falls_back_to_get_event_loop(converter, monkeypatch):
+    from concurrent.futures import ThreadPoolExecutor
+
+    # Python 3.6 has no asyncio.get_running_loop
+    monkeypatch.delattr(asyncio, "get_running_loop")
+    with ThreadPoolExecutor(1) as executor:
+        assert run(converter.aconvert([1, 2], "m", "cm", executor=executor)) == [100, 200]
@@ -0,0 +1,43 @@
+import math
+from decimal import Decimal
+import pytest
+
+
+def test_convert_batch_propagates_gaps(converter):
+    converted, valid = converter.convert_batch([0, None, float("nan"), "100"], "°C", "K")
+    assert converted[0] == pytest.approx(273.15) and converted[1] is None
+    assert math.isnan(converted[2]) and converted[3] == pytest.approx(373.15)
+    assert valid == [True, False, False, True]
+
+
+@pytest.mark.parametrize("errors, expected_length", [("coerce", 3), ("skip", 1)])
+def test_convert_batch_invalid_values(converter, errors, expected_length):
+    converted, valid = converter.convert_batch([1, "abc", None], "m", "cm", errors=errors)
+    assert len(converted) == expected_length and converted[0] == 100
+    assert valid == [True, False, False]
+
+
+def test_convert_batch_numbers_without_float_arithmetic(converter):
+    values = [1, Decimal("2.5")]
+    assert converter.convert_batch(values, "m", "cm", errors="skip") == ([100], [True, False])
+    converted, valid = converter.convert_batch(values, "m", "cm", errors="coerce")
+    assert math.isnan(converted[1]) and valid == [True, False]
+    with pytest.raises(TypeError):
+        converter.convert_batch(values, "m", "cm")
+
+
+def test_convert_batch_raise_and_invalid_option(converter):
+    with pytest.raises(TypeError):
+        converter.convert_batch([1, object()], "m", "cm")
+    with pytest.raises(ValueError):
+        converter.convert_batch([1], "m", "cm", errors="ignore")
+
+
+def test_convert_batch_masked_array(converter):
+    np = pytest.importorskip("numpy")
+    values = np.ma.array([0.0, 1.0, np.nan], mask=[False, True, False])
+    converted, valid = converter.convert_batch(values, "°C", "K")
+    assert np.ma.isMaskedArray(converted) and converted.mask.tolist() == [False, True, False]
+    assert valid.tolist() == [True, False, False]
+    skipped, _ = converter.convert_batch(values, "°C", "K", errors="skip")
+    assert skipped.tolist() == pytest.approx([273.15])
@@ -12,3 +12,13 @@ def test_convert_list_inplace(converter):
 def test_convert_tuple_returns_iterable(converter):
     result = converter.convert((1, 2), "m", "cm")
     assert list(result) == [100, 200]
+
+def test_collections_match_scalar_conversions():
+    from Converters import Temperature
+    values = [-459.67, -40, 0, 32.5, 98.6, 1e6]
+    for final_unit in Temperature.units:
+        expected = [Temperature.convert(value, "°F", final_unit) for value in values]
+        assert Temperature.convert(values, "°F", final_unit) == expected
+        assert Temperature.convert(tuple(values), "°F", final_unit) == tuple(expected)
+        assert list(Temperature.convert(dict(enumerate(values)), "°F", final_unit).values()) == expected
+    assert Temperature.convert([-459.67], "°F", "K") == [Temperature.convert(-459.67, "°F", "K")] == [0.0]
@@ -0,0 +1,25 @@
+import pytest
+from base_class import Converter
+from Converters import Length, Temperature
+
+
+def test_compiled_functions_fold_coefficients():
+    to_km = Length.compile("m", "km")
+    assert to_km(1500) == pytest.approx(1.5)
+    assert to_km.__doc__.endswith("x * 0.001")
+    assert Length.compile("m", "km") is to_km
+    assert Temperature.compile("ºC", "°F", delta=True)(10) == pytest.approx(18)
+
+
+def test_list_and_map_variants():
+    assert Temperature.compile("ºC", "°F", kind="list")((0, 100)) == pytest.approx([32, 212])
+    assert Temperature.compile("ºC", "°F", kind="map")({"low": 0}) == {"low": pytest.approx(32)}
+    with pytest.raises(ValueError):
+        Temperature.compile("ºC", "°F", kind="matrix")
+
+
+def test_compiled_functions_follow_reloaded_tables():
+    converter = Converter({"m": (1, 0), "ft": (3.28, 0)})
+    assert converter.compile("m", "ft")(1) == 3.28
+    converter.reload({"m": (1, 0), "ft": (3.2808, 0)})
+    assert converter.compile("m", "ft")(1) == 3.2808
@@ -0,0 +1,46 @@
+from fractions import Fraction
+
+import pytest
+from compound import CompoundResolver
+from Converters import Speed, Temperature, Time, units_resolver
+
+
+def test_resolve_compound_expressions():
+    assert units_resolver.scale("km/h") == 3.6
+    assert units_resolver.dimension("ft·lbf/s") == (("L", 2), ("M", 1), ("T", -3))
+    assert units_resolver.scale("ft^2") == units_resolver.scale("ft²")
+
+
+def test_speed_resolves_unlisted_expressions_on_demand():
+    assert "ft/wk" not in list(Speed.units)
+    assert Speed.convert(36, "km/h", "m/s") == 10.0
+    assert Speed.convert(1, "mi/h", "ft/wk") == 5280 * 24 * 7
+    assert "ft/wk" in Speed.units
+
+
+def test_imperial_and_astronomical_speeds_use_exact_definitions():
+    assert Speed.convert(1, "ft/s", "m/s") == 0.3048
+    assert Speed.convert(1, "mph", "m/s") == 0.44704
+    assert Speed.convert(1, "ly/year", "m/s") == 299792458
+    assert Speed.convert(1, "ly/year", "c") == 1
+    assert Speed.convert([1, 1], "mph", "m/s") == [0.44704, 0.44704]
+    assert Speed.plan("mph", "m/s")(1) == 0.44704
+
+
+def test_resolver_reads_factors_as_their_decimal_definitions():
+    assert units_resolver.size("ft") == Fraction("0.3048")
+    assert units_resolver.size("mph") == Fraction("0.44704")
+    assert units_resolver.size("ly/year") == 299792458
+
+
+@pytest.mark.parametrize("bad_unit", ["m", "K/s", "km//h", "foo/s"])
+def test_speed_rejects_invalid_expressions(bad_unit):
+    with pytest.raises(ValueError):
+        Speed.convert(1, bad_unit, "m/s")
+
+
+def test_resolver_rejects_units_with_offset():
+    resolver = CompoundResolver({"Θ": Temperature, "T": Time})
+    assert resolver.dimension("ºC/s") == (("T", -1), ("Θ", 1))
+    with pytest.raises(ValueError):
+        resolver.resolve("K/s")
@@ -0,0 +1,60 @@
+import pytest
+import equivalence
+from Converters import Temperature, Time, Weight
+
+
+def test_ulp_distance_and_relative_error():
+    assert equivalence.ulp_distance(1.0, 1.0 + 2 ** -52) == 1
+    assert equivalence.ulp_distance(0.0, -0.0) == 0
+    assert equivalence.ulp_distance(-5e-324, 5e-324) == 2
+    assert equivalence.relative_error(1.5, 1.0) == 0.5
+    assert equivalence.relative_error(1e-16, 0.0, magnitude=1.0) == 1e-16
+
+
+def test_fast_paths_match_the_reference_on_a_subset():
+    converters = {"Temperature": Temperature, "Weight": Weight}
+    values = equivalence.inputs(count=16, seed=1)
+    units = {"Temperature": ["ºC", "°F", "K", "ºR"], "Weight": ["kg", "lb", "oz", "g"]}
+    for name, converter in converters.items():
+        for origin_unit in units[name]:
+            for final_unit in units[name]:
+                for result in equivalence.compare(converter, origin_unit, final_unit, False, values,
+                                                  name=name, repeat=1):
+                    assert result.max_relative_error < 1e-13, result
+                    assert result.out_of_range <= 4
+
+
+def test_run_reports_every_distinct_pair_and_summarizes():
+    converter = Time.freeze()
+    results = equivalence.run({"Time": converter}, values=[1.0, 2.5], paths=["plan", "compiled"])
+    distinct = len(set(converter.units.values()))
+    assert len(results) == distinct * (distinct - 1) * 2
+    summary = equivalence.summarize(results)
+    assert [result.path for result in summary] == ["plan", "compiled"]
+    assert "compiled" in equivalence.format_report(summary)
+    with pytest.raises(ValueError):
+        equivalence.compare(Temperature, "ºC", "K", paths=["gpu"])
+
+
+def test_speed_and_length_summaries_stay_within_a_few_ulps():
+    from Converters import Length, Speed
+
+    values = equivalence.inputs(count=8, seed=0)
+    units = {"Speed": (Speed, ["m/s", "km/h", "mph", "ft/s", "c", "ly/year"]),
+             "Length": (Length, ["m", "km", "ft", "mi", "ly", "au"])}
+    for name, (converter, names) in units.items():
+        results = [result for origin_unit in names for final_unit in names if origin_unit != final_unit
+                   for result in equivalence.compare(converter, origin_unit, final_unit, False, values,
+                                                     name=name, repeat=1)]
+        for result in equivalence.summarize(results):
+            assert result.max_ulp <= 2, result
+            assert result.max_relative_error < 1e-15, result
+
+
+def test_subnormal_and_overflowing_results_are_out_of_range():
+    from Converters import Length
+
+    # 5e-324 au underflows to 0 ly, and 1e300 au overflows in the reference path
+    for result in equivalence.compare(Length, "au", "ly", values=[5e-324, 1e300, 1.0], repeat=1):
+        assert result.out_of_range == 2
+        assert result.max_ulp <= 2 and result.max_relative_error < 1e-15, result
@@ -0,0 +1,26 @@
+import pytest
+from Converters import Temperature, Length
+
+
+def test_scalar_to_every_unit_matches_convert():
+    result = Temperature.convert_to_all(100, "ºC")
+    assert list(result) == list(Temperature.units)
+    for unit, value in result.items():
+        assert value == pytest.approx(Temperature.convert(100, "ºC", unit))
+
+
+def test_batch_to_selected_targets():
+    result = Length.convert_to_all([1, 2], "m", ["cm", "km"])
+    assert result == {"cm": pytest.approx([100, 200]), "km": pytest.approx([0.001, 0.002])}
+    np = pytest.importorskip("numpy")
+    delta = Temperature.convert_to_all(np.array([10.0]), "ºC", ["°F"], delta=True)
+    assert isinstance(delta["°F"], np.ndarray) and delta["°F"][0] == pytest.approx(18)
+
+
+def test_as_array_and_invalid_units():
+    np = pytest.importorskip("numpy")
+    table = Length.convert_to_all(np.array([1.0, 2.0, 3.0]), "m", ["m", "cm"], as_array=True)
+    assert table.shape == (3, 2)
+    assert table[2].tolist() == pytest.approx([3, 300])
+    with pytest.raises(ValueError):
+        Length.convert_to_all(1, "m", ["cm", "parsec-ish"])
@@ -0,0 +1,31 @@
+import operator
+import pytest
+from Converters import Temperature, Length
+
+KELVIN = [250.0, 310.0, 320.0, 373.15, 400.0]
+
+
+def test_threshold_in_another_unit_matches_converting_the_values():
+    fahrenheit = [Temperature.convert(value, "K", "°F") for value in KELVIN]
+    for op, compare in (("<", operator.lt), ("<=", operator.le), (">", operator.gt), (">=", operator.ge)):
+        expected = [value for value, converted in zip(KELVIN, fahrenheit) if compare(converted, 100)]
+        assert Temperature.filter(KELVIN, "K", op, 100, "°F") == expected
+
+
+def test_negative_scale_flips_the_comparison():
+    # Higher temperatures have lower Delisle values
+    assert Temperature.mask(KELVIN, "K", "<", 0, "ºD") == [False, False, False, False, True]
+    assert Temperature.filter(KELVIN, "K", ">", 0, "ºD") == [250.0, 310.0, 320.0]
+    assert Length.mask([1, 2, 3], "m", "==", 200, "cm") == [False, True, False]
+
+
+def test_numpy_arrays_and_errors():
+    np = pytest.importorskip("numpy")
+    values = np.array(KELVIN)
+    mask = Temperature.mask(values, "K", ">=", 37, "ºC")
+    assert mask.dtype == bool and mask.tolist() == [False, False, True, True, True]
+    assert Temperature.filter(values, "K", ">", 100, "ºC").tolist() == [400.0]
+    with pytest.raises(ValueError):
+        Temperature.mask(KELVIN, "K", "=>", 0, "ºC")
+    with pytest.raises(TypeError):
+        Temperature.filter(KELVIN, "K", ">", "hot", "ºC")
@@ -0,0 +1,37 @@
+import pickle
+import pytest
+from base_class import FrozenConverter
+
+
+def test_freeze_copies_units_and_converts(converter):
+    frozen = converter.freeze()
+    assert frozen.convert(25, "°C", "°F") == pytest.approx(77.0, rel=1e-12)
+    assert frozen.convert(10, "°C", "°F", delta=True) == pytest.approx(18.0, rel=1e-12)
+    converter.units["m"] = (2, 0)
+    assert frozen.units["m"] == (1, 0)
+
+
+def test_frozen_converter_is_immutable():
+    units = {"num": 2, "lst": [3, 4]}
+    frozen = FrozenConverter(units)
+    assert units == {"num": 2, "lst": [3, 4]}
+    with pytest.raises(TypeError):
+        frozen.units["other"] = (1, 0)
+    with pytest.raises(AttributeError):
+        frozen.units = {}
+
+
+def test_frozen_converter_is_hashable_and_picklable(converter):
+    frozen = converter.freeze()
+    restored = pickle.loads(pickle.dumps(frozen))
+    assert restored == frozen
+    assert hash(restored) == hash(frozen)
+    assert restored.convert(1, "km", "m") == pytest.approx(1000.0)
+
+
+def test_converters_have_no_instance_dictionary(converter):
+    frozen = converter.freeze()
+    assert not hasattr(converter, "__dict__")
+    assert not hasattr(frozen, "__dict__")
+    frozen.enable_memo()
+    assert frozen.convert(1, "km", "m") == 1000 and frozen.memo.get((1, "km", "m", False)) is not None
@@ -0,0 +1,19 @@
+import pytest
+
+pytest.importorskip("tkinter")
+
+import gui  # noqa: E402  Only the formatting helper is used: no window is created
+
+
+@pytest.mark.parametrize("value, expected", [
+    (0, "0.000000"),
+    (-0.0, "-0.000000"),
+    (1e-4, "1.000000e-04"),
+    (0.001, "0.001000"),
+    (-0.001, "-0.001000"),
+    (1000, "1000.000000"),
+    (1000.5, "1.000500e+03"),
+    (1e6, "1.000000e+06"),
+])
+def test_format_value_boundaries(value, expected):
+    assert gui.format_value(value) == expected
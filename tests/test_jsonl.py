@@ -0,0 +1,44 @@
+import io
+import json
+import pytest
+import jsonl
+
+FEED = "\n".join([
+    '{"id": 1, "value": 25, "unit": "ºC"}',
+    '{"id": 2, "value": 77, "unit": "°F"}',
+    'not json',
+    '{"id": 3, "value": "hot", "unit": "ºC"}',
+    '{"id": 4, "value": 1, "unit": "m"}',
+    '[1, 2]',
+    '',
+    '{"id": 5, "unit": "K"}',
+    '{"id": 6, "value": 300, "unit": "K"}',
+]) + "\n"
+
+
+def test_records_are_converted_and_bad_lines_counted():
+    stats = jsonl.StreamStats()
+    records = [json.loads(line) for line in jsonl.convert_records(io.StringIO(FEED), "ºC", stats=stats)]
+    assert [record["id"] for record in records] == [1, 2, 4, 6]
+    assert [record["value"] for record in records] == pytest.approx([25, 25, 1, 26.85])
+    assert [record["unit"] for record in records] == ["ºC", "ºC", "m", "ºC"]
+    assert (stats.lines, stats.converted, stats.unconverted, stats.skipped) == (8, 3, 1, 4)
+
+
+def test_stream_with_unit_mapping(tmp_path):
+    source, destination = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    source.write_text(FEED, encoding="utf-8")
+    stats = jsonl.convert_stream(str(source), str(destination), {"m": "cm", "K": "ºC"}, chunk_size=2)
+    lines = destination.read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line)["unit"] for line in lines] == ["ºC", "°F", "cm", "ºC"]
+    assert lines[0] == '{"id": 1, "value": 25, "unit": "ºC"}'
+    assert (stats.converted, stats.unconverted, stats.skipped) == (2, 2, 4)
+
+
+def test_stream_with_worker_processes(tmp_path):
+    source, destination = tmp_path / "in.jsonl", tmp_path / "out.jsonl"
+    source.write_text(FEED * 20, encoding="utf-8")
+    stats = jsonl.convert_stream(str(source), str(destination), "K", workers=2, chunk_size=7)
+    assert (stats.converted, stats.unconverted, stats.skipped) == (60, 20, 80)
+    values = [json.loads(line)["value"] for line in destination.read_text(encoding="utf-8").splitlines()]
+    assert values[:4] == pytest.approx([298.15, 298.15, 1, 300])
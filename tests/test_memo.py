@@ -0,0 +1,31 @@
+import time
+import pytest
+from memo import ResultCache
+
+
+def test_memo_shares_entries_for_normalized_inputs(converter):
+    cache = converter.enable_memo(maxsize=8)
+    assert converter.convert("25", "°C", "°F") == pytest.approx(77.0)
+    assert converter.convert(25.0, "°C", "°F") == pytest.approx(77.0)
+    assert converter.convert(25, "°C", "°F", delta=True) == pytest.approx(45.0)
+    assert cache.stats()["hits"] == 1 and cache.stats()["misses"] == 2
+    with pytest.raises(TypeError):
+        converter.convert("abc", "°C", "°F")
+    converter.disable_memo()
+    assert converter.memo is None
+
+
+def test_result_cache_size_eviction():
+    cache = ResultCache(maxsize=2)
+    for key in "abc":
+        cache.put(key, key)
+    assert cache.get("a") is None and cache.get("c") == "c"
+    assert cache.stats()["evictions"] == 1 and len(cache) == 2
+
+
+def test_result_cache_ttl_eviction():
+    cache = ResultCache(ttl=0.01)
+    cache.put("a", 1)
+    time.sleep(0.02)
+    assert cache.get("a") is None
+    assert cache.stats()["evictions"] == 1
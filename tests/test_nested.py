@@ -0,0 +1,36 @@
+import pytest
+from nested import compile_paths
+
+
+@pytest.fixture
+def payload():
+    return {"site": "a", "readings": [{"t": 0, "id": 1}, {"t": 100, "id": 2}], "max": {"t": 50}, "ok": True}
+
+
+def test_convert_nested_selected_paths(converter, payload):
+    result = converter.convert_nested(payload, "°C", "K", paths=["$.readings[*].t", "max.t"])
+    assert [reading["t"] for reading in result["readings"]] == pytest.approx([273.15, 373.15])
+    assert result["max"]["t"] == pytest.approx(323.15)
+    assert [reading["id"] for reading in result["readings"]] == [1, 2]
+    assert payload["readings"][0]["t"] == 0
+    assert result["site"] == "a" and result["ok"] is True
+
+
+def test_convert_nested_inplace_converts_once(converter, payload):
+    paths = ["$.readings[*].t", "$.readings[0]['t']"]
+    assert compile_paths(paths) is compile_paths(paths)
+    result = converter.convert_nested(payload, "m", "cm", paths=paths, inplace=True)
+    assert result is payload
+    assert [reading["t"] for reading in payload["readings"]] == [0, 10000]
+
+
+def test_convert_nested_all_numbers(converter, payload):
+    result = converter.convert_nested(payload, "m", "cm")
+    assert result["readings"][1] == {"t": 10000, "id": 200}
+    assert result["ok"] is True
+
+
+@pytest.mark.parametrize("bad_path", ["$", "$.a[", "$..a"])
+def test_invalid_selectors_raise(converter, payload, bad_path):
+    with pytest.raises(ValueError):
+        converter.convert_nested(payload, "m", "cm", paths=bad_path)
@@ -0,0 +1,31 @@
+import math
+import pytest
+
+
+def test_error_bound_per_unit_pair(converter):
+    assert converter.error_bound("m", "cm") == pytest.approx(3 * 2.0 ** -24, rel=1e-6)
+    assert converter.error_bound("°C", "°F") == pytest.approx(4 * 2.0 ** -24, rel=1e-6)
+    assert 0 < converter.error_bound("m", "cm", dtype="float64") < 1e-15
+    with pytest.raises(ValueError):
+        converter.error_bound("m", "cm", dtype="float16")
+
+
+def test_error_bound_is_infinite_when_coefficients_overflow():
+    from base_class import Converter
+    converter = Converter({"a": (1, 0), "b": (1e60, 0)})
+    assert math.isinf(converter.error_bound("a", "b"))
+
+
+def test_float32_conversion_stays_within_bound(converter):
+    np = pytest.importorskip("numpy")
+    values = np.linspace(-500, 500, 10001)
+    result = converter.convert(values, "°C", "°F", dtype="float32")
+    assert result.dtype == np.float32
+    reference = converter.convert(values, "°C", "°F")
+    error = np.max(np.abs(result - reference) / (np.abs(1.8 * values) + 32))
+    assert error <= converter.error_bound("°C", "°F")
+
+
+def test_dtype_requires_numpy_arrays(converter):
+    with pytest.raises(TypeError):
+        converter.convert([1, 2], "m", "cm", dtype="float32")
@@ -0,0 +1,50 @@
+import pytest
+from Converters import Temperature, Length
+from quantity import Quantity, QuantityArray
+
+
+def test_quantity_conversion_comparison_and_arithmetic():
+    boiling = Quantity(100, "ºC", Temperature)
+    assert boiling.to("K").value == pytest.approx(373.15) and boiling.to("K").unit == "K"
+    assert boiling == Quantity(373.15, "K", Temperature)
+    assert Quantity(1, "km", Length) > Quantity(999, "m", Length)
+    total = Quantity(1, "m", Length) + Quantity(50, "cm", Length)
+    assert (total.value, total.unit) == (1.5, "m")
+    assert (2 * total).value == 3 and Quantity(1, "km", Length) / Quantity(1, "m", Length) == 1000
+    assert not hasattr(total, "__dict__")
+    with pytest.raises(ValueError):
+        Quantity(1, "parsec-ish", Length)
+
+
+def test_chained_conversions_are_fused_until_read():
+    readings = QuantityArray([20.0, 25.0, -40.0], "ºC", Temperature)
+    fahrenheit = readings.to("K").to("mK").to("°F")
+    assert fahrenheit._pending.origin_unit == "ºC" and fahrenheit._values is readings._values
+    assert fahrenheit.tolist() == pytest.approx([68, 77, -40])
+    assert fahrenheit._pending is None and readings.tolist() == [20.0, 25.0, -40.0]
+    assert fahrenheit[1].unit == "°F" and float(readings.to("K")[0]) == pytest.approx(293.15)
+    shifted = (readings.to("K") * 2 + Quantity(1, "K", Temperature)) - Quantity(0, "ºC", Temperature)
+    assert shifted.tolist() == pytest.approx([2 * (value + 273.15) + 1 - 273.15 for value in (20, 25, -40)])
+
+
+def test_array_comparisons_and_numpy_storage():
+    readings = QuantityArray([20.0, 25.0, -40.0], "ºC", Temperature)
+    assert (readings.to("ºD") < Quantity(60, "°F", Temperature)) == [True, True, False]
+    assert (readings.to("ºD") > 150) == [False, False, True]
+    np = pytest.importorskip("numpy")
+    lengths = QuantityArray(np.array([1.0, 2.0]), "m", Length)
+    total = lengths + lengths.to("cm")
+    assert isinstance(total.values, np.ndarray) and total.tolist() == [2.0, 4.0]
+    assert (lengths.to("km") >= Quantity(150, "cm", Length)).tolist() == [False, True]
+
+
+def test_importing_the_modules_does_not_import_optional_libraries():
+    import os
+    import subprocess
+    import sys
+
+    code = ("import sys, quantity, adapters, equivalence, arrow_files; "
+            "print(sorted(name for name in ('numpy', 'pandas', 'pyarrow') if name in sys.modules))")
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    output = subprocess.check_output([sys.executable, "-c", code], cwd=root, universal_newlines=True)
+    assert output.strip() == "[]"
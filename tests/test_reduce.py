@@ -0,0 +1,44 @@
+import statistics
+import pytest
+from Converters import Temperature, Length
+
+READINGS = [12.5, -3.0, 40.25, 0.0, 21.0]
+
+
+def test_aggregates_match_converted_values():
+    converted = [Temperature.convert(value, "ºC", "°F") for value in READINGS]
+    result = Temperature.reduce(iter(READINGS), "ºC", "°F", ops=("count", "sum", "mean", "min", "max", "std"))
+    assert result["count"] == 5
+    assert result["sum"] == pytest.approx(sum(converted))
+    assert result["mean"] == pytest.approx(statistics.mean(converted))
+    assert (result["min"], result["max"]) == pytest.approx((min(converted), max(converted)))
+    assert result["std"] == pytest.approx(statistics.pstdev(converted))
+
+
+def test_negative_scale_swaps_min_and_max_and_delta():
+    result = Temperature.reduce(READINGS, "ºC", "ºD", ops=("min", "max", "var"), ddof=1)
+    assert result["min"] == pytest.approx(Temperature.convert(40.25, "ºC", "ºD"))
+    assert result["max"] == pytest.approx(Temperature.convert(-3.0, "ºC", "ºD"))
+    assert result["var"] == pytest.approx(statistics.variance(READINGS) * 1.5 ** 2)
+    assert Temperature.reduce(READINGS, "ºC", "K", ops=("sum",), delta=True)["sum"] == pytest.approx(sum(READINGS))
+
+
+def test_numpy_input_empty_input_and_errors():
+    np = pytest.importorskip("numpy")
+    values = np.array(READINGS)
+    assert Length.reduce(values, "m", "cm") == pytest.approx(Length.reduce(READINGS, "m", "cm"))
+    empty = Length.reduce([], "m", "cm", ops=("count", "sum", "mean"))
+    assert empty["count"] == 0 and empty["sum"] == 0 and empty["mean"] != empty["mean"]
+    with pytest.raises(ValueError):
+        Length.reduce(READINGS, "m", "cm", ops=("median",))
+    with pytest.raises(TypeError):
+        Length.reduce([1, "2"], "m", "cm")
+
+
+def test_numpy_input_with_a_subset_of_ops():
+    np = pytest.importorskip("numpy")
+    values = np.array(READINGS)
+    assert Length.reduce(values, "m", "km", ops=("sum",)) == {"sum": pytest.approx(sum(READINGS) / 1000)}
+    result = Length.reduce(values, "m", "cm", ops=("mean", "std"))
+    assert result == {"mean": pytest.approx(statistics.mean(READINGS) * 100),
+                      "std": pytest.approx(statistics.pstdev(READINGS) * 100)}
@@ -0,0 +1,22 @@
+import pytest
+from Converters import registry, Area, Volume, Speed
+
+
+def test_convert_between_converters_of_same_dimension():
+    assert registry.convert(1, "acre", "ft^2") == 43560
+    assert registry.convert(2, "L", "m^3") == pytest.approx(0.002, rel=1e-12)
+    assert registry.convert([0, 100], "ºC", "°F") == pytest.approx([32, 212])
+
+
+def test_converter_for_resolves_units_and_expressions():
+    assert registry.converter_for("acre") is Area
+    assert registry.converter_for("ft^3") is Volume
+    assert registry.converter_for("km/h") is Speed
+
+
+def test_incompatible_or_ambiguous_units_raise():
+    with pytest.raises(ValueError):
+        registry.convert(1, "m", "kg")
+    with pytest.raises(ValueError):
+        registry.converter_for("min")  # minute and minim
+    assert registry.convert(1, "min", "s") == pytest.approx(60)
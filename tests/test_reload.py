@@ -0,0 +1,92 @@
+import threading
+import pytest
+from base_class import Converter
+from Converters import units_resolver, Length
+from registry import UnitRegistry
+
+
+def test_reload_keeps_plans_of_unchanged_units():
+    converter = Converter({"m": (1, 0), "km": (0.001, 0), "ft": (3.28, 0)})
+    kept = converter.plan("m", "km")
+    converter.plan("m", "ft")
+    assert converter.reload({"m": (1, 0), "km": (0.001, 0), "ft": (3.2808, 0), "yd": (1.0936, 0)}) == ["ft"]
+    assert converter.plan("m", "km") is kept
+    assert converter.plan("m", "ft").scale == 3.2808
+    assert converter.convert(1, "m", "yd") == 1.0936
+
+
+def test_reload_removes_units_and_rejects_invalid_tables():
+    converter = Converter({"m": (1, 0), "km": (0.001, 0)})
+    assert converter.reload({"m": (1, 0)}) == ["km"]
+    with pytest.raises(ValueError):
+        converter.convert(1, "m", "km")
+    with pytest.raises(ValueError):
+        converter.reload({"m": (1, 0), "cm": "100"})
+    assert list(converter.units) == ["m"]
+
+
+def test_conversions_see_a_consistent_table_while_reloading():
+    first = {"a": (1, 0), "b": (2, 0)}
+    second = {"a": (1, 0), "b": (4, 0)}
+    converter = Converter(dict(first))
+    stop = threading.Event()
+    results = set()
+
+    def convert():
+        while not stop.is_set():
+            results.add(converter.convert(1, "a", "b"))
+            results.add(converter.plan("b", "a")(1))
+
+    workers = [threading.Thread(target=convert) for _ in range(4)]
+    for worker in workers:
+        worker.start()
+    for index in range(200):
+        converter.reload(second if index % 2 == 0 else first)
+    stop.set()
+    for worker in workers:
+        worker.join()
+    assert results <= {2, 4, 0.5, 0.25}
+    assert converter.convert(1, "a", "b") == 2
+
+
+def test_registry_reload_updates_dimension_tables():
+    registry = UnitRegistry(units_resolver)
+    registry.register("Length", Converter(dict(Length.units)), base="m")
+    registry.register("Site", Converter({"rod-site": (0.2, 0)}), base="m")
+    assert registry.convert(1, "rod-site", "m") == pytest.approx(5)
+    assert registry.reload("Site", {"rod-site": (0.25, 0), "pole-site": (0.5, 0)}) == ["rod-site"]
+    assert registry.convert(1, "rod-site", "m") == pytest.approx(4)
+    assert registry.convert(1, "pole-site", "rod-site") == pytest.approx(0.5)
+    registry.reload("Site", {"pole-site": (0.5, 0)})
+    with pytest.raises(ValueError):
+        registry.convert(1, "rod-site", "m")
+
+
+def test_collection_uses_one_table_when_reloaded_mid_batch():
+    converter = Converter({"m": (1, 0), "km": (0.001, 0)})
+
+    class Reloading(list):
+        def __iter__(self):
+            for index, value in enumerate(list.__iter__(self)):
+                if index == 1:
+                    converter.reload({"m": (1, 0), "km": (0.01, 0)})
+                yield value
+
+    assert converter.convert(Reloading([1000, 1000]), "m", "km") == [1.0, 1.0]
+    assert converter.convert(1000, "m", "km") == 10.0
+
+
+def test_registry_reload_of_a_base_table_refreshes_compound_converters():
+    from compound import CompoundConverter, CompoundResolver
+
+    length = Converter({"m": (1, 0), "ft": (1 / 0.3, 0)})
+    resolver = CompoundResolver({"L": length, "T": Converter({"s": (1, 0), "wk": (1 / 604800, 0)})})
+    speed = CompoundConverter(resolver, ["m/s", "ft/s"])
+    registry = UnitRegistry(resolver)
+    registry.register("Length", length, base="m")
+    registry.register("Speed", speed, base="m/s")
+    assert registry.convert(1, "ft/s", "m/s") == pytest.approx(0.3)
+    registry.reload("Length", {"m": (1, 0), "ft": (1 / 0.3048, 0)})
+    assert registry.convert(1, "ft/s", "m/s") == pytest.approx(0.3048, rel=1e-12)
+    assert speed.convert(1, "ft/s", "m/s") == pytest.approx(0.3048, rel=1e-12)
+    assert registry.convert(604800, "ft/wk", "m/s") == pytest.approx(0.3048, rel=1e-12)
@@ -0,0 +1,39 @@
+import multiprocessing
+import pytest
+
+shared = pytest.importorskip("shared")
+if shared.shared_memory is None:
+    pytest.skip("multiprocessing.shared_memory is not available", allow_module_level=True)
+
+from base_class import FrozenConverter
+from Converters import registry, Length
+
+
+def _convert_in_worker(name):
+    tables = shared.attach(name)
+    try:
+        return tables["Temperature"].convert(100, "ºC", "°F")
+    finally:
+        tables.close()
+
+
+def test_attached_tables_match_the_published_converters():
+    with shared.publish(registry.converters) as tables:
+        attached = shared.attach(tables.name)
+        length = attached["Length"]
+        assert isinstance(length, FrozenConverter) and length == Length.freeze()
+        assert length.convert([1500, 3], "m", "km") == pytest.approx([1.5, 0.003])
+        assert attached["Speed"].convert(36, "km/h", "m/s") == pytest.approx(10)
+        with pytest.raises(TypeError):
+            length.units["m"] = (2, 0)
+        attached.close()
+
+
+def test_workers_attach_without_destroying_the_block():
+    with shared.publish({"Temperature": registry.converters["Temperature"]}) as tables:
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(2) as pool:
+            assert pool.map(_convert_in_worker, [tables.name] * 2) == pytest.approx([212, 212])
+        # The block outlives the workers
+        temperature = shared.attach(tables.name)["Temperature"]
+        assert temperature.convert(0, "ºC", "K") == pytest.approx(273.15)
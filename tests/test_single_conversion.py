@@ -11,3 +11,24 @@ def test_convert_length_scaling(converter):
 
 def test_convert_same_unit_returns_same_value(converter):
     assert converter.convert(123, "m", "m") == 123
+
+def test_plan_matches_single_conversion_and_is_cached(converter):
+    plan = converter.plan("K", "°F")
+    assert plan(300) == pytest.approx(converter.convert(300, "K", "°F"), rel=1e-12)
+    assert converter.plan("K", "°F") is plan
+    assert converter.plan("°C", "°F", delta=True)(10) == pytest.approx(18.0)
+
+def test_plan_inverse_is_cached_with_the_plan(converter):
+    plan = converter.plan("°F", "K")
+    assert converter.plan("K", "°F") is plan.inverse
+    assert plan.inverse.inverse is plan
+    assert plan.inverse(plan(50)) == pytest.approx(50, rel=1e-12)
+
+
+def test_plan_compose_fuses_conversions(converter):
+    fused = converter.plan("°F", "°C").compose(converter.plan("°C", "K"))
+    assert (fused.origin_unit, fused.final_unit) == ("°F", "K")
+    assert fused(212) == pytest.approx(373.15, rel=1e-12)
+    assert fused.inverse(373.15) == pytest.approx(212, rel=1e-12)
+    with pytest.raises(ValueError):
+        fused.compose(converter.plan("m", "cm"))
@@ -0,0 +1,52 @@
+import os
+import snapshot
+import Converters
+
+
+def test_build_and_load_round_trip(tmp_path):
+    path = str(tmp_path / "units.snapshot")
+    assert snapshot.build(path) == 7
+    loaded = snapshot.load(path)
+    length = loaded.converter("Length")
+    assert dict(length.units) == dict(Converters.Length.units)
+    assert length.convert(1, "km", "m") == Converters.Length.convert(1, "km", "m")
+    speed = loaded.converter("Speed", Converters.units_resolver)
+    assert speed.convert(36, "km/h", "m/s") == Converters.Speed.convert(36, "km/h", "m/s")
+    assert "ft/wk" in speed.units
+
+
+def test_snapshot_restores_the_registry_indexes(tmp_path):
+    path = str(tmp_path / "units.snapshot")
+    snapshot.build(path)
+    converters = dict(Converters.registry.converters)
+    registry = snapshot.load(path).registry(Converters.units_resolver, converters)
+    assert registry._state() == Converters.registry._state()
+    assert registry.convert(1, "acre", "ft^2") == Converters.registry.convert(1, "acre", "ft^2")
+    assert registry.converter_for("mph") is Converters.Speed
+    assert snapshot.load(path).registry(Converters.units_resolver, {"Length": Converters.Length}) is None
+
+
+def test_missing_or_stale_snapshot_is_empty(tmp_path, monkeypatch):
+    path = str(tmp_path / "units.snapshot")
+    assert snapshot.load(path).converter("Length") is None
+    snapshot.build(path)
+    monkeypatch.setattr(snapshot, "_source_stamps", lambda: (("Converters.py", 0, 0),))
+    assert snapshot.load(path).converter("Length") is None
+
+
+def test_stamps_cover_the_normalization_code():
+    names = [name for name, _, _ in snapshot._source_stamps()]
+    assert {"Converters.py", "compound.py", "base_class.py", "tables.py", "registry.py"} <= set(names)
+
+
+def test_stamps_follow_content_not_modification_times(tmp_path, monkeypatch):
+    source = tmp_path / "Converters.py"
+    source.write_text("A = 1\n")
+    monkeypatch.setattr(snapshot, "_HERE", str(tmp_path))
+    monkeypatch.setattr(snapshot, "_SOURCES", ("Converters.py",))
+    stamps = snapshot._source_stamps()
+    os.utime(str(source), (0, 0))
+    assert snapshot._source_stamps() == stamps
+    source.write_text("A = 2\n")
+    os.utime(str(source), (0, 0))
+    assert snapshot._source_stamps() != stamps
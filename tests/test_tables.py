@@ -0,0 +1,64 @@
+import json
+import pytest
+from base_class import Converter
+from Converters import units_resolver, Length
+from registry import UnitRegistry
+
+
+def _write(path, data):
+    path.write_text(json.dumps(data) if isinstance(data, dict) else data, encoding="utf-8")
+    return str(path)
+
+
+def test_from_file_reads_units_and_aliases(tmp_path):
+    path = _write(tmp_path / "length.json", {"units": {"m": [1, 0], "km": [0.001, 0]}, "aliases": {"meter": "m"}})
+    converter = Converter.from_file(path)
+    assert converter.convert(2, "km", "meter") == 2000
+
+
+def test_invalid_tables_are_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        Converter.from_file(_write(tmp_path / "dup.json", '{"m": 1, "m": 2}'))
+    with pytest.raises(ValueError):
+        Converter.from_file(_write(tmp_path / "alias.json", {"units": {"m": 1}, "aliases": {"m": "m"}}))
+    with pytest.raises(ValueError, match="a, b"):
+        Converter.from_file(_write(tmp_path / "values.json", {"a": "x", "b": [1, 2, 3], "c": 1}))
+
+
+def test_merge_conflicts_and_plan_invalidation():
+    converter = Converter({"m": (1, 0), "ft": (3.28, 0)})
+    assert converter.plan("m", "ft").scale == 3.28
+    with pytest.raises(ValueError):
+        converter.merge({"ft": (3.2808, 0)})
+    assert converter.merge({"ft": (3.2808, 0), "yd": (1.0936, 0)}, replace=True) == ["yd", "ft"]
+    assert converter.plan("m", "ft").scale == 3.2808
+
+
+def test_registry_load_merges_and_registers(tmp_path):
+    registry = UnitRegistry(units_resolver)
+    registry.register("Length", Converter(dict(Length.units)), base="m")
+    path = _write(tmp_path / "site.json", {
+        "Length": {"units": {"league-site": [0.0002, 0]}, "aliases": {"lgs": "league-site"}},
+        "Density": {"base": "kg/m^3", "units": {"kg/m³": [1, 0], "g/cm³": [0.001, 0]}},
+    })
+    assert registry.load(path) == {"Length": ["league-site", "lgs"], "Density": ["kg/m³", "g/cm³"]}
+    assert registry.convert(1, "lgs", "km") == pytest.approx(5)
+    assert registry.convert(1, "g/cm³", "g/cm^3") == pytest.approx(1)
+
+
+def test_registry_load_replacing_a_resolver_table_refreshes_compound_units(tmp_path):
+    from compound import CompoundConverter, CompoundResolver
+
+    length = Converter({"m": (1, 0), "ft": (1 / 0.3048, 0)})
+    resolver = CompoundResolver({"L": length, "T": Converter({"s": (1, 0), "min": (1 / 60, 0)})})
+    speed = CompoundConverter(resolver, ["m/s", "ft/s"])
+    registry = UnitRegistry(resolver)
+    registry.register("Length", length, base="m")
+    registry.register("Speed", speed, base="m/s")
+    assert registry.convert(1, "ft/s", "m/s") == 0.3048
+    path = _write(tmp_path / "feet.json", {"Length": {"units": {"ft": [1.0, 0]}}})
+    assert registry.load(path, replace=True) == {"Length": ["ft"]}
+    assert registry.convert(1, "ft", "m") == 1
+    assert registry.convert(1, "ft/s", "m/s") == 1
+    assert registry.convert(60, "ft/min", "m/s") == 1
+    assert speed.convert(1, "ft/s", "m/s") == 1
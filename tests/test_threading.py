@@ -0,0 +1,41 @@
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+
+
+def test_concurrent_conversions_are_consistent(converter):
+    def work(value):
+        return converter.convert(value, "°C", "°F"), converter.plan("K", "°C")(value)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(work, range(2000)))
+    assert results == [(work(value)) for value in range(2000)]
+
+
+def test_convert_threaded_sequences(converter):
+    values = list(range(1000))
+    assert converter.convert_threaded(values, "m", "cm", chunk_size=64) == [v * 100.0 for v in values]
+    result = converter.convert_threaded(array("d", [0, 100]), "°C", "°F", chunk_size=1)
+    assert isinstance(result, array) and list(result) == pytest.approx([32, 212])
+
+
+def test_convert_threaded_numpy(converter):
+    np = pytest.importorskip("numpy")
+    values = np.arange(10000, dtype=np.int64).reshape(100, 100)
+    result = converter.convert_threaded(values, "°C", "K", chunk_size=1000)
+    assert result.shape == values.shape
+    assert np.allclose(result, values + 273.15)
+    assert np.allclose(converter.convert(values, "°C", "K"), result)
+
+
+def test_inplace_conversion_rejects_integer_arrays(converter):
+    np = pytest.importorskip("numpy")
+    values = np.array([1500, 2500])
+    with pytest.raises(TypeError):
+        converter.convert(values, "m", "km", inplace=True)
+    with pytest.raises(TypeError):
+        converter.convert(values, "m", "km", inplace=True, dtype="float32")
+    assert values.tolist() == [1500, 2500]
+    floats = np.array([1500.0, 2500.0])
+    assert converter.convert(floats, "m", "km", inplace=True) is floats
+    assert floats.tolist() == [1.5, 2.5]
@@ -0,0 +1,47 @@
+from array import array
+import pytest
+import wire
+from Converters import Length, Temperature, registry
+
+
+def test_round_trip_converts_without_copying_payload():
+    values = array("d", [1500.0, 3.0])
+    frame = wire.decode(wire.encode("Length", wire.unit_id(Length, "m"), wire.unit_id(Length, "km"), values))
+    assert frame.converter == "Length" and len(frame) == 2 and frame.values.tolist() == [1500.0, 3.0]
+    assert list(Length.convert_frame(frame)) == pytest.approx([1.5, 0.003])
+
+
+def test_header_and_float32_delta_payload():
+    header = wire.encode_header("Temperature", wire.unit_id(Temperature, "ºC"),
+                                wire.unit_id(Temperature, "°F"), 1, delta=True, dtype="float32")
+    assert len(header) % 8 == 0
+    frame = wire.decode(header + array("f", [10.0]).tobytes())
+    assert frame.delta and frame.dtype == "float32"
+    assert list(wire.dispatch(frame, registry.converters)) == pytest.approx([18])
+
+
+def test_invalid_frames_raise():
+    data = wire.encode("Length", 0, 1, [1.0])
+    with pytest.raises(ValueError):
+        wire.decode(data[:-1])
+    with pytest.raises(ValueError):
+        wire.decode(b"XXXX" + bytes(data[4:]))
+    with pytest.raises(ValueError):
+        Length.convert_frame(wire.decode(wire.encode("Length", 0, 60000, [1.0])))
+
+
+def test_unit_ids_come_from_the_explicit_table():
+    from base_class import Converter
+    from Converters import Speed
+
+    assert len(set(wire.UNIT_NAMES)) == len(wire.UNIT_NAMES)
+    reordered = Converter(dict(reversed(list(Length.units.items()))))
+    assert wire.unit_id(reordered, "km") == wire.unit_id(Length, "km") == wire.UNIT_NAMES.index("km")
+    frame = wire.decode(wire.encode("Length", wire.unit_id(Length, "m"), wire.unit_id(Length, "km"), [1500.0]))
+    assert frame.units(reordered) == ("m", "km")
+    assert list(Speed.convert_frame(wire.decode(wire.encode(
+        "Speed", wire.unit_id(Speed, "km/h"), wire.unit_id(Speed, "m/s"), [36.0])))) == pytest.approx([10])
+    with pytest.raises(ValueError):
+        wire.unit_id(Speed, "ft/wk")
+    with pytest.raises(ValueError):
+        frame.units(Temperature)
@@ -0,0 +1,327 @@
+"""
+Binary Wire Format Module
+
+This module defines a compact binary framing for batches of conversion requests, so
+large batches can move between processes without encoding every float as text.
+
+A frame is a fixed little-endian header, the UTF-8 name of the converter, padding to
+an 8-byte boundary, then the packed little-endian float64 or float32 values:
+
+    offset  size  field
+    0       4     magic b"UCF1"
+    4       1     version
+    5       1     flags (bit 0: delta, bit 1: float32 payload)
+    6       2     length of the converter name in bytes
+    8       2     origin unit id
+    10      2     final unit id
+    12      4     number of values
+    16      n     converter name, padded with zeros to a multiple of 8 bytes
+    ...           payload
+
+Unit ids come from an explicit table (`UNIT_NAMES`), not from the order of the units in
+a converter, so both ends agree on them whatever tables they load. The table is
+append-only: ids are never reused or reassigned, and units outside it cannot be framed.
+Version 1 frames, whose ids were positions in the converter's table, are rejected.
+
+Decoding never copies the payload: `Frame.values` is a memoryview over the received
+buffer. Encoding copies the values once, or not at all when the header and the values
+are written separately (see `encode_header`).
+
+Example Usage:
+    >>> import wire
+    >>> from Converters import Length
+    >>> data = wire.encode("Length", wire.unit_id(Length, "m"), wire.unit_id(Length, "km"), [1500.0])
+    >>> Length.convert_frame(wire.decode(data)).tolist()
+    [1.5]
+"""
+
+import struct
+import sys
+from array import array
+
+MAGIC = b"UCF1"
+VERSION = 2
+
+FLAG_DELTA = 0x01
+FLAG_FLOAT32 = 0x02
+
+_HEADER = struct.Struct("<4sBBHHHI")
+
+# memoryview/array type code and item size of each payload type
+_FORMATS = {"float64": ("d", 8), "float32": ("f", 4)}
+
+
+# Unit names indexed by their wire id. Append new units at the end; never reorder, remove
+# or rename an entry, since it would change the meaning of frames already encoded.
+UNIT_NAMES = (
+    # Temperature
+    "ºC", "C", "Celsius", "°F", "F", "Fahrenheit", "ºR", "Rankine", "K", "Kelvin", "daK", "hK",
+    "kK", "MK", "GK", "TK", "PK", "EK", "ZK", "YK", "RK", "QK", "dK", "cK", "mK", "µK", "nK", "pK",
+    "fK", "aK", "zK", "yK", "rK", "qK", "ºD", "Delisle", "ºRe", "Reaumur", "ºN", "Newton", "ºRø",
+    "Rømer", "ºDu", "DuCrest", "ºLi", "Linnaeus", "ºF(96)", "Fahrenheit-96", "ºW", "ºL", "GM",
+    "T_P",
+    # Length
+    "m", "metre", "dam", "hm", "km", "Mm", "Gm", "Tm", "Pm", "Em", "Zm", "Ym", "Rm", "Qm", "dm",
+    "cm", "mm", "µm", "nm", "pm", "fm", "am", "zm", "ym", "rm", "qm", "in", "inch", "ft", "foot",
+    "yd", "yard", "mi", "mile", "mil", "barleycorn", "line", "fath", "fathom-en", "fur", "furlong",
+    "ch", "rd", "pole", "perch", "lea-en", "hh", "hand", "span", "quarter", "pace-en", "rope",
+    "bolt-us", "ell-en", "finger", "nail", "caliber", "button", "nmi", "cbl", "shackle", "ft-us",
+    "li-gunter", "li-ramden", "ch-ramden", "ch-rathbone", "yd-mega", "au", "ly", "light-ns", "pc",
+    "kpc", "Mpc", "Gpc", "Tpc", "Ppc", "Epc", "Zpc", "Ypc", "siriometer", "D_H", "Å", "micron",
+    "fermi", "a_0", "l_P", "xu", "S", "pt", "pica", "px", "twip", "agate", "cicero", "didot-pt",
+    "pcl-pt", "ligne", "cubit-egy", "pes-rom", "passus-rom", "mi-rom", "stadion-gr", "beru-bab",
+    "kus-sumer", "su-si", "tefach", "zeret", "amah", "point-fr", "ligne-fr", "pouce-fr", "pied-fr",
+    "toise-fr", "perche-fr-arpent", "perche-fr-roi", "perche-fr-ord", "arpent-fr-arpent",
+    "arpent-fr-roi", "lieue-fr-ancienne", "lieue-fr", "lieue-fr-postes", "lieue-fr-degre",
+    "lieue-fr-tarif", "ponto-es", "línea-es", "pulgada-es", "pie-es", "codo-es", "codo-real-es",
+    "vara-es", "paso-es", "braza-es", "estadal-es", "milla-es", "legua-es", "ponto-pt", "linha-pt",
+    "polegada-pt", "palmo-pt", "pé-pt", "côvado-pt", "vara-pt", "passo-pt", "toesa-pt", "braça-pt",
+    "légua-pt-20", "légua-pt-18", "milha-pt", "linea-it-genoa", "oncia-it-rome", "pollice-it-genoa",
+    "palmo-it-rome-arch", "palmo-it-sicily", "palmo-it-rome-merc", "palmo-it-naples",
+    "piede-it-rome", "piede-it", "piede-it-venice", "piede-it-bologna", "piede-it-milan",
+    "piede-it-liprando", "braccio-fl", "braccio-it-milan", "braccio-it-rome-tele",
+    "braccio-it-bologna", "braccio-it-rome-merc", "braccio-it-venice", "canna-it-rome-merc",
+    "canna-it-sicily", "canna-it-rome-arch", "canna-it-naples", "miglio-it-sicily",
+    "miglio-it-rome", "miglio-it-venice", "miglio-it-milan", "linie-de", "zoll-de-pruss",
+    "fuss-pruss", "fuss-de-rhine", "elle-pruss", "klafter-de", "rute-pruss", "wegstunde-de",
+    "meile-de-bavaria", "meile-de-geo", "meile-de", "meile-de-pruss", "verst", "arshin", "mi-scot",
+    "ell-scot", "mil-scan", "alen-dk", "aln-se", "tum-se", "li-cn", "zhang-cn", "chi-cn", "cun-cn",
+    "fen-cn", "sun-jp", "shaku-jp", "ken-jp", "ri-jp", "gaz", "kos", "angula", "farsakh", "arash",
+    "hank-cotton", "skein-wool", "spyndle", "U",
+    # Weight
+    "kg", "kilogram", "kilo", "g", "gram", "tonne", "ton", "dag", "hg", "Mg", "Gg", "Tg", "Pg",
+    "Eg", "Zg", "Yg", "Rg", "Qg", "dg", "cg", "mg", "ug", "mcg", "ng", "pg", "fg", "ag", "zg", "yg",
+    "rg", "qg", "lb", "pound", "oz", "ounce", "dr", "gr", "st", "cwt", "lwt", "uston", "ukton",
+    "slug", "lbt", "ozt", "dwt", "ozap", "drap", "sgr", "livre-fr", "marc-fr", "once-fr", "gros-fr",
+    "grain-fr", "libra-es", "onza-es", "grano-es", "arroba-es", "quintal-es", "arratel-pt",
+    "libra-pt", "onca-pt", "grao-pt", "arroba-pt", "quintal-pt", "pfund-de", "unze-de", "loth-de",
+    "zentner-de", "funt-ru", "zolotnik-ru", "dolia-ru", "pood", "tael", "catti", "picul",
+    "momme-jp", "tola-in", "seer-in", "libra-rom", "uncia-rom", "drachma-rom", "mina-gr",
+    "drachma-gr", "obol-gr", "shekel-heb", "beka-heb", "gerah-heb", "talent-heb", "ct", "Da",
+    "gamma", "m_p", "M_earth", "M_jup", "M_solar", "M_sun",
+    # Volume
+    "L", "liter", "cc", "lambda", "daL", "hL", "kL", "ML", "GL", "TL", "PL", "EL", "ZL", "YL", "RL",
+    "QL", "dL", "cL", "mL", "µL", "nL", "pL", "fL", "aL", "zL", "yL", "rL", "qL", "m³", "stere",
+    "dam³", "hm³", "km³", "Mm³", "Gm³", "Tm³", "Pm³", "Em³", "Zm³", "Ym³", "Rm³", "Qm³", "dm³",
+    "cm³", "mm³", "µm³", "nm³", "pm³", "fm³", "am³", "zm³", "ym³", "rm³", "qm³", "gal", "qt", "cup",
+    "cup-us", "fl_oz", "tbsp", "tsp", "gill-us", "fldr", "flsc-us", "min", "bbl-fl", "bbl-oil",
+    "rundlet", "tierce", "gal-uk", "qt-uk", "pt-uk", "cup-uk", "fl_oz-uk", "tbsp-uk", "tsp-uk",
+    "gill-uk", "noggin-uk", "pottle-uk", "fldr-uk", "flsc-uk", "firkin", "kilderkin-uk",
+    "gal-us-dry", "qt-us-dry", "pt-us-dry", "pk-us", "bu-us", "in³", "ft³", "yd³", "mi³", "af",
+    "tsp-met", "tbsp-met", "cup-met", "cup-aus", "tbsp-aus", "cup-jp", "board-foot", "cord",
+    "register-ton", "hogshead", "tun", "butt", "celemín-es", "fanega-es-dry", "cántara-es",
+    "arroba-es-liq", "almud-es", "quartilho-pt", "canada-pt", "pote-pt", "almude-pt", "pipa-pt",
+    "tonel-pt", "roquille-fr", "poisson-fr", "demiard-fr", "chopine-fr", "pinte-fr", "velte-fr",
+    "quartaut-fr", "feuillette-fr", "muid-fr-liq", "litron-fr-dry", "boisseau-fr-dry",
+    "minot-fr-dry", "setier-fr-dry", "muid-fr-dry", "ahm-de", "ohm-de", "anker-de", "eimer-de",
+    "anker-nl", "stoop-nl", "mutsje-nl", "kanna-se", "pot-dk", "garnets-ru", "vedro-ru",
+    "chetvert-ru-dry", "bochka-ru", "go-jp", "sho-jp", "to-jp", "koku-liq-jp", "koku-dry-jp",
+    "sheng-cn", "dou-cn", "pao-in", "hemina-rom", "sextarius-rom", "congius-rom", "modius-rom",
+    "urna-rom", "amphora-rom", "log-heb", "kab-heb", "hin-heb", "omer-heb", "seah-heb", "bath-heb",
+    "ephah-heb", "homer-heb", "kor-heb", "qa-bab", "hekat-egy", "hin-egy", "V_P",
+    # Area
+    "m²", "sq m", "dam²", "hm²", "km²", "Mm²", "Gm²", "Tm²", "Pm²", "Em²", "Zm²", "Ym²", "Rm²",
+    "Qm²", "dm²", "cm²", "mm²", "µm²", "nm²", "pm²", "fm²", "am²", "zm²", "ym²", "rm²", "qm²", "a",
+    "ha", "decare", "in²", "ft²", "yd²", "rd²", "perch²", "rood", "acre", "mi²", "sq in", "sq ft",
+    "sq yd", "sq mi", "acre-us", "ft²-us", "rd²-us", "section", "township", "perche²-fr-roi",
+    "arpent-fr-ord", "perche²-fr-ord", "journal-fr", "fanega-es", "cuerda-pr", "caballería-es",
+    "caballería-cu", "alqueire-pt-br", "alqueire-pt-mg", "morgen-pruss", "morgen-nl", "hufe-de",
+    "braccio²-fl", "giornata-it", "desyatina-ru", "sotka-ru", "tunnland-se", "tønde-land-dk",
+    "acre-ie", "tsubo-jp", "tan-jp", "se-jp", "chō-jp", "mǔ-cn", "lí-cn", "qǐng-cn",
+    "bigha-in-bengal", "bigha-in-pucca", "katha-in-bengal", "gunta-in", "ankanam-in", "ground-in",
+    "rai-th", "ngaan-th", "wa²-th", "dunam-ot", "dunam-met", "feddan-egy", "jugerum-rom",
+    "heredium-rom", "centuria-rom", "plethron-gr", "barn", "shed", "outbuilding", "circular-in",
+    "circular-mil",
+    # Time
+    "s", "sec", "ms", "µs", "ns", "h", "hr", "d", "day", "wk", "week", "year", "yr",
+    # Speed
+    "m/s", "mps", "kph", "mph", "fps", "fpm", "ips", "knots", "knot", "kn", "c", "mach", "Tm/s",
+    "Tm/min", "Tm/h", "Tm/d", "Gm/s", "Gm/min", "Gm/h", "Gm/d", "Mm/s", "Mm/min", "Mm/h", "Mm/d",
+    "km/s", "km/min", "km/h", "km/d", "hm/s", "hm/min", "hm/h", "hm/d", "dam/s", "dam/min", "dam/h",
+    "dam/d", "m/min", "m/h", "m/d", "dm/s", "dm/min", "dm/h", "dm/d", "cm/s", "cm/min", "cm/h",
+    "cm/d", "mm/s", "mm/min", "mm/h", "mm/d", "um/s", "um/min", "um/h", "um/d", "μm/s", "μm/min",
+    "μm/h", "μm/d", "nm/s", "nm/min", "nm/h", "nm/d", "pm/s", "pm/min", "pm/h", "pm/d", "mi/s",
+    "mi/min", "mi/h", "mi/d", "fur/s", "fur/min", "fur/h", "fur/d", "yd/s", "yd/min", "yd/h",
+    "yd/d", "ft/s", "ft/min", "ft/h", "ft/d", "in/s", "in/min", "in/h", "in/d", "nmi/s", "nmi/min",
+    "nmi/h", "nmi/d", "AU/s", "AU/min", "AU/h", "AU/d", "ly/s", "ly/min", "ly/h", "ly/d", "pc/s",
+    "pc/min", "pc/h", "pc/d", "AU/year", "ly/year", "pc/year",
+)
+
+# Unit name -> wire id, built once
+_UNIT_IDS = {name: index for index, name in enumerate(UNIT_NAMES)}
+
+
+class Frame:
+    """
+    A decoded conversion request.
+
+    Attributes:
+        converter (str): Name of the converter the unit ids refer to
+        origin_id (int): Id of the source unit
+        final_id (int): Id of the target unit
+        delta (bool): Whether this is a delta/interval conversion
+        dtype (str): "float64" or "float32"
+        values (memoryview): The values, viewed in place in the decoded buffer
+    """
+
+    __slots__ = ("converter", "origin_id", "final_id", "delta", "dtype", "values")
+
+    def __init__(self, converter, origin_id, final_id, delta, dtype, values):
+        self.converter = converter
+        self.origin_id = origin_id
+        self.final_id = final_id
+        self.delta = delta
+        self.dtype = dtype
+        self.values = values
+
+    def units(self, converter):
+        """
+        Return the (origin_unit, final_unit) names of the frame for a converter.
+
+        Raises:
+            ValueError: If an id is not in the id table or its unit is not in the converter
+        """
+        try:
+            origin_unit, final_unit = UNIT_NAMES[self.origin_id], UNIT_NAMES[self.final_id]
+        except IndexError:
+            origin_unit = final_unit = None
+        if origin_unit not in converter.units or final_unit not in converter.units:
+            raise ValueError(f"Invalid unit ids for '{self.converter}': {self.origin_id}, {self.final_id}")
+        return origin_unit, final_unit
+
+    def __len__(self):
+        return len(self.values)
+
+
+def unit_id(converter, unit):
+    """
+    Return the wire id of a unit of a converter.
+
+    Raises:
+        ValueError: If the unit is not in the converter or has no wire id (such as a
+            compound expression resolved on demand)
+    """
+    if unit not in converter.units:
+        raise ValueError(f"Invalid unit: {unit}")
+    try:
+        return _UNIT_IDS[unit]
+    except KeyError:
+        raise ValueError(f"Unit has no wire id: {unit}")
+
+
+def encode_header(converter, origin_id, final_id, count, delta=False, dtype="float64"):
+    """
+    Return the header of a frame (name and padding included) for `count` values.
+
+    Writing the header and then the buffer of the values (e.g. with `socket.sendmsg`)
+    sends a frame without copying the values.
+
+    Raises:
+        ValueError: If the dtype is unknown or a field doesn't fit in the header
+    """
+    if dtype not in _FORMATS:
+        raise ValueError(f"Unsupported dtype: {dtype}")
+    name = converter.encode("utf-8")
+    flags = (FLAG_DELTA if delta else 0) | (FLAG_FLOAT32 if dtype == "float32" else 0)
+    try:
+        header = _HEADER.pack(MAGIC, VERSION, flags, len(name), origin_id, final_id, count)
+    except struct.error as error:
+        raise ValueError(f"Frame field out of range: {error}")
+    return header + name + b"\0" * (-len(name) % 8)
+
+
+def encode(converter, origin_id, final_id, values, delta=False, dtype="float64"):
+    """
+    Encode a conversion request into a frame.
+
+    Args:
+        converter: Name of the converter the unit ids refer to
+        origin_id: Id of the source unit
+        final_id: Id of the target unit
+        values: The numbers to convert. Buffers already holding the payload type (an
+            `array`, a NumPy array or a memoryview of "d" or "f" items) are copied as
+            raw bytes; other iterables are packed first.
+        delta: Flag indicating whether this is a delta/interval conversion
+        dtype: "float64" or "float32"
+
+    Returns:
+        bytearray: The frame
+    """
+    payload = _payload(values, dtype)
+    header = encode_header(converter, origin_id, final_id, len(payload), delta, dtype)
+    frame = bytearray(len(header) + payload.nbytes)
+    frame[:len(header)] = header
+    frame[len(header):] = payload.cast("B")
+    return frame
+
+
+def decode(buffer):
+    """
+    Decode a frame without copying its payload.
+
+    Args:
+        buffer: Any object supporting the buffer protocol (bytes, bytearray, mmap...)
+
+    Returns:
+        Frame: The request, whose `values` is a view into `buffer`
+
+    Raises:
+        ValueError: If the buffer is not a valid frame
+    """
+    view = memoryview(buffer).cast("B")
+    if len(view) < _HEADER.size:
+        raise ValueError("Truncated frame header")
+    magic, version, flags, name_length, origin_id, final_id, count = _HEADER.unpack_from(view)
+    if magic != MAGIC:
+        raise ValueError("Not a conversion frame")
+    if version != VERSION:
+        raise ValueError(f"Unsupported frame version: {version}")
+    dtype = "float32" if flags & FLAG_FLOAT32 else "float64"
+    typecode, itemsize = _FORMATS[dtype]
+    start = _HEADER.size + name_length + (-name_length % 8)
+    end = start + count * itemsize
+    if len(view) < end:
+        raise ValueError("Truncated frame payload")
+    name = bytes(view[_HEADER.size:_HEADER.size + name_length]).decode("utf-8")
+    values = view[start:end].cast(typecode)
+    if sys.byteorder != "little":
+        # The payload is little-endian: big-endian hosts pay for one swapped copy
+        values = array(typecode, values)
+        values.byteswap()
+        values = memoryview(values)
+    return Frame(name, origin_id, final_id, bool(flags & FLAG_DELTA), dtype, values)
+
+
+def dispatch(frame, converters):
+    """
+    Convert a frame with the converter it names.
+
+    Args:
+        frame: A decoded Frame
+        converters: A mapping of converter names to converters (e.g. `registry.converters`)
+
+    Raises:
+        ValueError: If the converter is unknown or the unit ids are invalid
+    """
+    try:
+        converter = converters[frame.converter]
+    except KeyError:
+        raise ValueError(f"Unknown converter: {frame.converter}")
+    return converter.convert_frame(frame)
+
+
+def _payload(values, dtype):
+    """
+    Return a memoryview of the values as little-endian items of the payload type.
+    """
+    typecode = _FORMATS[dtype][0]
+    try:
+        view = memoryview(values)
+    except TypeError:
+        view = None
+    if view is not None and view.format == typecode and view.c_contiguous and sys.byteorder == "little":
+        return view.cast("B").cast(typecode)
+    packed = array(typecode, values)
+    if sys.byteorder != "little":
+        packed.byteswap()
+    return memoryview(packed)